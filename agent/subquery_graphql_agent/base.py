@@ -230,8 +230,14 @@ class ProjectConfig:
 class GraphQLAgent:
     """GraphQL agent for a specific SubQuery project."""
 
-    def __init__(self, config: ProjectConfig):
-        """Initialize the agent with project configuration."""
+    def __init__(self, config: ProjectConfig, llm: Optional[ChatOpenAI] = None):
+        """Initialize the agent with project configuration.
+
+        Args:
+            config: The project configuration
+            llm: Shared client to run the agent on (e.g. behind the process's rate limiter),
+                by default a new ChatOpenAI on LLM_MODEL
+        """
         self.config = config
 
         # Check for API key
@@ -239,15 +245,18 @@ class GraphQLAgent:
             raise ValueError("OPENAI_API_KEY environment variable is required")
 
         # Initialize LLM
-        model_name = os.getenv("LLM_MODEL", "google/gemini-3-flash-preview")
-        logger.info(f"Initializing GraphQLAgent with model: {model_name}")
-        self.llm = ChatOpenAI(
-            model=model_name,
-            temperature=0,
-            timeout=300,
-            max_retries=3,
-            # extra_body={"thinking": {"type": "disabled"}},
-        )
+        if llm is not None:
+            self.llm = llm
+        else:
+            model_name = os.getenv("LLM_MODEL", "google/gemini-3-flash-preview")
+            logger.info(f"Initializing GraphQLAgent with model: {model_name}")
+            self.llm = ChatOpenAI(
+                model=model_name,
+                temperature=0,
+                timeout=300,
+                max_retries=3,
+                # extra_body={"thinking": {"type": "disabled"}},
+            )
 
         toolkit = create_graphql_toolkit(
             config.endpoint,
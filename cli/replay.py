@@ -64,7 +64,7 @@ async def main():
             synapse.response = miner_answer
             synapse.elapsed_time =  t.final_time
 
-            zip_scores, _, _ = await scorer_manager.compute_challenge_score(
+            zip_scores, *_ = await scorer_manager.compute_challenge_score(
                 ground_truth, 
                 ground_truth_cost, 
                 [synapse],
@@ -22,16 +22,25 @@ from langchain_core.messages import (
     AnyMessage,
 )
 
-from langgraph.graph import StateGraph, START, END
+from langgraph.graph import MessagesState, StateGraph, START, END
 from agent.stats import ToolCountHandler
 from agent.subquery_graphql_agent.base import GraphQLAgent
 from agent.subquery_graphql_agent.node_types import GraphqlProvider
 from common.project_manager import ProjectManager
 from common.prompt_template import get_block_rule_prompt
-from common.protocol import ExtendedMessagesState
 import common.utils as utils
 
 
+class ExtendedMessagesState(MessagesState):
+    error: str | None = None
+    graphql_agent_hit: bool
+    intermediate_graphql_agent_input_token_usage: int
+    intermediate_graphql_agent_input_cache_read_token_usage: int
+    intermediate_graphql_agent_output_token_usage: int
+    block_height: int
+    tool_calls: list[str]
+
+
 class AgentManager:
     project_manager: ProjectManager
     graphql_agent: dict[str, GraphQLAgent]
@@ -49,12 +58,21 @@ class AgentManager:
     miner_agent: dict[str, any]
     save_project_dir: str
     llm_synthetic: ChatOpenAI
-
-    def __init__(self, save_project_dir: str, llm_synthetic: ChatOpenAI, ipc_common_config: dict = None):
+    llm_graphql_agent: ChatOpenAI | None
+
+    def __init__(
+        self,
+        save_project_dir: str,
+        llm_synthetic: ChatOpenAI,
+        ipc_common_config: dict = None,
+        llm_graphql_agent: ChatOpenAI | None = None,
+    ):
         self.save_project_dir = save_project_dir
         self.graphql_agent = {}
         self.miner_agent = {}
         self.llm_synthetic = llm_synthetic
+        # Shared by every GraphQLAgent, None gives each agent its own ChatOpenAI
+        self.llm_graphql_agent = llm_graphql_agent
         self.project_manager = ProjectManager(self.llm_synthetic, self.save_project_dir)
         self.ipc_common_config = ipc_common_config
 
@@ -91,7 +109,7 @@ class AgentManager:
 
             if enabled and cid_hash not in self.graphql_agent:
                 new_agents.append(cid_hash)
-                self.graphql_agent[cid_hash] = GraphQLAgent(p.to_project_config())
+                self.graphql_agent[cid_hash] = GraphQLAgent(p.to_project_config(), llm=self.llm_graphql_agent)
         
         if new_agents:
             logger.info(f"[AgentManager] Created graphql_agents for projects: {new_agents}")
@@ -143,7 +161,7 @@ class AgentManager:
             
             if (not project) or (created or updated or deleted):
 
-                graphql_agent = GraphQLAgent(p.to_project_config())
+                graphql_agent = GraphQLAgent(p.to_project_config(), llm=self.llm_graphql_agent)
 
                 def graphql_agent_tool():
                     """
@@ -0,0 +1,141 @@
+import asyncio
+import time
+import aiohttp
+from loguru import logger
+
+import common.utils as utils
+
+
+class BlockHeightService:
+    """
+    Latest block height lookups with a TTL cache, single-flight coalescing and
+    a pooled HTTP session.
+
+    Concurrent lookups for the same endpoint share one `_metadata` request.
+    When `shared` (an mp.Manager dict) is given, a background task exchanges
+    heights with it every ttl so the API and challenge processes reuse each
+    other's results; lookups themselves only read the process-local cache and
+    never wait on the Manager. Endpoints looked up recently are kept warm by
+    the background refresh.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 3.0,
+        shared: dict | None = None,
+        refresh_interval: float | None = None,
+        idle_timeout: float = 60.0,
+    ):
+        self.ttl = ttl  # seconds
+        self.shared = shared
+        self.refresh_interval = refresh_interval  # seconds, None disables background refresh
+        self.idle_timeout = idle_timeout  # stop refreshing endpoints not asked for in this many seconds
+        self._cache: dict[str, tuple[int, float]] = {}  # endpoint -> (height, fetched_at)
+        self._unpublished: dict[str, tuple[int, float]] = {}  # fetched here, not yet in `shared`
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._last_used: dict[str, tuple[str, float]] = {}  # endpoint -> (node_type, last requested)
+        self._session: aiohttp.ClientSession | None = None
+        self._refresh_task: asyncio.Task | None = None
+
+    def _cached(self, endpoint: str, max_age: float) -> int | None:
+        entry = self._cache.get(endpoint)
+        if entry is not None and time.time() - entry[1] <= max_age:
+            return entry[0]
+        return None
+
+    async def get(self, endpoint: str, node_type: str, max_age: float | None = None) -> int | None:
+        """Latest block height of `endpoint`, at most `max_age` (default ttl) seconds old."""
+        if not endpoint:
+            return None
+
+        self._last_used[endpoint] = (node_type, time.time())
+        self._ensure_background()
+
+        height = self._cached(endpoint, self.ttl if max_age is None else max_age)
+        if height is not None:
+            return height
+        return await self._fetch(endpoint, node_type)
+
+    def last_known(self, endpoint: str) -> int | None:
+        """Most recent height seen for `endpoint` regardless of age."""
+        return self._cached(endpoint, float("inf"))
+
+    async def _fetch(self, endpoint: str, node_type: str) -> int | None:
+        task = self._inflight.get(endpoint)
+        if task is None:
+            task = asyncio.create_task(self._do_fetch(endpoint, node_type))
+            self._inflight[endpoint] = task
+            task.add_done_callback(lambda _: self._inflight.pop(endpoint, None))
+        return await asyncio.shield(task)
+
+    async def _do_fetch(self, endpoint: str, node_type: str) -> int | None:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(keepalive_timeout=60))
+
+        height = await utils.get_latest_block(endpoint, node_type, session=self._session)
+        if height is not None:
+            entry = (height, time.time())
+            self._cache[endpoint] = entry
+            if self.shared is not None:
+                self._unpublished[endpoint] = entry
+        return height
+
+    def _ensure_background(self):
+        if self.refresh_interval is None and self.shared is None:
+            return
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+        self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    def _exchange(self, publish: dict[str, tuple[int, float]]) -> dict[str, tuple[int, float]]:
+        """Blocking Manager round trips, run in a thread: publish our newer heights, return the shared ones."""
+        snapshot = dict(self.shared.copy())
+        newer = {endpoint: entry for endpoint, entry in publish.items() if endpoint not in snapshot or snapshot[endpoint][1] < entry[1]}
+        if newer:
+            self.shared.update(newer)
+            snapshot.update(newer)
+        return snapshot
+
+    async def _sync_shared(self):
+        publish, self._unpublished = self._unpublished, {}
+        try:
+            snapshot = await asyncio.to_thread(self._exchange, publish)
+        except Exception as e:
+            logger.warning(f"[BlockHeightService] Failed to sync block heights with other processes: {e}")
+            # Try again next time, unless a newer height was fetched meanwhile
+            for endpoint, entry in publish.items():
+                self._unpublished.setdefault(endpoint, entry)
+            return
+        for endpoint, entry in snapshot.items():
+            local = self._cache.get(endpoint)
+            if local is None or entry[1] > local[1]:
+                self._cache[endpoint] = tuple(entry)
+
+    async def _refresh_loop(self):
+        interval = self.refresh_interval if self.refresh_interval is not None else self.ttl
+        while True:
+            await asyncio.sleep(interval)
+            if self.shared is not None:
+                await self._sync_shared()
+            if self.refresh_interval is None:
+                continue
+
+            now = time.time()
+            for endpoint, (node_type, last_used) in list(self._last_used.items()):
+                if now - last_used > self.idle_timeout:
+                    self._last_used.pop(endpoint, None)
+                    continue
+                # Another process may have refreshed it already
+                if self._cached(endpoint, self.refresh_interval) is None:
+                    try:
+                        await self._fetch(endpoint, node_type)
+                    except Exception as e:
+                        logger.warning(f"[BlockHeightService] Background refresh failed for {endpoint}: {e}")
+
+    async def close(self):
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
@@ -36,6 +36,7 @@ class ErrorCode(Enum):
     ORGANIC_ERROR_RESPONSE = 3005
     PROCESS_ERROR = 3006
     CHECK_MINER_AXON_NONE = 3007
+    DEADLINE_EXCEEDED = 3008
 
 class ChallengeType(Enum):
     SYNTHETIC = 1
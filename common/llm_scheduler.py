@@ -0,0 +1,293 @@
+"""
+Priority-aware admission for LLM calls.
+
+Callers tag their work with `llm_context(priority, project)` (a context
+variable, so it follows the task and the tasks it spawns); every model call
+then waits for an `LLMScheduler.slot()`. Slots go to the most important
+waiting class first and, within a class, to the project with the fewest
+calls in flight, then the one served longest ago. Lower-priority classes
+are capped to a share of the slots and may have a token budget, so they can
+never crowd out a synthetic round.
+"""
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+import itertools
+import time
+from typing import Any, AsyncIterator
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+from langchain_openai import ChatOpenAI
+from pydantic import Field
+
+
+class Priority(IntEnum):
+    """Lower value is served first."""
+    SYNTHETIC = 0  # critical path of a synthetic round
+    ORGANIC = 1  # organic task sampling
+    PREFETCH = 2  # next round's challenges, prepared ahead of time
+
+
+_priority: ContextVar[Priority] = ContextVar("llm_priority", default=Priority.SYNTHETIC)
+_project: ContextVar[str] = ContextVar("llm_project", default="")
+
+
+def set_llm_context(priority: Priority, project: str = ""):
+    """Tag the LLM calls of the current task (and tasks it creates from now on)."""
+    _priority.set(priority)
+    _project.set(project)
+
+
+@contextmanager
+def llm_context(priority: Priority, project: str = ""):
+    priority_token = _priority.set(priority)
+    project_token = _project.set(project)
+    try:
+        yield
+    finally:
+        _project.reset(project_token)
+        _priority.reset(priority_token)
+
+
+def current_llm_priority() -> Priority:
+    return _priority.get()
+
+
+class LLMWait:
+    """Seconds the LLM calls made inside `measure_llm_wait` spent queued rather than at the provider."""
+    __slots__ = ("seconds",)
+
+    def __init__(self):
+        self.seconds = 0.0
+
+
+_wait: ContextVar[LLMWait | None] = ContextVar("llm_wait", default=None)
+
+
+@contextmanager
+def measure_llm_wait():
+    """Collect the queueing time of the LLM calls of the current task and the tasks it spawns."""
+    wait = LLMWait()
+    token = _wait.set(wait)
+    try:
+        yield wait
+    finally:
+        _wait.reset(token)
+
+
+def record_llm_wait(seconds: float):
+    wait = _wait.get()
+    if wait is not None and seconds > 0:
+        wait.seconds += seconds
+
+
+class _Waiter:
+    __slots__ = ("priority", "project", "seq", "future")
+
+    def __init__(self, priority: Priority, project: str, seq: int, future: asyncio.Future):
+        self.priority = priority
+        self.project = project
+        self.seq = seq
+        self.future = future
+
+
+class LLMScheduler:
+    """
+    Concurrency and token budgets for LLM calls, shared by priority classes.
+
+    `max_concurrency` slots in total (0 = unlimited, the scheduler only keeps
+    metrics). `class_shares` caps the slots a class may hold at once, as a
+    fraction of `max_concurrency`; `class_tokens_per_minute` caps the tokens
+    a class may use in any 60s window. Classes not listed are uncapped.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 0,
+        class_shares: dict[Priority, float] | None = None,
+        class_tokens_per_minute: dict[Priority, int] | None = None,
+    ):
+        self.max_concurrency = max_concurrency
+        self.class_caps = {
+            priority: max(1, int(max_concurrency * share))
+            for priority, share in (class_shares or {}).items()
+        } if max_concurrency else {}
+        self.class_tokens_per_minute = class_tokens_per_minute or {}
+
+        self._in_flight = 0
+        self._class_in_flight: dict[Priority, int] = {p: 0 for p in Priority}
+        self._project_in_flight: dict[tuple[Priority, str], int] = {}
+        self._project_served_at: dict[tuple[Priority, str], int] = {}  # grant counter of the last slot given
+        self._grants = itertools.count()
+        self._usage: dict[Priority, deque[tuple[float, int]]] = {p: deque() for p in Priority}
+        self._waiters: list[_Waiter] = []
+        self._seq = itertools.count()
+        self._budget_timer: asyncio.TimerHandle | None = None
+
+        # Metrics, see `snapshot`
+        self._served: dict[Priority, int] = {p: 0 for p in Priority}
+        self._wait_total: dict[Priority, float] = {p: 0.0 for p in Priority}
+        self._wait_max: dict[Priority, float] = {p: 0.0 for p in Priority}
+
+    def _tokens_used(self, priority: Priority, now: float) -> int:
+        usage = self._usage[priority]
+        while usage and now - usage[0][0] > 60:
+            usage.popleft()
+        return sum(tokens for _, tokens in usage)
+
+    def _admissible(self, priority: Priority, now: float) -> bool:
+        cap = self.class_caps.get(priority)
+        if cap is not None and self._class_in_flight[priority] >= cap:
+            return False
+        budget = self.class_tokens_per_minute.get(priority)
+        return not budget or self._tokens_used(priority, now) < budget
+
+    def _dispatch(self):
+        now = time.monotonic()
+        self._waiters = [w for w in self._waiters if not w.future.done()]
+        budget_blocked = False
+        while self._waiters and (not self.max_concurrency or self._in_flight < self.max_concurrency):
+            candidates = []
+            for w in self._waiters:
+                if self._admissible(w.priority, now):
+                    candidates.append(w)
+                elif self.class_tokens_per_minute.get(w.priority):
+                    budget_blocked = True
+            if not candidates:
+                break
+            # Within a class: fewest calls in flight, then the project served longest ago
+            waiter = min(
+                candidates,
+                key=lambda w: (
+                    w.priority,
+                    self._project_in_flight.get((w.priority, w.project), 0),
+                    self._project_served_at.get((w.priority, w.project), -1),
+                    w.seq,
+                ),
+            )
+            self._waiters.remove(waiter)
+            self._take(waiter.priority, waiter.project)
+            waiter.future.set_result(None)
+
+        if budget_blocked and self._waiters and self._budget_timer is None:
+            # Token budgets free up as the window slides
+            self._budget_timer = asyncio.get_running_loop().call_later(1.0, self._on_budget_timer)
+
+    def _on_budget_timer(self):
+        self._budget_timer = None
+        self._dispatch()
+
+    def _take(self, priority: Priority, project: str):
+        self._in_flight += 1
+        self._class_in_flight[priority] += 1
+        key = (priority, project)
+        self._project_in_flight[key] = self._project_in_flight.get(key, 0) + 1
+        self._project_served_at[key] = next(self._grants)
+
+    def _release(self, priority: Priority, project: str):
+        self._in_flight -= 1
+        self._class_in_flight[priority] -= 1
+        key = (priority, project)
+        self._project_in_flight[key] -= 1
+        if not self._project_in_flight[key]:
+            del self._project_in_flight[key]
+        self._dispatch()
+
+    def promote(self, project: str, from_priority: Priority, to_priority: Priority):
+        """Move the queued `from_priority` calls of `project` to `to_priority`."""
+        for w in self._waiters:
+            if w.project == project and w.priority == from_priority:
+                w.priority = to_priority
+        self._dispatch()
+
+    def record_tokens(self, priority: Priority, tokens: int):
+        if tokens > 0 and self.class_tokens_per_minute.get(priority):
+            self._usage[priority].append((time.monotonic(), tokens))
+
+    @asynccontextmanager
+    async def slot(self):
+        """Hold one LLM call slot for the current `llm_context`; yields the seconds waited for it."""
+        priority, project = _priority.get(), _project.get()
+        start = time.monotonic()
+        waiter = _Waiter(priority, project, next(self._seq), asyncio.get_running_loop().create_future())
+        self._waiters.append(waiter)
+        self._dispatch()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Granted just as we were cancelled
+                self._release(waiter.priority, project)
+            else:
+                waiter.future.cancel()
+                self._dispatch()
+            raise
+
+        priority = waiter.priority  # may have been promoted while queued
+        waited = time.monotonic() - start
+        self._served[priority] += 1
+        self._wait_total[priority] += waited
+        self._wait_max[priority] = max(self._wait_max[priority], waited)
+        record_llm_wait(waited)
+        try:
+            yield waited
+        finally:
+            self._release(priority, project)
+
+    def snapshot(self, reset: bool = True) -> dict:
+        """In-flight and queued calls per class, with wait-time stats since the last reset."""
+        now = time.monotonic()
+        data = {"in_flight": self._in_flight, "queued": len(self._waiters)}
+        for p in Priority:
+            served = self._served[p]
+            data[p.name.lower()] = {
+                "in_flight": self._class_in_flight[p],
+                "queued": sum(1 for w in self._waiters if w.priority == p),
+                "served": served,
+                "avg_wait": round(self._wait_total[p] / served, 3) if served else 0.0,
+                "max_wait": round(self._wait_max[p], 3),
+                "tokens_last_minute": self._tokens_used(p, now),
+            }
+        if reset:
+            for p in Priority:
+                self._served[p] = 0
+                self._wait_total[p] = 0.0
+                self._wait_max[p] = 0.0
+        return data
+
+
+class ScheduledChatOpenAI(ChatOpenAI):
+    """ChatOpenAI whose every call, including those made inside agents, holds an LLMScheduler slot."""
+
+    llm_scheduler: Any = Field(default=None, exclude=True)
+
+    async def _agenerate(self, *args, **kwargs) -> ChatResult:
+        if self.llm_scheduler is None:
+            return await super()._agenerate(*args, **kwargs)
+        async with self.llm_scheduler.slot():
+            result = await super()._agenerate(*args, **kwargs)
+        self.llm_scheduler.record_tokens(current_llm_priority(), _total_tokens(result))
+        return result
+
+    async def _astream(self, *args, **kwargs) -> AsyncIterator[ChatGenerationChunk]:
+        if self.llm_scheduler is None:
+            async for chunk in super()._astream(*args, **kwargs):
+                yield chunk
+            return
+        async with self.llm_scheduler.slot():
+            async for chunk in super()._astream(*args, **kwargs):
+                usage = getattr(chunk.message, "usage_metadata", None)
+                if usage:
+                    self.llm_scheduler.record_tokens(current_llm_priority(), usage.get("total_tokens", 0))
+                yield chunk
+
+
+def _total_tokens(result: ChatResult) -> int:
+    total = sum(
+        (getattr(g.message, "usage_metadata", None) or {}).get("total_tokens", 0)
+        for g in result.generations
+    )
+    if not total and result.llm_output:
+        total = (result.llm_output.get("token_usage") or {}).get("total_tokens", 0)
+    return total
@@ -1,16 +1,17 @@
 import json
 import bittensor as bt
-from typing import Any, Optional, List
+from typing import Any, Optional, List, TYPE_CHECKING
 import fastapi
 from pydantic import BaseModel, Field
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from loguru import logger
-from langchain_core.messages import AnyMessage, SystemMessage, HumanMessage, AIMessage
-from langgraph.graph import MessagesState
 
-from agent.stats import ProjectUsageMetrics, TokenUsageMetrics
 from common.sqlite_manager import SQLiteManager
 import common.utils as utils
+if TYPE_CHECKING:
+    # Synapses are loaded by every process, langchain only where agents run
+    from langchain_core.messages import AnyMessage
+    from agent.stats import ProjectUsageMetrics, TokenUsageMetrics
 
 
 # ===============  openai ================
@@ -53,8 +54,10 @@ class CompletionMessagesMixin:
     """Mixin class for synapses that contain ChatCompletionRequest with messages."""
     completion: ChatCompletionRequest | None = None
     
-    def to_messages(self) -> list[AnyMessage]:
+    def to_messages(self) -> "list[AnyMessage]":
         """Convert ChatCompletionRequest messages to LangChain message types."""
+        from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
+
         if not self.completion:
             return []
         messages = []
@@ -197,8 +200,8 @@ class StatsMiddleware(BaseHTTPMiddleware):
         self,
         app,
         sqlite_manager: SQLiteManager,
-        project_usage_metrics: ProjectUsageMetrics,
-        token_usage_metrics: TokenUsageMetrics
+        project_usage_metrics: "ProjectUsageMetrics",
+        token_usage_metrics: "TokenUsageMetrics"
     ):
         super().__init__(app)
         self.sqlite_manager = sqlite_manager
@@ -253,15 +256,6 @@ class StatsMiddleware(BaseHTTPMiddleware):
         elif path == '/stats/token_stats':
             return self.handle_token_stats(request.query_params.get("latest", "2h"))
         return await call_next(request)
-class ExtendedMessagesState(MessagesState):
-    error: str | None = None
-    graphql_agent_hit: bool
-    intermediate_graphql_agent_input_token_usage: int
-    intermediate_graphql_agent_input_cache_read_token_usage: int
-    intermediate_graphql_agent_output_token_usage: int
-    block_height: int
-    tool_calls: list[str]
-
 class BaseBoardResponse(BaseModel):
     code: int
     message: str
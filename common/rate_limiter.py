@@ -0,0 +1,268 @@
+import asyncio
+from email.utils import parsedate_to_datetime
+import heapq
+import itertools
+import threading
+import time
+from typing import Any
+import httpx
+from langchain_core.callbacks import AsyncCallbackHandler
+from langchain_core.outputs import LLMResult
+from langchain_core.rate_limiters import BaseRateLimiter
+from loguru import logger
+
+from common.llm_scheduler import current_llm_priority, record_llm_wait
+
+
+class AdaptiveRateLimiter(BaseRateLimiter):
+    """
+    Request and token buckets shared by several chat models, adapting to the
+    provider's limits.
+
+    Every call takes one request token; output and input tokens are charged
+    once the call completes (the bucket may go into debt, which blocks new
+    calls until it refills). A 429 halves the request rate and pauses all
+    callers for its `Retry-After`; successful responses raise the rate back
+    step by step. Async callers are served by `llm_context` priority, then
+    in arrival order. With `requests_per_second=0` there is no request cap:
+    calls only wait out a 429's `Retry-After` (and the token bucket, if set).
+
+    Attach it with `ChatOpenAI(rate_limiter=limiter, callbacks=[limiter.callback],
+    http_async_client=limiter.http_async_client())`, see `chat_model_kwargs`.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float = 0,
+        tokens_per_minute: float = 0,
+        burst: float | None = None,
+        min_rate_ratio: float = 0.1,
+        recovery_ratio: float = 0.02,
+        backoff_cooldown: float = 2.0,
+    ):
+        self.max_rate = requests_per_second  # 0 = no request cap
+        self.rate = requests_per_second  # current requests/s
+        self.min_rate = requests_per_second * min_rate_ratio
+        self.recovery_step = requests_per_second * recovery_ratio  # requests/s regained per success
+        self.burst = burst if burst is not None else max(1.0, requests_per_second)
+        self.tokens_per_minute = tokens_per_minute  # 0 disables the token bucket
+        self.backoff_cooldown = backoff_cooldown  # seconds, 429s within it count once
+
+        self._requests = self.burst
+        self._tokens = float(tokens_per_minute)
+        self._refilled_at = time.monotonic()
+        self._paused_until = 0.0
+        self._last_backoff = 0.0
+        self._state_lock = threading.Lock()
+        self._queue: list[tuple[int, int]] = []  # heap of (priority, seq) of async waiters
+        self._seq = itertools.count()
+        self._queue_changed: asyncio.Future | None = None
+        self._http_async_client: httpx.AsyncClient | None = None
+        self.callback = _TokenUsageCallback(self)
+
+        # Metrics, see `snapshot`
+        self.queue_depth = 0
+        self._waits = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._rate_limited = 0
+
+    def _refill(self, now: float):
+        elapsed = now - self._refilled_at
+        self._refilled_at = now
+        self._requests = min(self.burst, self._requests + elapsed * self.rate)
+        if self.tokens_per_minute:
+            self._tokens = min(self.tokens_per_minute, self._tokens + elapsed * self.tokens_per_minute / 60 * self._scale())
+
+    def _scale(self) -> float:
+        """Token throughput follows the same backoff as requests."""
+        return self.rate / self.max_rate if self.max_rate else 1.0
+
+    def _try_acquire(self) -> float:
+        """Take a request token; returns 0 on success, else seconds to wait."""
+        with self._state_lock:
+            now = time.monotonic()
+            self._refill(now)
+            if now < self._paused_until:
+                return self._paused_until - now
+            if self.tokens_per_minute and self._tokens <= 0:
+                return (1 - self._tokens) / (self.tokens_per_minute / 60 * self._scale())
+            if not self.max_rate:
+                return 0.0
+            if self._requests < 1:
+                return (1 - self._requests) / self.rate
+            self._requests -= 1
+            return 0.0
+
+    def _record_wait(self, waited: float):
+        self._waits += 1
+        self._wait_total += waited
+        self._wait_max = max(self._wait_max, waited)
+
+    def acquire(self, *, blocking: bool = True) -> bool:
+        start = time.monotonic()
+        while (wait := self._try_acquire()) > 0:
+            if not blocking:
+                return False
+            time.sleep(wait)
+        self._record_wait(time.monotonic() - start)
+        record_llm_wait(time.monotonic() - start)
+        return True
+
+    async def aacquire(self, *, blocking: bool = True) -> bool:
+        entry = (int(current_llm_priority()), next(self._seq))
+        heapq.heappush(self._queue, entry)
+        self._notify_queue_changed()
+
+        start = time.monotonic()
+        self.queue_depth += 1
+        try:
+            # Only the head of the queue takes tokens; the rest wait for it to change
+            while True:
+                if self._queue[0] == entry:
+                    wait = self._try_acquire()
+                    if wait <= 0:
+                        break
+                else:
+                    wait = None
+                if not blocking:
+                    return False
+                await self._wait_queue_changed(wait)
+        finally:
+            self.queue_depth -= 1
+            self._queue.remove(entry)
+            heapq.heapify(self._queue)
+            self._notify_queue_changed()
+        self._record_wait(time.monotonic() - start)
+        record_llm_wait(time.monotonic() - start)
+        return True
+
+    def _notify_queue_changed(self):
+        if self._queue_changed is not None and not self._queue_changed.done():
+            self._queue_changed.set_result(None)
+        self._queue_changed = None
+
+    async def _wait_queue_changed(self, timeout: float | None):
+        """Sleep up to `timeout` seconds, waking early when waiters come or go."""
+        if self._queue_changed is None:
+            self._queue_changed = asyncio.get_running_loop().create_future()
+        try:
+            await asyncio.wait_for(asyncio.shield(self._queue_changed), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def record_tokens(self, tokens: int):
+        if self.tokens_per_minute and tokens > 0:
+            with self._state_lock:
+                self._tokens -= tokens
+
+    def on_rate_limited(self, retry_after: float | None):
+        with self._state_lock:
+            now = time.monotonic()
+            self._rate_limited += 1
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+            if now - self._last_backoff < self.backoff_cooldown:
+                return
+            self._last_backoff = now
+            if not self.max_rate:
+                logger.warning(f"[AdaptiveRateLimiter] Rate limited, pausing calls for {retry_after}s")
+                return
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._requests = min(self._requests, 0.0)
+        logger.warning(f"[AdaptiveRateLimiter] Rate limited (retry after {retry_after}s), lowering rate to {self.rate:.2f} req/s")
+
+    def on_success(self):
+        if self.rate < self.max_rate:
+            with self._state_lock:
+                self._refill(time.monotonic())
+                self.rate = min(self.max_rate, self.rate + self.recovery_step)
+
+    async def _on_response(self, response: httpx.Response):
+        if response.status_code == 429:
+            self.on_rate_limited(parse_retry_after(response.headers))
+        elif response.status_code < 400:
+            self.on_success()
+
+    def http_async_client(self, **kwargs) -> httpx.AsyncClient:
+        """An httpx client reporting every response (retries included) to the limiter."""
+        return httpx.AsyncClient(event_hooks={"response": [self._on_response]}, **kwargs)
+
+    def chat_model_kwargs(self) -> dict:
+        """Keyword arguments that put a ChatOpenAI behind this limiter."""
+        if self._http_async_client is None:
+            self._http_async_client = self.http_async_client(timeout=None)
+        return {
+            "rate_limiter": self,
+            "callbacks": [self.callback],
+            "http_async_client": self._http_async_client,
+        }
+
+    async def aclose(self):
+        if self._http_async_client is not None:
+            await self._http_async_client.aclose()
+            self._http_async_client = None
+
+    def snapshot(self, reset: bool = True) -> dict:
+        """Current rate and queue depth, with wait-time stats since the last reset."""
+        data = {
+            "rate": round(self.rate, 3),
+            "queue_depth": self.queue_depth,
+            "acquired": self._waits,
+            "avg_wait": round(self._wait_total / self._waits, 3) if self._waits else 0.0,
+            "max_wait": round(self._wait_max, 3),
+            "rate_limited": self._rate_limited,
+        }
+        if self.tokens_per_minute:
+            data["tokens_available"] = int(self._tokens)
+        if reset:
+            self._waits = 0
+            self._wait_total = 0.0
+            self._wait_max = 0.0
+            self._rate_limited = 0
+        return data
+
+
+class _TokenUsageCallback(AsyncCallbackHandler):
+    """Charges the limiter's token bucket with the usage of finished calls."""
+
+    def __init__(self, limiter: AdaptiveRateLimiter):
+        self.limiter = limiter
+
+    async def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        self.limiter.record_tokens(_total_tokens(response))
+
+
+def _total_tokens(response: LLMResult) -> int:
+    total = 0
+    for generations in response.generations:
+        for generation in generations:
+            usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+            if usage:
+                total += usage.get("total_tokens", 0)
+    if not total and response.llm_output:
+        total = (response.llm_output.get("token_usage") or {}).get("total_tokens", 0)
+    return total
+
+
+def parse_retry_after(headers) -> float | None:
+    """Seconds from `retry-after-ms` / `Retry-After` (seconds or HTTP date)."""
+    value = headers.get("retry-after-ms")
+    if value:
+        try:
+            return float(value) / 1000
+        except ValueError:
+            pass
+
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,183 @@
+"""
+Fixed-capacity ring buffer of pickled records in shared memory, for passing
+work between validator processes without a Manager proxy round trip per item.
+"""
+import multiprocessing as mp
+from multiprocessing import shared_memory
+import pickle
+import struct
+from typing import Any
+import uuid
+from loguru import logger
+
+
+DROP_OLDEST = "drop_oldest"
+DROP_NEWEST = "drop_newest"
+
+# head, tail (monotonic byte offsets), count, dropped
+_HEADER = struct.Struct("<QQQQ")
+_HEADER_SIZE = 64
+_LENGTH = struct.Struct("<I")
+_WRAP = 0xFFFFFFFF  # rest of the region is unused, the next record starts at offset 0
+
+
+class SharedRingBuffer:
+    """
+    Records are stored as `<u32 length><payload>`, never split across the end
+    of the region. When full (`capacity` bytes or `max_records` records),
+    DROP_OLDEST evicts the oldest records and DROP_NEWEST rejects the new one.
+
+    Create it once in the parent with `create` and pass it to child processes;
+    `put` never waits longer than `put_timeout` for the lock, dropping the
+    record instead.
+    """
+
+    def __init__(
+        self,
+        shm: shared_memory.SharedMemory,
+        lock,
+        max_records: int,
+        policy: str,
+        put_timeout: float,
+        owner: bool = False,
+    ):
+        if policy not in (DROP_OLDEST, DROP_NEWEST):
+            raise ValueError(f"unknown ring buffer policy: {policy}")
+        self._shm = shm
+        self._lock = lock
+        # The block may be rounded up to a page, the usable size is in the header
+        self.capacity = struct.unpack_from("<Q", shm.buf, _HEADER.size)[0]
+        self.max_records = max_records
+        self.policy = policy
+        self.put_timeout = put_timeout  # seconds
+        self._owner = owner
+
+    @classmethod
+    def create(
+        cls,
+        capacity: int = 32 * 1024 * 1024,
+        max_records: int = 1000,
+        policy: str = DROP_NEWEST,
+        put_timeout: float = 0.05,
+        name: str | None = None,
+        ctx=None,
+    ) -> "SharedRingBuffer":
+        """A new block; `ctx` is the multiprocessing context of the processes sharing it."""
+        shm = shared_memory.SharedMemory(
+            name=name or f"hermes_ring_{uuid.uuid4().hex[:12]}",
+            create=True,
+            size=_HEADER_SIZE + capacity,
+        )
+        shm.buf[:_HEADER_SIZE] = bytes(_HEADER_SIZE)
+        struct.pack_into("<Q", shm.buf, _HEADER.size, capacity)
+        return cls(shm, (ctx or mp).Lock(), max_records, policy, put_timeout, owner=True)
+
+    def __getstate__(self):
+        # Spawned processes attach to the block by name
+        return {
+            "name": self._shm.name,
+            "lock": self._lock,
+            "max_records": self.max_records,
+            "policy": self.policy,
+            "put_timeout": self.put_timeout,
+        }
+
+    def __setstate__(self, state: dict):
+        shm = shared_memory.SharedMemory(name=state["name"], track=False)
+        self.__init__(shm, state["lock"], state["max_records"], state["policy"], state["put_timeout"])
+
+    def __len__(self) -> int:
+        return _HEADER.unpack_from(self._shm.buf, 0)[2]
+
+    def put(self, record: Any) -> bool:
+        """Append `record`; False when it was dropped."""
+        payload = pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL)
+        need = _LENGTH.size + len(payload)
+        if not self._lock.acquire(timeout=self.put_timeout):
+            logger.warning("[SharedRingBuffer] Lock busy, dropping record")
+            return False
+        try:
+            buf = self._shm.buf
+            head, tail, count, dropped = _HEADER.unpack_from(buf, 0)
+            if need > self.capacity:
+                logger.warning(f"[SharedRingBuffer] Dropping {len(payload)} byte record, larger than the buffer")
+                _HEADER.pack_into(buf, 0, head, tail, count, dropped + 1)
+                return False
+            while True:
+                pos = head % self.capacity
+                contiguous = self.capacity - pos
+                skip = contiguous if contiguous < need else 0  # wasted by wrapping to the start
+                if count < self.max_records and head - tail + skip + need <= self.capacity:
+                    break
+                if count == 0:
+                    # Empty but misaligned, restart at the beginning of the region
+                    head = tail = head + contiguous
+                    continue
+                if self.policy == DROP_NEWEST:
+                    _HEADER.pack_into(buf, 0, head, tail, count, dropped + 1)
+                    return False
+                tail = self._next(tail)
+                count -= 1
+                dropped += 1
+
+            if skip:
+                if contiguous >= _LENGTH.size:
+                    _LENGTH.pack_into(buf, _HEADER_SIZE + pos, _WRAP)
+                head += contiguous
+                pos = 0
+            offset = _HEADER_SIZE + pos
+            _LENGTH.pack_into(buf, offset, len(payload))
+            buf[offset + _LENGTH.size:offset + need] = payload
+            _HEADER.pack_into(buf, 0, head + need, tail, count + 1, dropped)
+            return True
+        finally:
+            self._lock.release()
+
+    def drain(self, max_records: int | None = None) -> list[Any]:
+        """Remove and return up to `max_records` records (all when None), oldest first."""
+        payloads = []
+        with self._lock:
+            buf = self._shm.buf
+            head, tail, count, dropped = _HEADER.unpack_from(buf, 0)
+            while count and (max_records is None or len(payloads) < max_records):
+                tail = self._align(tail)
+                offset = _HEADER_SIZE + tail % self.capacity
+                (length,) = _LENGTH.unpack_from(buf, offset)
+                payloads.append(bytes(buf[offset + _LENGTH.size:offset + _LENGTH.size + length]))
+                tail += _LENGTH.size + length
+                count -= 1
+            _HEADER.pack_into(buf, 0, head, tail, count, dropped)
+
+        records = []
+        for payload in payloads:
+            try:
+                records.append(pickle.loads(payload))
+            except Exception as e:
+                logger.error(f"[SharedRingBuffer] Failed to decode record: {e}")
+        return records
+
+    def _align(self, offset: int) -> int:
+        """`offset`, or the start of the next lap when a record can't begin there."""
+        pos = offset % self.capacity
+        contiguous = self.capacity - pos
+        if contiguous < _LENGTH.size or _LENGTH.unpack_from(self._shm.buf, _HEADER_SIZE + pos)[0] == _WRAP:
+            return offset + contiguous
+        return offset
+
+    def _next(self, offset: int) -> int:
+        offset = self._align(offset)
+        (length,) = _LENGTH.unpack_from(self._shm.buf, _HEADER_SIZE + offset % self.capacity)
+        return offset + _LENGTH.size + length
+
+    def stats(self) -> dict:
+        head, tail, count, dropped = _HEADER.unpack_from(self._shm.buf, 0)
+        return {"records": count, "bytes": head - tail, "capacity": self.capacity, "dropped": dropped}
+
+    def close(self):
+        self._shm.close()
+        if self._owner:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+
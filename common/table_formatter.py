@@ -7,6 +7,13 @@ from common.enums import ErrorCode
 from common.protocol import OrganicNonStreamSynapse
 
 
+def dendrite_status_code(r) -> int | None:
+    """Compact query results carry the dendrite status, reading it off them must not rebuild the synapse."""
+    if hasattr(type(r), "dendrite_status_code"):
+        return r.dendrite_status_code
+    return r.dendrite.status_code
+
+
 class TableFormatter:
     """Rich table formatter for consistent logging display"""
     
@@ -165,7 +172,7 @@ class TableFormatter:
                 else:
                     rstr = f"⚠️ {r.status_code}: {r.error}"
             else:
-                rstr = f"⚠️ {r.dendrite.status_code}"
+                rstr = f"⚠️ {dendrite_status_code(r)}"
                     
             # uid_hotkey = f"{uid}|{r.dendrite.hotkey}" if getattr(r.dendrite, 'hotkey', None) else f"{uid}"
             rows.append([
@@ -265,7 +272,7 @@ class TableFormatter:
             else:
                 rstr = f"⚠️ {response.status_code}: {response.error}"
         else:
-            rstr = f"⚠️ {response.dendrite.status_code}"
+            rstr = f"⚠️ {dendrite_status_code(response)}"
             
         rows = [
             f"❓ Question: {question}\n",
@@ -304,7 +311,7 @@ class TableFormatter:
                 else:
                     rstr = f"⚠️ {r.status_code}: {r.error}"
             else:
-                rstr = f"⚠️ {r.dendrite.status_code}"
+                rstr = f"⚠️ {dendrite_status_code(r)}"
                     
             # uid_hotkey = f"{uid}|{r.dendrite.hotkey}" if getattr(r.dendrite, 'hotkey', None) else f"{uid}"
             rows.append([
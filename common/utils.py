@@ -11,8 +11,10 @@ import requests
 import hashlib
 import multiprocessing as mp
 from pathlib import Path
-from langchain_core.messages import BaseMessage, AIMessage
 from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from langchain_core.messages import BaseMessage
 
 
 def get_available_cpu_count():
@@ -172,6 +174,13 @@ def try_get_external_ip() -> str | None:
         logger.warning(f"Failed to get external ip: {e}")
         return None
     
+def get_max_allowed_time(ground_truth_cost: float, min_latency_improvement_ratio: float) -> float:
+    """
+    Latest elapsed time that can still earn a non-zero weight in `get_elapse_weight_quadratic`.
+    Miner queries still running past this point cannot score and may be cancelled.
+    """
+    return ground_truth_cost * (1.0 - min_latency_improvement_ratio)
+
 def get_elapse_weight_quadratic(elapsed_time: float, ground_truth_cost: float, min_latency_improvement_ratio: float) -> float:
     """
     Calculate weight based on elapsed time vs ground truth cost.
@@ -192,7 +201,7 @@ def get_elapse_weight_quadratic(elapsed_time: float, ground_truth_cost: float, m
     # Check if miner meets minimum latency improvement requirement
     # e.g., if min_latency_improvement_ratio = 0.2, miner must be at least 20% faster
     # This means elapsed_time must be <= ground_truth_cost * (1 - 0.2) = ground_truth_cost * 0.8
-    max_allowed_time = ground_truth_cost * (1.0 - min_latency_improvement_ratio)
+    max_allowed_time = get_max_allowed_time(ground_truth_cost, min_latency_improvement_ratio)
     
     if elapsed_time > max_allowed_time:
         return 0.0
@@ -342,7 +351,9 @@ def select_uid(
 
     return None, None
 
-def try_get_invalid_tool_messages(messages: list[BaseMessage] | BaseMessage) -> str | None:
+def try_get_invalid_tool_messages(messages: "list[BaseMessage] | BaseMessage") -> str | None:
+    from langchain_core.messages import AIMessage
+
     if not isinstance(messages, list):
         messages = [messages]
 
@@ -392,7 +403,7 @@ def is_ground_truth_valid(ground_truth: str | None) -> bool:
 
     return True
 
-def try_get_tool_hit(messages: list[BaseMessage], exclude_tools=[]) -> list[tuple[str, int]]:
+def try_get_tool_hit(messages: "list[BaseMessage]", exclude_tools=[]) -> list[tuple[str, int]]:
     tool_order = []
     tool_counts = {}
     for m in messages:
@@ -405,7 +416,7 @@ def try_get_tool_hit(messages: list[BaseMessage], exclude_tools=[]) -> list[tupl
     tool_hit = [(name, tool_counts[name]) for name in tool_order]
     return tool_hit
 
-def form_training_data(question: str, block_height: int, response_messages: list[BaseMessage], metrics_data: dict) -> dict:
+def form_training_data(question: str, block_height: int, response_messages: "list[BaseMessage]", metrics_data: dict) -> dict:
     messages = [
         {
             "role": "system",
@@ -489,7 +500,7 @@ def format_openai_key() -> str:
         formatted_key = "****" if api_key else "Not Set"
     return formatted_key
 
-def extract_token_usage(messages: list[BaseMessage]) -> tuple[int, int, int]:
+def extract_token_usage(messages: "list[BaseMessage]") -> tuple[int, int, int]:
     if not messages:
         return 0, 0, 0
 
@@ -511,7 +522,7 @@ def extract_token_usage(messages: list[BaseMessage]) -> tuple[int, int, int]:
             output_tokens += usage.get("output_tokens", 0)
     return input_tokens, input_cache_read_tokens, output_tokens
 
-def extract_tool_calls(messages: list[BaseMessage]) -> list[str]:
+def extract_tool_calls(messages: "list[BaseMessage]") -> list[str]:
     tool_calls = []
     if not messages:
         return tool_calls
@@ -697,13 +708,42 @@ def omit(obj: dict, keys: list) -> dict:
     
     return {key: value for key, value in obj.items() if key not in keys}
 
-async def get_latest_block(endpoint: str, node_type: str) -> int | None:
+async def _post_latest_block(session: aiohttp.ClientSession, endpoint: str, node_type: str, query: str, headers: dict) -> int | None:
+    async with session.post(
+        endpoint,
+        json={"query": query},
+        headers=headers,
+        timeout=aiohttp.ClientTimeout(total=10.0)
+    ) as response:
+        if response.status != 200:
+            logger.error(f"Failed to get latest block from {endpoint}: HTTP {response.status}")
+            return None
+        
+        data = await response.json()
+        
+        # Extract block height based on node type
+        if node_type == "subql":
+            block_height = data.get("data", {}).get("_metadata", {}).get("lastProcessedHeight")
+        elif node_type == "thegraph":
+            block_height = data.get("data", {}).get("_meta", {}).get("block", {}).get("number")
+        else:
+            return None
+        
+        if block_height is not None:
+            logger.info(f"Latest block height from {endpoint} ({node_type}): {block_height}")
+            return int(block_height)
+        else:
+            logger.error(f"Failed to extract block height from response: {data}")
+            return None
+
+async def get_latest_block(endpoint: str, node_type: str, session: aiohttp.ClientSession | None = None) -> int | None:
     """
     Get the latest block height from a GraphQL endpoint.
     
     Args:
         endpoint: The GraphQL endpoint URL
         node_type: Type of node - "subql", "thegraph", or "codex"
+        session: Optional pooled session to reuse; a one-off session is used otherwise
         
     Returns:
         int: Latest block height, or None if failed
@@ -744,38 +784,20 @@ async def get_latest_block(endpoint: str, node_type: str) -> int | None:
             return None
         
         # Send GraphQL request using aiohttp
+        if session is not None:
+            return await _post_latest_block(session, endpoint, node_type, query, headers)
         async with aiohttp.ClientSession() as session:
-            async with session.post(
-                endpoint,
-                json={"query": query},
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=10.0)
-            ) as response:
-                if response.status != 200:
-                    logger.error(f"Failed to get latest block from {endpoint}: HTTP {response.status}")
-                    return None
-                
-                data = await response.json()
-                
-                # Extract block height based on node type
-                if node_type == "subql":
-                    block_height = data.get("data", {}).get("_metadata", {}).get("lastProcessedHeight")
-                elif node_type == "thegraph":
-                    block_height = data.get("data", {}).get("_meta", {}).get("block", {}).get("number")
-                else:
-                    return None
-                
-                if block_height is not None:
-                    logger.info(f"Latest block height from {endpoint} ({node_type}): {block_height}")
-                    return int(block_height)
-                else:
-                    logger.error(f"Failed to extract block height from response: {data}")
-                    return None
-                
+            return await _post_latest_block(session, endpoint, node_type, query, headers)
+
     except Exception as e:
         logger.error(f"Error getting latest block from {endpoint}: {e}")
         return None
 
+async def aiter_indexed(items: list):
+    """Async iterator over `(index, item)` pairs of a list."""
+    for i, item in enumerate(items):
+        yield i, item
+
 def kill_process_group():
     try:
         os.killpg(os.getpgid(0), signal.SIGKILL)
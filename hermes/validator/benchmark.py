@@ -1,5 +1,5 @@
 import random
-from typing import Any
+from typing import Any, Callable
 import aiohttp
 import os
 import bittensor as bt
@@ -8,6 +8,9 @@ import hashlib
 import time
 import base64
 
+from hermes.validator import benchmark_encoding
+from hermes.validator.benchmark_uploader import BenchmarkUploader
+
 
 class BenchMark:
     def __init__(self, wallet: bt.wallet, ipc_meta_config: dict[str, Any] = None):
@@ -19,7 +22,16 @@ class BenchMark:
             self.ipc_meta_config = {}
         else:
             self.ipc_meta_config = ipc_meta_config
-        
+
+        # Uploads run in the background so rounds never wait on the board service
+        self.uploader = BenchmarkUploader(
+            self._post_batch,
+            spool_dir=os.getenv("BENCHMARK_SPOOL_DIR", ".data/benchmark_spool"),
+            max_queue_size=int(os.getenv("BENCHMARK_QUEUE_SIZE", 1000)),
+        )
+
+    async def close(self):
+        await self.uploader.close()
 
     async def add_failure(
             self,
@@ -134,17 +146,20 @@ class BenchMark:
         score_model_name: str,
         ground_truth: str,
         ground_cost: float,
-        ground_truth_tools: list[dict[str, str]],
+        ground_truth_tools: list[dict[str, str]] | Callable[[], list[dict[str, str]]],
         ground_input_tokens: int,
         ground_input_cache_read_tokens: int,
         ground_output_tokens: int,
         block_height: str,
-        miners_answer: list[dict[str, any]],
+        miners_answer: list[dict[str, any]] | Callable[[], list[dict[str, any]]],
     ):
         """
         Upload benchmark data based on mode:
         - 'sample': Upload randomly sampled data based on sample_rate, batched by cid_hash
         - 'all': Upload all data immediately
+
+        `ground_truth_tools` and `miners_answer` may be zero-argument builders;
+        they are only called for samples that are actually uploaded.
         """
         benchmark_mode = self.ipc_meta_config.get("benchmark_mode", "sample")
         benchmark_sample_rate = self.ipc_meta_config.get("benchmark_sample_rate", 0.5)
@@ -155,6 +170,25 @@ class BenchMark:
             logger.warning("[Benchmark] No benchmark URL configured, skipping upload")
             return
 
+        # Decide first, so payloads of dropped samples are never built
+        should_upload = False
+        if benchmark_mode == "all":
+            should_upload = True
+        elif benchmark_mode == "sample":
+            should_upload = random.random() < benchmark_sample_rate
+        else:
+            return
+
+        if not should_upload:
+            logger.debug(f"[Benchmark] Skipped {challenge_id} by sampling")
+            return
+
+        # Builders run before any await, so closures over a caller's loop variables are safe
+        if callable(ground_truth_tools):
+            ground_truth_tools = ground_truth_tools()
+        if callable(miners_answer):
+            miners_answer = miners_answer()
+
         # Prepare benchmark data
         benchmark_data = {
             "uid": uid,
@@ -178,28 +212,21 @@ class BenchMark:
             "blockHeight": block_height,
             "minersAnswer": miners_answer,
         }
+        # Integral floats become ints once, here, for Python/TypeScript consistency;
+        # flushing and the columnar layout reuse the entry as is
+        benchmark_encoding.normalize_in_place(benchmark_data)
 
-        # Determine if we should add this data
-        should_upload = False
-        if benchmark_mode == "all":
-            should_upload = True
-        elif benchmark_mode == "sample":
-            should_upload = random.random() < benchmark_sample_rate
-        else:
-            return
-
-        logger.debug(f"[Benchmark] Prepared benchmark data {benchmark_data}. {should_upload}")
+        logger.debug(f"[Benchmark] Prepared benchmark data {benchmark_data}.")
 
-        if should_upload:
-            # Add to pending uploads for this cid
-            if cid not in self.pending_uploads:
-                self.pending_uploads[cid] = []
-            
-            self.pending_uploads[cid].append(benchmark_data)
-            
-            # Check if batch size reached for this cid
-            if len(self.pending_uploads[cid]) >= benchmark_batch_size:
-                await self._flush_cid(cid)
+        # Add to pending uploads for this cid
+        if cid not in self.pending_uploads:
+            self.pending_uploads[cid] = []
+        
+        self.pending_uploads[cid].append(benchmark_data)
+        
+        # Check if batch size reached for this cid
+        if len(self.pending_uploads[cid]) >= benchmark_batch_size:
+            await self._flush_cid(cid)
 
     async def _flush_cid(self, cid: str):
         """Flush pending uploads for a specific cid"""
@@ -208,73 +235,74 @@ class BenchMark:
 
         batch = self.pending_uploads[cid]
         self.pending_uploads[cid] = []
-        normalized_batch = self._normalize_numbers(batch)
-        await self._send_to_server("challenge", normalized_batch)
+        encoding = self.ipc_meta_config.get("benchmark_encoding", benchmark_encoding.ENCODING_ROWS)
+        if encoding == benchmark_encoding.ENCODING_COLUMNAR:
+            batch = [self._encode_columnar(data) for data in batch]
+        await self._send_to_server("challenge", batch)
+
+    def _encode_columnar(self, data: dict) -> dict:
+        """Challenge entry with minersAnswer stored as one list per field"""
+        return {
+            **data,
+            "minersAnswer": benchmark_encoding.to_columnar(data["minersAnswer"]),
+            "minersAnswerEncoding": benchmark_encoding.ENCODING_COLUMNAR,
+        }
+
+    async def _send_to_server(self, typ: str, data_batch: list[dict]):
+        """Queue batch data for the background uploader"""
+        self.uploader.submit(typ, data_batch)
 
-    def _normalize_numbers(self, obj):
+    async def _post_batch(self, session: aiohttp.ClientSession, typ: str, data_batch: list[dict]) -> bool:
         """
-        Recursively normalize numbers to ensure consistency between Python and TypeScript:
-        - Convert float that are actually integers (e.g., 0.0, 1.0) to int
-        - This ensures JSON serialization matches between Python and TypeScript
+        Sign and send one batch to the benchmark server.
+        Returns False when the upload should be retried (network error, 429 or 5xx).
         """
-        if isinstance(obj, dict):
-            return {key: self._normalize_numbers(value) for key, value in obj.items()}
-        elif isinstance(obj, list):
-            return [self._normalize_numbers(item) for item in obj]
-        elif isinstance(obj, float):
-            # If the float is actually an integer, convert it
-            if obj.is_integer():
-                return int(obj)
-            return obj
-        else:
-            return obj
+        # Step 1: Add timestamp and normalize data
+        timestamp = int(time.time())
 
-    async def _send_to_server(self, typ: str, data_batch: list[dict]):
-        """Send batch data to benchmark server"""
-        try:
-            # Step 1: Add timestamp and normalize data
-            timestamp = int(time.time())
-
-            payload_to_hash = {
-                "data": data_batch,
-                "timestamp": timestamp,
-            }
-
-            import msgpack
-
-            b = msgpack.packb(
-                payload_to_hash,
-                use_bin_type=True,
-                strict_types=True
-            )
-            h = hashlib.sha256(b).hexdigest()
-
-            # Convert msgpack data to base64
-            b_base64 = base64.b64encode(b).decode('utf-8')
-
-            # Step 2: Sign the hash with wallet
-            signature = f"0x{self.wallet.hotkey.sign(h).hex()}"
-            
-            # Step 3: Send hash, signature, timestamp along with data
-            payload = {
-                "msgpack": b_base64,
-                "typ": typ,
-                "hash": h,
-                "validator": self.wallet.hotkey.ss58_address,
-                "signature": signature
-            }
-
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.ipc_meta_config.get("benchmark_url") or f"{os.environ.get('BOARD_SERVICE')}/benchmark/msgpack",
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as resp:
-                    if resp.status == 200:
-                        logger.debug(f"[Benchmark] Successfully uploaded {typ} {len(data_batch)} benchmark(s)")
-                    else:
-                        error_text = await resp.text()
-                        logger.error(f"[Benchmark] Upload {typ} failed with status {resp.status}: {error_text}")
-        except Exception as e:
-            logger.error(f"[Benchmark] Failed to upload {typ} benchmark data: {e}")
+        payload_to_hash = {
+            "data": data_batch,
+            "timestamp": timestamp,
+        }
+
+        import msgpack
+
+        b = msgpack.packb(
+            payload_to_hash,
+            use_bin_type=True,
+            strict_types=True
+        )
+        # Optional compression happens before hashing so the signature covers the bytes sent
+        compression = self.ipc_meta_config.get("benchmark_compression", benchmark_encoding.COMPRESSION_NONE)
+        b, compression = benchmark_encoding.compress(b, compression)
+        h = hashlib.sha256(b).hexdigest()
+
+        # Convert msgpack data to base64
+        b_base64 = base64.b64encode(b).decode('utf-8')
+
+        # Step 2: Sign the hash with wallet
+        signature = f"0x{self.wallet.hotkey.sign(h).hex()}"
+        
+        # Step 3: Send hash, signature, timestamp along with data
+        payload = {
+            "msgpack": b_base64,
+            "typ": typ,
+            "hash": h,
+            "validator": self.wallet.hotkey.ss58_address,
+            "signature": signature
+        }
+        if compression != benchmark_encoding.COMPRESSION_NONE:
+            payload["compression"] = compression
+
+        async with session.post(
+            self.ipc_meta_config.get("benchmark_url") or f"{os.environ.get('BOARD_SERVICE')}/benchmark/msgpack",
+            json=payload,
+            timeout=aiohttp.ClientTimeout(total=30)
+        ) as resp:
+            if resp.status == 200:
+                logger.debug(f"[Benchmark] Successfully uploaded {typ} {len(data_batch)} benchmark(s)")
+                return True
 
+            error_text = await resp.text()
+            logger.error(f"[Benchmark] Upload {typ} failed with status {resp.status}: {error_text}")
+            return not (resp.status == 429 or resp.status >= 500)
@@ -0,0 +1,80 @@
+"""
+Payload encodings for benchmark uploads.
+
+`rows` is the original layout: `minersAnswer` is a list of per-miner dicts.
+`columnar` stores it as one list per field (struct-of-arrays), so keys are
+written once per challenge instead of once per miner.
+"""
+import gzip
+
+try:
+    import zstandard
+except ImportError:  # optional dependency, gzip is used instead
+    zstandard = None
+
+
+ENCODING_ROWS = "rows"
+ENCODING_COLUMNAR = "columnar"
+
+COMPRESSION_NONE = "none"
+COMPRESSION_GZIP = "gzip"
+COMPRESSION_ZSTD = "zstd"
+
+
+def normalize_number(value):
+    """Integral floats (0.0, 1.0) become ints so Python and TypeScript serialize them alike."""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def normalize_in_place(obj):
+    """
+    Normalize numbers in nested dicts/lists in a single pass, rewriting only the
+    integral floats where they are; returns `obj` (or the normalized scalar).
+    """
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if isinstance(value, (dict, list)):
+                normalize_in_place(value)
+            elif isinstance(value, float) and value.is_integer():
+                obj[key] = int(value)
+    elif isinstance(obj, list):
+        for index, value in enumerate(obj):
+            if isinstance(value, (dict, list)):
+                normalize_in_place(value)
+            elif isinstance(value, float) and value.is_integer():
+                obj[index] = int(value)
+    else:
+        return normalize_number(obj)
+    return obj
+
+
+def to_columnar(rows: list[dict]) -> dict[str, list]:
+    """Convert a list of dicts sharing the same keys into one list per key (values are not copied)."""
+    if not rows:
+        return {}
+    columns: dict[str, list] = {key: [] for key in rows[0]}
+    for row in rows:
+        for key, column in columns.items():
+            column.append(row.get(key))
+    return columns
+
+
+def from_columnar(columns: dict[str, list]) -> list[dict]:
+    """Inverse of `to_columnar`."""
+    if not columns:
+        return []
+    keys = list(columns)
+    return [dict(zip(keys, values)) for values in zip(*columns.values())]
+
+
+def compress(data: bytes, method: str) -> tuple[bytes, str]:
+    """Compress with `method`, returning the bytes and the method actually used."""
+    if method == COMPRESSION_ZSTD:
+        if zstandard is not None:
+            return zstandard.ZstdCompressor(level=3).compress(data), COMPRESSION_ZSTD
+        method = COMPRESSION_GZIP
+    if method == COMPRESSION_GZIP:
+        return gzip.compress(data, compresslevel=6), COMPRESSION_GZIP
+    return data, COMPRESSION_NONE
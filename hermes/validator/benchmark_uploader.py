@@ -0,0 +1,192 @@
+import asyncio
+from pathlib import Path
+import time
+from typing import Awaitable, Callable
+import aiohttp
+from loguru import logger
+import msgpack
+
+
+class BenchmarkUploader:
+    """
+    Background delivery of benchmark batches to the board service.
+
+    `submit` never waits on the network: batches go to a bounded queue that a
+    single task drains, merging queued batches of the same type into one
+    request. Failed requests are retried with exponential backoff and then
+    spooled to disk as msgpack segments, which are replayed periodically and
+    on restart. When the queue is full, batches are spooled directly.
+
+    `send(session, typ, data_batch)` returns True when the batch is done with
+    (delivered, or rejected for good) and False when it should be retried.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[aiohttp.ClientSession, str, list[dict]], Awaitable[bool]],
+        spool_dir: str | Path = ".data/benchmark_spool",
+        max_queue_size: int = 1000,
+        max_batch_items: int = 200,
+        max_retries: int = 4,
+        retry_base_delay: float = 1.0,
+        replay_interval: float = 60.0,
+        max_spool_bytes: int = 512 * 1024 * 1024,
+    ):
+        self.send = send
+        self.spool_dir = Path(spool_dir)
+        self.max_queue_size = max_queue_size
+        self.max_batch_items = max_batch_items
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay  # seconds, doubled per attempt
+        self.replay_interval = replay_interval  # seconds
+        self.max_spool_bytes = max_spool_bytes
+        self._queue: asyncio.Queue | None = None
+        self._session: aiohttp.ClientSession | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._segment_seq = 0
+
+    def start(self):
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._tasks = [
+            asyncio.create_task(self._drain_loop()),
+            asyncio.create_task(self._replay_loop()),
+        ]
+
+    def submit(self, typ: str, data_batch: list[dict]):
+        """Queue a batch for upload; spools to disk when the queue is full."""
+        if not data_batch:
+            return
+        self.start()
+        try:
+            self._queue.put_nowait((typ, data_batch))
+        except asyncio.QueueFull:
+            logger.warning(f"[BenchmarkUploader] Queue full, spooling {typ} batch to disk")
+            self._spool([(typ, data_batch)])
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=4, keepalive_timeout=60)
+            )
+        return self._session
+
+    async def _drain_loop(self):
+        while True:
+            items = [await self._queue.get()]
+            while not self._queue.empty() and len(items) < self.max_batch_items:
+                items.append(self._queue.get_nowait())
+
+            # One request per type for everything queued so far
+            grouped: dict[str, list[dict]] = {}
+            for typ, data_batch in items:
+                grouped.setdefault(typ, []).extend(data_batch)
+
+            try:
+                while grouped:
+                    typ, data_batch = next(iter(grouped.items()))
+                    if not await self._send_with_retry(typ, data_batch):
+                        self._spool([(typ, data_batch)])
+                    del grouped[typ]
+            except asyncio.CancelledError:
+                # Shutting down mid-send: keep what was not delivered
+                self._spool(list(grouped.items()))
+                raise
+
+    async def _send_with_retry(self, typ: str, data_batch: list[dict]) -> bool:
+        for attempt in range(self.max_retries + 1):
+            try:
+                if await self.send(await self._get_session(), typ, data_batch):
+                    return True
+            except Exception as e:
+                logger.warning(f"[BenchmarkUploader] Upload {typ} attempt {attempt + 1} failed: {e}")
+            if attempt < self.max_retries:
+                await asyncio.sleep(self.retry_base_delay * (2 ** attempt))
+        return False
+
+    def _spool(self, records: list[tuple[str, list[dict]]]):
+        try:
+            self.spool_dir.mkdir(parents=True, exist_ok=True)
+            self._segment_seq += 1
+            self._write_segment(self.spool_dir / f"segment-{time.time_ns()}-{self._segment_seq}.msgpack", records)
+            self._enforce_spool_limit()
+        except Exception as e:
+            logger.error(f"[BenchmarkUploader] Failed to spool {len(records)} batch(es): {e}")
+
+    @staticmethod
+    def _write_segment(path: Path, records: list[tuple[str, list[dict]]]):
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(msgpack.packb([[typ, data_batch] for typ, data_batch in records], use_bin_type=True))
+        tmp_path.replace(path)
+
+    def _segments(self) -> list[Path]:
+        if not self.spool_dir.exists():
+            return []
+        return sorted(self.spool_dir.glob("segment-*.msgpack"), key=lambda p: p.name)
+
+    def _enforce_spool_limit(self):
+        segments = self._segments()
+        total = sum(p.stat().st_size for p in segments)
+        while segments and total > self.max_spool_bytes:
+            oldest = segments.pop(0)
+            total -= oldest.stat().st_size
+            oldest.unlink(missing_ok=True)
+            logger.warning(f"[BenchmarkUploader] Spool over {self.max_spool_bytes} bytes, dropped {oldest.name}")
+
+    async def _replay_loop(self):
+        while True:
+            await self.replay()
+            await asyncio.sleep(self.replay_interval)
+
+    async def replay(self):
+        """Resend spooled segments oldest first; stop at the first one that still fails."""
+        for path in self._segments():
+            try:
+                with open(path, "rb") as f:
+                    records = msgpack.unpackb(f.read(), raw=False)
+            except Exception as e:
+                logger.error(f"[BenchmarkUploader] Dropping unreadable spool segment {path.name}: {e}")
+                path.unlink(missing_ok=True)
+                continue
+
+            failed = []
+            for typ, data_batch in records:
+                try:
+                    if not await self.send(await self._get_session(), typ, data_batch):
+                        failed.append((typ, data_batch))
+                except Exception as e:
+                    logger.warning(f"[BenchmarkUploader] Replay {typ} failed: {e}")
+                    failed.append((typ, data_batch))
+
+            if failed:
+                # Keep the segment's place in line with only the undelivered batches
+                self._write_segment(path, failed)
+                return
+            path.unlink(missing_ok=True)
+            logger.info(f"[BenchmarkUploader] Replayed spool segment {path.name} ({len(records)} batch(es))")
+
+    async def close(self, timeout: float = 10.0):
+        """Give queued batches a short chance to go out, then spool the rest."""
+        if not self._tasks:
+            return
+
+        deadline = time.monotonic() + timeout
+        while not self._queue.empty() and time.monotonic() < deadline:
+            await asyncio.sleep(0.1)
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        leftovers = []
+        while not self._queue.empty():
+            leftovers.append(self._queue.get_nowait())
+        if leftovers:
+            self._spool(leftovers)
+
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
@@ -12,23 +12,30 @@ from langchain_openai import ChatOpenAI
 from loguru import logger
 from multiprocessing.synchronize import Event
 import numpy as np
-import torch
 
 from agent.subquery_graphql_agent.node_types import GraphqlProvider
 from hermes.validator.benchmark import BenchMark
+from hermes.validator.challenge_prefetcher import ChallengePrefetcher, PreparedChallenge
+from hermes.validator.ground_truth_cache import GroundTruthCache
 if TYPE_CHECKING:
     from neurons.validator import Validator
 from agent.stats import Phase, TokenUsageMetrics
 from common.agent_manager import AgentManager
-from common.enums import ChallengeType, ErrorCode, FailureType, ProjectPhase
+from common.block_height import BlockHeightService
+from common.enums import ChallengeType, ErrorCode, FailureType, ProjectPhase, RemoteChallengeType
 from common.protocol import SyntheticNonStreamSynapse
+from common.llm_scheduler import LLMScheduler, LLMWait, Priority, ScheduledChatOpenAI, llm_context, measure_llm_wait, set_llm_context
+from common.rate_limiter import AdaptiveRateLimiter
 from common.settings import Settings
+from common.shared_ring import SharedRingBuffer
 from common.table_formatter import table_formatter
 import common.utils as utils
 from hermes.validator.scorer_manager import ScorerManager
+from hermes.validator.state_store import StateStore
 from hermes.validator.workload_manager import WorkloadManager
 from hermes.validator.dendrite import HighConcurrencyDendrite
-from hermes.validator.multiprocess_query import query_miners_multiprocess
+from hermes.validator.miner_latency import MinerLatencyTracker
+from hermes.validator.multiprocess_query import QueryWorkerPool, dendrite_keep_alive, fill_missing_responses, query_miners_multiprocess
 
 
 @dataclass
@@ -48,6 +55,7 @@ class ChallengeManager:
     round_id: int
     challenge_interval: int
     dendrite: HighConcurrencyDendrite
+    query_worker_pool: QueryWorkerPool | None
     llm_synthetic: ChatOpenAI
     llm_score: ChatOpenAI
     agent_manager: AgentManager
@@ -57,7 +65,6 @@ class ChallengeManager:
     ipc_miners_dict: dict
     ipc_meta_config: dict
     event_stop: Event
-    scores: torch.Tensor
     token_usage_metrics: TokenUsageMetrics
     V: "Validator"
 
@@ -67,15 +74,17 @@ class ChallengeManager:
         save_project_dir: str | Path, 
         uid: int, 
         dendrite: HighConcurrencyDendrite,
-        organic_score_queue: list,
+        organic_score_queue: SharedRingBuffer | None,
         ipc_synthetic_score: list,
         ipc_miners_dict: dict,
         synthetic_model_name: str | None = None,
         score_model_name: str | None = None,
         ipc_meta_config: dict = None,
         ipc_common_config: dict = None,
+        ipc_block_heights: dict = None,
         event_stop: Event = None,
         ipc_synthetic_token_usage: list = None,
+        state_db_path: str | Path = None,
         score_state_path: str | Path = None,
         work_state_path: str | Path = None,
         v: "Validator" = None,
@@ -89,18 +98,97 @@ class ChallengeManager:
         self.forward_miner_timeout = int(os.getenv("FORWARD_MINER_TIMEOUT", 60 * 3))  # seconds
         logger.info(f"[ChallengeManager] Synthetic challenge interval set to {self.challenge_interval} seconds")
 
+        # Warm query workers kept across rounds; set QUERY_WORKER_POOL=false to spawn a pool per challenge
+        self.query_worker_pool = None
+        if os.getenv("QUERY_WORKER_POOL", "true").lower() == "true":
+            self.query_worker_pool = QueryWorkerPool(
+                size=min(settings.cpu_count, 8),  # Cap at 8 processes
+                job_grace_seconds=int(os.getenv("QUERY_WORKER_JOB_GRACE", 30)),  # seconds
+            )
+        self.dendrite_prewarm = os.getenv("DENDRITE_PREWARM", "false").lower() == "true"
+        if self.dendrite_prewarm and not dendrite_keep_alive():
+            logger.warning("[ChallengeManager] DENDRITE_PREWARM needs DENDRITE_KEEP_ALIVE=true, not prewarming")
+            self.dendrite_prewarm = False
+
+        # Cancel miner queries once they can no longer earn an elapse weight
+        self.early_cancel_miner_query = os.getenv("EARLY_CANCEL_MINER_QUERY", "true").lower() == "true"
+
+        # Number of projects whose challenges run at the same time within a round
+        self.project_concurrency = max(1, int(os.getenv("PROJECT_CONCURRENCY", 4)))
+
+        # Generate the next round's questions and ground truths during the interval sleep
+        self.challenge_prefetch = os.getenv("CHALLENGE_PREFETCH", "true").lower() == "true"
+        if self.dendrite_prewarm and not self.challenge_prefetch:
+            # Without prefetch, generating the challenges outlasts the connections' idle timeout
+            logger.warning("[ChallengeManager] DENDRITE_PREWARM needs CHALLENGE_PREFETCH=true, not prewarming")
+            self.dendrite_prewarm = False
+
+        # Reuse ground truths of replayed remote FIXED challenges
+        self.ground_truth_cache = None
+        if os.getenv("GROUND_TRUTH_CACHE", "true").lower() == "true":
+            self.ground_truth_cache = GroundTruthCache(
+                save_path=".data/ground_truth_cache.json",
+                max_size=int(os.getenv("GROUND_TRUTH_CACHE_SIZE", 256)),
+                ttl=int(os.getenv("GROUND_TRUTH_CACHE_TTL", 7 * 24 * 3600)),  # seconds
+            )
+
+        # Latest block lookups coalesced per indexer and shared with the API process
+        self.block_height_service = BlockHeightService(
+            ttl=float(os.getenv("BLOCK_HEIGHT_TTL", 3)),  # seconds
+            shared=ipc_block_heights,
+        )
+
+        # Balance query batches by each miner's observed latency and failure rate
+        self.miner_latency = None
+        if os.getenv("LATENCY_AWARE_PARTITION", "true").lower() == "true":
+            self.miner_latency = MinerLatencyTracker()
+
         self.uid = uid
         self.round_id = 1
         self.dendrite = dendrite
         self.token_usage_metrics = TokenUsageMetrics(datas=ipc_synthetic_token_usage)
         self.benchmark = BenchMark(self.settings.wallet, ipc_meta_config)
 
+        # One adaptive limiter in front of every LLM client of this process: it always honours 429 Retry-After,
+        # request (0 = no cap) and token budgets are opt-in
+        self.llm_rate_limiter = AdaptiveRateLimiter(
+            requests_per_second=float(os.getenv("LLM_RATE_LIMIT_RPS", 0)),
+            tokens_per_minute=float(os.getenv("LLM_RATE_LIMIT_TPM", 0)),
+            burst=float(os.getenv("LLM_RATE_LIMIT_BURST", 0)) or None,
+        )
+        llm_limit_args = self.llm_rate_limiter.chat_model_kwargs()
+
+        # Every LLM call of this process takes a slot; organic and prefetch work get a capped share
+        llm_max_concurrency = int(os.getenv("LLM_MAX_CONCURRENCY", 32))
+        self.llm_scheduler = LLMScheduler(
+            max_concurrency=llm_max_concurrency,
+            class_shares={
+                Priority.ORGANIC: float(os.getenv("LLM_ORGANIC_SHARE", 0.5)),
+                Priority.PREFETCH: float(os.getenv("LLM_PREFETCH_SHARE", 0.25)),
+            },
+            class_tokens_per_minute={
+                Priority.ORGANIC: int(os.getenv("LLM_ORGANIC_TPM", 0)),
+                Priority.PREFETCH: int(os.getenv("LLM_PREFETCH_TPM", 0)),
+            },
+        )
+        llm_limit_args["llm_scheduler"] = self.llm_scheduler
+
+        # Ground truth agents of every project share one client behind the limiter and scheduler
+        self.llm_graphql_agent = ScheduledChatOpenAI(
+            model=os.getenv("LLM_MODEL", "google/gemini-3-flash-preview"),
+            temperature=0,
+            timeout=300,
+            max_retries=3,
+            **llm_limit_args
+        )
+
         synthetic_model_name = synthetic_model_name or os.getenv("LLM_MODEL", "google/gemini-3-flash-preview")
-        self.llm_synthetic = ChatOpenAI(
+        self.llm_synthetic = ScheduledChatOpenAI(
             model=synthetic_model_name,
             temperature=1,
             timeout=120,
             max_retries=3,
+            **llm_limit_args
         )
 
         score_model_name = score_model_name or os.getenv("SCORE_LLM_MODEL", "google/gemini-3-flash-preview")
@@ -113,30 +201,50 @@ class ChallengeManager:
             score_model_args["api_key"] = score_model_api_key
 
         score_timeout = int(os.getenv("SCORE_TIMEOUT", 60))
-        self.llm_score = ChatOpenAI(
+        self.llm_score = ScheduledChatOpenAI(
             model=score_model_name,
             temperature=0,
             timeout=score_timeout,
             max_retries=3,
-            **score_model_args
+            **score_model_args,
+            **llm_limit_args
         )
 
         self.agent_manager = AgentManager(
             save_project_dir=Path(save_project_dir),
             llm_synthetic=self.llm_synthetic,
             ipc_common_config=ipc_common_config,
+            llm_graphql_agent=self.llm_graphql_agent,
         )
 
+        # Optional cheaper model grading first, escalating unsure answers to llm_score
+        score_fast_model_name = os.getenv("SCORE_FAST_LLM_MODEL", None)
+        self.llm_score_fast = ScheduledChatOpenAI(
+            model=score_fast_model_name,
+            temperature=0,
+            timeout=score_timeout,
+            max_retries=3,
+            **score_model_args,
+            **llm_limit_args
+        ) if score_fast_model_name else None
+
+        # Scoring state survives restarts in one SQLite store; older torch.save snapshots are imported once
+        self.state_store = None
+        if state_db_path:
+            self.state_store = StateStore(state_db_path)
+            self.state_store.import_legacy(score_state_path, work_state_path)
+
         self.scorer_manager = ScorerManager(
             llm_score=self.llm_score,
-            score_state_path=score_state_path,
-            ipc_meta_config=ipc_meta_config
+            state_store=self.state_store,
+            ipc_meta_config=ipc_meta_config,
+            llm_score_fast=self.llm_score_fast,
         )
 
         self.workload_manager = WorkloadManager(
             challenge_manager=self,
             organic_score_queue=organic_score_queue,
-            work_state_path=work_state_path,
+            state_store=self.state_store,
             token_usage_metrics=self.token_usage_metrics,
             ipc_meta_config=ipc_meta_config or {},
             benchmark=self.benchmark,
@@ -159,14 +267,14 @@ class ChallengeManager:
             self.block_time_seconds = 12.0
         buffer_blocks = int(self.epoch_submission_buffer_seconds / self.block_time_seconds)
         self.epoch_submission_buffer_blocks = max(1, buffer_blocks)
-        # self.scores = torch.zeros_like(torch.tensor(self.settings.metagraph.S), dtype=torch.float32)
-        # self.device = 'cpu'
         self.set_weight_interval = int(os.getenv("SET_WEIGHT_INTERVAL", 60 * 30))  # seconds
         
         logger.info(f"[ChallengeManager] Set weight interval to {self.set_weight_interval} seconds")
 
         logger.info(f"[ChallengeManager] Using LLM model: {synthetic_model_name} for synthetic challenge")
         logger.info(f"[ChallengeManager] Using LLM model: {score_model_name} for scoring")
+        if score_fast_model_name:
+            logger.info(f"[ChallengeManager] Using LLM model: {score_fast_model_name} for first-tier scoring")
         logger.info(f"[ChallengeManager] Using KEY: {utils.format_openai_key()}")
 
     async def start(self):
@@ -204,8 +312,18 @@ class ChallengeManager:
         except Exception as e:
             logger.error(f"[ChallengeManager] Failed to start challenge manager: {e}\n{traceback.format_exc()}")
             raise
+        finally:
+            if self.query_worker_pool is not None:
+                self.query_worker_pool.close()
+            await self.block_height_service.close()
+            await self.benchmark.close()
+            await self.llm_rate_limiter.aclose()
+            if self.state_store is not None:
+                await asyncio.to_thread(self.state_store.close)
 
     async def challenge_loop(self):
+        prefetcher = None
+        set_llm_context(Priority.SYNTHETIC)
         try:
             from hermes.validator.question_generator import QuestionGenerator
             question_generator = QuestionGenerator(
@@ -219,7 +337,31 @@ class ChallengeManager:
             miners_counter: dict[int, tuple[int, int]] = {}  # uid -> [success_count, total_count]
             challenge_interval = self.challenge_interval
 
+            if self.challenge_prefetch:
+                async def prepare(cid_hash, p):
+                    project_phase = self.agent_manager.get_project_phase(cid_hash)
+                    prepared, _, _ = await self.prepare_project_challenge(
+                        question_generator, cid_hash, p, block_cache, project_phase
+                    )
+                    return prepared
+
+                prefetcher = ChallengePrefetcher(
+                    prepare,
+                    self.block_height_service,
+                    concurrency=self.project_concurrency,
+                    max_age=int(os.getenv("CHALLENGE_PREFETCH_MAX_AGE", 60 * 60)),  # seconds
+                    max_drift=int(os.getenv("CHALLENGE_PREFETCH_MAX_DRIFT", 60 * 60)),  # seconds
+                    llm_scheduler=self.llm_scheduler,
+                )
+
             while not self.event_stop.is_set():
+                # Prepare the next round's challenges while waiting for it
+                if prefetcher is not None:
+                    prefetcher.start({
+                        cid_hash: p for cid_hash, p in self.agent_manager.get_local_projects().items()
+                        if not self.project_skip_reason(cid_hash)
+                    })
+
                 await asyncio.sleep(challenge_interval)
 
                 projects = self.agent_manager.get_local_projects()
@@ -263,264 +405,72 @@ class ChallengeManager:
                     challenge_interval = 30
                     continue
 
-                project_score_matrix = []
-                organic_success_score_threshold = self.ipc_meta_config.get("organic_success_score_threshold", 5)
-
-                for cid_hash, p in projects.items():
-                    allowed_cid_hashs_str = os.getenv("ALLOWED_PROJECT_CID_HASHS", "").strip()
-                    if allowed_cid_hashs_str:
-                        allowed_cid_hashs = allowed_cid_hashs_str.split(",")
-                        if cid_hash not in allowed_cid_hashs:
-                            logger.warning(f"[ChallengeManager] - {cid_hash} not in allowed list, skipping")
-                            continue
-                    
-                    if not self.agent_manager.is_project_enabled(cid_hash):
-                        logger.warning(f"[ChallengeManager] - {cid_hash} not enabled, skipping")
-                        continue
-                    
-                    # Retry loop: attempt to generate a valid challenge for this project
-                    max_retries = int(os.getenv("CHALLENGE_GENERATION_MAX_RETRIES", 3))
-                    challenge_generated = False
-                    error_msgs = []
-                    weight_a = self.ipc_meta_config.get("weight_a", 70)
-                    weight_b = self.ipc_meta_config.get("weight_b", 30)
-                    multi_coldkey_penalty = self.ipc_meta_config.get("multi_coldkey_penalty", 1)
-                    ema_score_alpha = self.ipc_meta_config.get("ema_score_alpha", 0.5)
-                    project_frequency = self.ipc_meta_config.get("project_frequency", {})
-                    q_metrics_data = None
-                    project_phase = self.agent_manager.get_project_phase(cid_hash)
+                # Same expected costs for the whole round so prewarm and queries split miners identically
+                query_costs = None
+                if self.miner_latency is not None:
+                    query_costs = self.miner_latency.expected_costs(uids, hotkeys, self.forward_miner_timeout)
 
-                    for attempt in range(max_retries):
-                        challenge_id = str(uuid4())
+                # Open keep-alive connections to this round's miners; prefetched challenges go out within seconds
+                if not skip_query_miner and self.query_worker_pool is not None and self.dendrite_prewarm:
+                    self.query_worker_pool.prewarm(uids, hotkeys, axons, ips, seen_ips, query_costs)
 
-                        # get latest block
-                        latest_block = await utils.get_latest_block(p.endpoint, p.node_type)
-                        if latest_block is None and block_cache.get(cid_hash, None) is None:
-                            logger.warning(f"[ChallengeManager] - {cid_hash} Failed to get latest block (attempt {attempt + 1}/{max_retries})")
-                            error_msgs.append(f"(round: {self.round_id}, attempt: {attempt + 1}/{max_retries}, {cid_hash}) Failed to get latest block.")
-                            continue
-                        
-                        if latest_block is not None:
-                            block_cache[cid_hash] = latest_block - 1000
-
-                        if p.node_type == GraphqlProvider.CODEX:
-                            weight_a = 100
-                            weight_b = 0
-
-                        # generate challenge
-                        question, typ, q_metrics_data, error, challenge = await question_generator.generate_question(
-                            cid_hash, 
-                            p,
-                            self.llm_synthetic,
-                            self.token_usage_metrics,
-                            round_id=self.round_id,
-                            weight_a=weight_a,      # normal
-                            weight_b=weight_b,      # tool
-                            project_frequency=project_frequency
-                        )
-
-                        if not question:
-                            logger.warning(f"[ChallengeManager] - {cid_hash} Failed to generate question (attempt {attempt + 1}/{max_retries})")
-                            error_msgs.append(f"(round: {self.round_id}, attempt: {attempt + 1}/{max_retries}, {cid_hash}) {error}")
-                            continue
-
-                        overwrite_block_height = challenge.block_height if challenge and challenge.block_height else None
-
-                        overwrite_msg = f", overwrite block {overwrite_block_height}" if overwrite_block_height else ""
-                        logger.info(f"[ChallengeManager] - {cid_hash} strategy: {typ}, Selected block height: {block_cache[cid_hash]}{overwrite_msg}")
-
-                        success, ground_truth, ground_cost, metrics_data, model_name = await self.generate_ground_truth(
-                            cid_hash=cid_hash,
-                            question=question,
-                            token_usage_metrics=self.token_usage_metrics,
-                            round_id=self.round_id,
-                            block_height=overwrite_block_height or block_cache[cid_hash]
-                        )
-
-                        is_valid = success and utils.is_ground_truth_valid(ground_truth)
-
-                        # Create challenge table
-                        table_formatter.create_synthetic_challenge_table(
-                            round_id=self.round_id,
-                            challenge_id=challenge_id,
-                            project_phase_str=utils.get_project_phase_str(project_phase),
-                            cid=cid_hash,
-                            question=question,
-                            success=is_valid,
-                            ground_truth=ground_truth,
-                            ground_cost=ground_cost,
-                            # metrics_data=utils.pick(metrics_data, ["phase", "input_tokens", "input_cache_read_tokens", "output_tokens", "timestamp", "round_id"])
-                            metrics_data=metrics_data
-                        )
-
-                        if not is_valid:
-                            logger.warning(f"[ChallengeManager] - {challenge_id} Invalid ground truth (attempt {attempt + 1}/{max_retries}): {ground_truth}")
-                            error_msgs.append(f"(round: {self.round_id}, attempt: {attempt + 1}/{max_retries}, {cid_hash}) Invalid ground truth: {ground_truth}")
-                            continue
-
-                        # Valid challenge generated, break retry loop
-                        challenge_generated = True
-                        question_generator.mark_success(question, cid_hash, typ, challenge)
-                        break
-
-                    # Skip this project if all retries failed
-                    if not challenge_generated:
-                        logger.error(f"[ChallengeManager] - {cid_hash} Failed to generate valid challenge after {max_retries} attempts")
-                        await self.benchmark.add_failure(
-                            uid=self.uid,
-                            round_id=self.round_id,
-                            address=self.settings.wallet.hotkey.ss58_address,
-                            version=self.settings.version,
-                            failure_type=FailureType.GENERATE_CHALLENGE.value,
-                            cid_hash=cid_hash,
-                            project_phase=project_phase,
-                            error_msgs=error_msgs
-                        )
-                        if project_phase != ProjectPhase.WARMUP.value:
-                            project_score_matrix.append([0.0] * len(uids))
-                        continue
-
-                    if skip_query_miner:
-                        if project_phase != ProjectPhase.WARMUP.value:
-                            project_score_matrix.append([0.0] * len(uids))
-                        continue
-
-                    # query all miner
-                    logger.info(f"[ChallengeManager] - {challenge_id} query miners: {uids}")
-
-                    responses = await query_miners_multiprocess(
-                        uids=uids,
-                        hotkeys=hotkeys,
-                        axons=axons,
-                        ips=ips,
-                        seen_ips=seen_ips,
-                        cid_hash=cid_hash,
-                        challenge_id=challenge_id,
-                        question=question,
-                        block_height=block_cache[cid_hash],
-                        timeout=self.forward_miner_timeout,
-                        settings=self.settings,
-                    )
+                project_score_matrix = []
+                organic_success_score_threshold = self.ipc_meta_config.get("organic_success_score_threshold", 5)
 
-                    logger.info(f"[ChallengeManager] - {challenge_id} query miners done")
-                    self.token_usage_metrics.append(metrics_data)
-
-                    # score result
-                    (
-                        zip_scores,
-                        ground_truth_scores,
-                        elapse_weights,
-                        miners_elapse_time,
-                        ground_truth_scores_error,
-                        ground_truth_scores_raw
-                    ) = await self.scorer_manager.compute_challenge_score(
-                        ground_truth,
-                        ground_cost,
-                        responses,
-                        challenge_id=challenge_id,
-                        cid_hash=cid_hash,
-                        token_usage_metrics=self.token_usage_metrics,
-                        min_latency_improvement_ratio=self.ipc_meta_config.get("min_latency_improvement_ratio", 0.2),
-                        round_id=self.round_id,
-                        node_type=p.node_type
-                    )
+                # Run projects concurrently; rows are collected in project order
+                project_semaphore = asyncio.Semaphore(self.project_concurrency)
+
+                async def run_project(cid_hash, p):
+                    async with project_semaphore:
+                        with llm_context(Priority.SYNTHETIC, cid_hash):
+                            return await self.run_project_challenge(
+                                question_generator,
+                                cid_hash,
+                                p,
+                                block_cache,
+                                miners_counter,
+                                uids,
+                                hotkeys,
+                                axons,
+                                ips,
+                                coldkeys,
+                                seen_ips,
+                                seen_coldkeys,
+                                query_costs,
+                                skip_query_miner,
+                                organic_success_score_threshold,
+                                prefetcher,
+                            )
 
-                    if project_phase != ProjectPhase.WARMUP.value:
-                        # Apply multi-coldkey penalty
-                        for idx, (uid, coldkey) in enumerate(zip(uids, coldkeys)):
-                            if coldkey and coldkey in seen_coldkeys:
-                                first_uid = seen_coldkeys[coldkey]
-                                if uid != first_uid:
-                                    zip_scores[idx] *= multi_coldkey_penalty
-                                    logger.warning(f"[ChallengeManager] Applied multi-coldkey penalty to UID {uid} (coldkey: {coldkey}, first_uid: {first_uid}, penalty: {multi_coldkey_penalty})")
+                project_results = await asyncio.gather(
+                    *(run_project(cid_hash, p) for cid_hash, p in projects.items()),
+                    return_exceptions=True
+                )
 
-                        project_score_matrix.append(zip_scores)
-                        
-                        # update miners counter
-                        for uid, truth_score in zip(uids, ground_truth_scores):
-                            success_count, total_count = miners_counter.get(uid, (0, 0))
-                            if truth_score >= organic_success_score_threshold:
-                                success_count += 1
-                            total_count += 1
-                            miners_counter[uid] = (success_count, total_count)
-
-                    table_formatter.create_synthetic_miners_response_table(
-                        round_id=self.round_id,
-                        challenge_id=challenge_id,
-                        uids=uids,
-                        hotkeys=hotkeys,
-                        responses=responses,
-                        ground_truth_scores=ground_truth_scores,
-                        ground_truth_scores_error=ground_truth_scores_error,
-                        elapse_weights=elapse_weights,
-                        zip_scores=zip_scores,
-                        cid=cid_hash,
-                        max_table_rows=int(os.getenv("MAX_TABLE_ROWS", 50))
+                # Siblings have finished by now, so surface the first failure as before
+                for result in project_results:
+                    if isinstance(result, BaseException):
+                        raise result
+
+                challenge_id = None
+                for project_challenge_id, score_row in project_results:
+                    challenge_id = project_challenge_id or challenge_id
+                    if score_row is not None:
+                        project_score_matrix.append(score_row)
+
+                logger.info(f"[ChallengeManager] Round {self.round_id} LLM rate limiter: {self.llm_rate_limiter.snapshot()}")
+                logger.info(f"[ChallengeManager] Round {self.round_id} LLM scheduler: {self.llm_scheduler.snapshot()}")
+                cascade_stats = self.scorer_manager.pop_cascade_stats(self.round_id)
+                if cascade_stats is not None:
+                    logger.info(
+                        f"[ChallengeManager] Round {self.round_id} scoring cascade: {cascade_stats.escalated}/{cascade_stats.graded} "
+                        f"escalated to the strong model ({cascade_stats.escalation_rate:.1%})"
                     )
-
-                    await self.benchmark.upload(
-                        uid=self.V.uid,
-                        address=self.settings.wallet.hotkey.ss58_address,
-                        version=self.settings.version,
-                        cid=cid_hash,
-                        challenge_type=ChallengeType.SYNTHETIC.value,
-                        challenge_id=challenge_id,
-                        project_phase=project_phase,
-                        question=question,
-                        question_generator_model_name=self.llm_synthetic.model_name,
-                        question_generator_metrics=utils.pick(
-                            q_metrics_data,
-                            ["input_tokens", "input_cache_read_tokens", "output_tokens", "tool_calls"]
-                        ) if q_metrics_data else None,
-                        ground_truth_model_name=model_name,
-                        score_model_name=self.llm_score.model_name,
-                        ground_truth=ground_truth if ground_truth else None,
-                        ground_cost=ground_cost,
-                        ground_truth_tools=[
-                            parsed for t in metrics_data.get("tool_calls", []) if (parsed := utils.safe_json_loads(t)) is not None
-                        ],
-                        ground_input_tokens=metrics_data.get("input_tokens", 0),
-                        ground_input_cache_read_tokens=metrics_data.get("input_cache_read_tokens", 0),
-                        ground_output_tokens=metrics_data.get("output_tokens", 0),
-                        block_height=str(block_cache[cid_hash]),
-
-                        miners_answer=[
-                            {
-                                "uid": uid,
-                                "address": hotkey,
-                                "minerModelName": resp.miner_model_name[:50] if resp.miner_model_name else "",
-                                "graphqlAgentModelName": resp.graphql_agent_model_name[:50] if resp.graphql_agent_model_name else "",
-                                "elapsed": elapse_time,
-                                "truthScore": truth_score,
-                                "truthScoreError": score_error[:255] if score_error else "",
-                                "truthScoreRaw": score_raw,
-                                "statusCode": resp.status_code,
-                                "error": resp.error,
-                                "answer": resp.response if resp.response else "",
-                                "inputTokens": resp.usage_info.get("input_tokens", 0) if resp.usage_info else 0,
-                                "inputCacheReadTokens": resp.usage_info.get("input_cache_read_tokens", 0) if resp.usage_info else 0,
-                                "outputTokens": resp.usage_info.get("output_tokens", 0) if resp.usage_info else 0,
-                                "forwardStartTime": resp.forward_start_time or 0,
-                                "recvStartTime": resp.recv_start_time or 0,
-                                # "toolCalls": [
-                                #     parsed for t in resp.usage_info.get("tool_calls", []) if (parsed := utils.safe_json_loads(t)) is not None
-                                # ] if resp.usage_info else [],
-                                "toolCalls": [],
-                                "toolCallsRaw": resp.usage_info.get("tool_calls", []) if resp.usage_info else [],
-                                
-                                # "graphqlAgentInnerToolCalls": [
-                                #     parsed for t in resp.graphql_agent_inner_tool_calls 
-                                #     if (parsed := utils.safe_json_loads(t)) is not None
-                                # ] if resp.graphql_agent_inner_tool_calls else [],
-
-                                "graphqlAgentInnerToolCalls": [],
-                                "graphqlAgentInnerToolCallsRaw": resp.graphql_agent_inner_tool_calls if resp.graphql_agent_inner_tool_calls else [],
-                            }
-                            for uid, hotkey, elapse_time, truth_score, score_error, score_raw, resp in zip(
-                                uids, hotkeys, miners_elapse_time, ground_truth_scores, ground_truth_scores_error, ground_truth_scores_raw, responses
-                            )
-                            if resp.status_code != ErrorCode.NOT_HEALTHY.value
-                        ],
+                score_cache_stats = self.scorer_manager.pop_score_cache_stats(self.round_id)
+                if score_cache_stats is not None:
+                    logger.info(
+                        f"[ChallengeManager] Round {self.round_id} score cache: {score_cache_stats.distinct} distinct answers, "
+                        f"{score_cache_stats.reused}/{score_cache_stats.total} reused ({score_cache_stats.hit_rate:.1%})"
                     )
 
                 if not project_score_matrix:
@@ -535,7 +485,7 @@ class ChallengeManager:
                     project_score_matrix,
                     workload_score,
                     challenge_id=challenge_id,
-                    ema_score_alpha=ema_score_alpha
+                    ema_score_alpha=self.ipc_meta_config.get("ema_score_alpha", 0.5)
                 )
                 self.ipc_synthetic_score[0] = self.scorer_manager.get_last_synthetic_scores()
                 self.ipc_synthetic_score[1] = miners_counter
@@ -567,6 +517,397 @@ class ChallengeManager:
         except Exception as e:
             logger.error(f"[ChallengeManager] Challenge loop error: {e}\n{traceback.format_exc()}")
             raise
+        finally:
+            if prefetcher is not None:
+                prefetcher.cancel()
+
+    def project_skip_reason(self, cid_hash: str) -> str | None:
+        allowed_cid_hashs_str = os.getenv("ALLOWED_PROJECT_CID_HASHS", "").strip()
+        if allowed_cid_hashs_str and cid_hash not in allowed_cid_hashs_str.split(","):
+            return "not in allowed list"
+        if not self.agent_manager.is_project_enabled(cid_hash):
+            return "not enabled"
+        return None
+
+    async def prepare_project_challenge(
+            self,
+            question_generator,
+            cid_hash: str,
+            p,
+            block_cache: dict[str, int],
+            project_phase: int,
+    ) -> tuple[PreparedChallenge | None, str | None, list[str]]:
+        """
+        Pick a block, generate a question and its ground truth, retrying up to
+        CHALLENGE_GENERATION_MAX_RETRIES times.
+        Returns the prepared challenge (None if every attempt failed), the last
+        challenge id and the per-attempt error messages.
+        """
+        # Retry loop: attempt to generate a valid challenge for this project
+        max_retries = int(os.getenv("CHALLENGE_GENERATION_MAX_RETRIES", 3))
+        error_msgs = []
+        weight_a = self.ipc_meta_config.get("weight_a", 70)
+        weight_b = self.ipc_meta_config.get("weight_b", 30)
+        project_frequency = self.ipc_meta_config.get("project_frequency", {})
+
+        challenge_id = None
+        for attempt in range(max_retries):
+            challenge_id = str(uuid4())
+
+            # get latest block
+            latest_block = await self.block_height_service.get(p.endpoint, p.node_type)
+            if latest_block is None and block_cache.get(cid_hash, None) is None:
+                logger.warning(f"[ChallengeManager] - {cid_hash} Failed to get latest block (attempt {attempt + 1}/{max_retries})")
+                error_msgs.append(f"(round: {self.round_id}, attempt: {attempt + 1}/{max_retries}, {cid_hash}) Failed to get latest block.")
+                continue
+
+            if latest_block is not None:
+                block_cache[cid_hash] = latest_block - 1000
+
+            if p.node_type == GraphqlProvider.CODEX:
+                weight_a = 100
+                weight_b = 0
+
+            # generate challenge
+            question, typ, q_metrics_data, error, challenge = await question_generator.generate_question(
+                cid_hash, 
+                p,
+                self.llm_synthetic,
+                self.token_usage_metrics,
+                round_id=self.round_id,
+                weight_a=weight_a,      # normal
+                weight_b=weight_b,      # tool
+                project_frequency=project_frequency
+            )
+
+            if not question:
+                logger.warning(f"[ChallengeManager] - {cid_hash} Failed to generate question (attempt {attempt + 1}/{max_retries})")
+                error_msgs.append(f"(round: {self.round_id}, attempt: {attempt + 1}/{max_retries}, {cid_hash}) {error}")
+                continue
+
+            overwrite_block_height = challenge.block_height if challenge and challenge.block_height else None
+
+            overwrite_msg = f", overwrite block {overwrite_block_height}" if overwrite_block_height else ""
+            logger.info(f"[ChallengeManager] - {cid_hash} strategy: {typ}, Selected block height: {block_cache[cid_hash]}{overwrite_msg}")
+
+            ground_truth_block_height = overwrite_block_height or block_cache[cid_hash]
+            is_fixed = challenge is not None and challenge.type == RemoteChallengeType.FIXED.value
+            cached = None
+            if is_fixed and self.ground_truth_cache is not None:
+                cached = self.ground_truth_cache.get(cid_hash, question, ground_truth_block_height)
+
+            if cached is not None:
+                success = True
+                ground_truth = cached["ground_truth"]
+                ground_cost = cached["ground_cost"]
+                metrics_data = cached["metrics_data"] or {}
+                model_name = cached["model_name"]
+            else:
+                success, ground_truth, ground_cost, metrics_data, model_name = await self.generate_ground_truth(
+                    cid_hash=cid_hash,
+                    question=question,
+                    token_usage_metrics=self.token_usage_metrics,
+                    round_id=self.round_id,
+                    block_height=ground_truth_block_height
+                )
+
+            is_valid = success and utils.is_ground_truth_valid(ground_truth)
+            if is_valid and is_fixed and cached is None and self.ground_truth_cache is not None:
+                self.ground_truth_cache.put(
+                    cid_hash, question, ground_truth_block_height, ground_truth, ground_cost, metrics_data, model_name
+                )
+
+            # Create challenge table
+            table_formatter.create_synthetic_challenge_table(
+                round_id=self.round_id,
+                challenge_id=challenge_id,
+                project_phase_str=utils.get_project_phase_str(project_phase),
+                cid=cid_hash,
+                question=question,
+                success=is_valid,
+                ground_truth=ground_truth,
+                ground_cost=ground_cost,
+                # metrics_data=utils.pick(metrics_data, ["phase", "input_tokens", "input_cache_read_tokens", "output_tokens", "timestamp", "round_id"])
+                metrics_data=metrics_data
+            )
+
+            if not is_valid:
+                logger.warning(f"[ChallengeManager] - {challenge_id} Invalid ground truth (attempt {attempt + 1}/{max_retries}): {ground_truth}")
+                error_msgs.append(f"(round: {self.round_id}, attempt: {attempt + 1}/{max_retries}, {cid_hash}) Invalid ground truth: {ground_truth}")
+                continue
+
+            # Valid challenge generated, the caller marks it played once it is used
+            prepared = PreparedChallenge(
+                challenge_id=challenge_id,
+                question=question,
+                q_metrics_data=q_metrics_data,
+                block_height=block_cache[cid_hash],
+                ground_truth=ground_truth,
+                ground_cost=ground_cost,
+                metrics_data=metrics_data,
+                model_name=model_name,
+                ground_truth_cached=cached is not None,
+                question_type=typ,
+                remote_challenge=challenge,
+                head_block=latest_block,
+            )
+            return prepared, challenge_id, error_msgs
+
+        logger.error(f"[ChallengeManager] - {cid_hash} Failed to generate valid challenge after {max_retries} attempts")
+        return None, challenge_id, error_msgs
+
+    async def run_project_challenge(
+            self,
+            question_generator,
+            cid_hash: str,
+            p,
+            block_cache: dict[str, int],
+            miners_counter: dict[int, tuple[int, int]],
+            uids: list[int],
+            hotkeys: list[str],
+            axons: list[str],
+            ips: list[str],
+            coldkeys: list[str],
+            seen_ips: dict,
+            seen_coldkeys: dict,
+            query_costs: list[float] | None,
+            skip_query_miner: bool,
+            organic_success_score_threshold: float,
+            prefetcher: ChallengePrefetcher | None = None,
+    ) -> tuple[str | None, list[float] | None]:
+        """
+        Generate (or take the prefetched), broadcast and score one project's synthetic challenge.
+        Returns the challenge id and the project's score row, which is None for
+        skipped and warmup projects.
+        """
+        skip_reason = self.project_skip_reason(cid_hash)
+        if skip_reason:
+            logger.warning(f"[ChallengeManager] - {cid_hash} {skip_reason}, skipping")
+            return None, None
+
+        multi_coldkey_penalty = self.ipc_meta_config.get("multi_coldkey_penalty", 1)
+        project_phase = self.agent_manager.get_project_phase(cid_hash)
+
+        prepared = None
+        if prefetcher is not None:
+            prepared = await prefetcher.take(cid_hash, p)
+        if prepared is None:
+            prepared, challenge_id, error_msgs = await self.prepare_project_challenge(
+                question_generator, cid_hash, p, block_cache, project_phase
+            )
+        else:
+            challenge_id = prepared.challenge_id
+        if prepared is not None:
+            question_generator.mark_success(prepared.question, cid_hash, prepared.question_type, prepared.remote_challenge)
+
+        # Skip this project if all retries failed
+        if prepared is None:
+            await self.benchmark.add_failure(
+                uid=self.uid,
+                round_id=self.round_id,
+                address=self.settings.wallet.hotkey.ss58_address,
+                version=self.settings.version,
+                failure_type=FailureType.GENERATE_CHALLENGE.value,
+                cid_hash=cid_hash,
+                project_phase=project_phase,
+                error_msgs=error_msgs
+            )
+            return challenge_id, None if project_phase == ProjectPhase.WARMUP.value else [0.0] * len(uids)
+
+        if skip_query_miner:
+            return challenge_id, None if project_phase == ProjectPhase.WARMUP.value else [0.0] * len(uids)
+
+        question = prepared.question
+        ground_truth = prepared.ground_truth
+        ground_cost = prepared.ground_cost
+        metrics_data = prepared.metrics_data
+        model_name = prepared.model_name
+        q_metrics_data = prepared.q_metrics_data
+        block_height = prepared.block_height
+
+        # query all miner
+        score_row = None
+        logger.info(f"[ChallengeManager] - {challenge_id} query miners: {uids}")
+
+        # A cached ground truth consumed no tokens this round
+        if not prepared.ground_truth_cached:
+            self.token_usage_metrics.append(metrics_data)
+
+        # Miners slower than this get zero elapse weight, so stop waiting for them
+        min_latency_improvement_ratio = self.ipc_meta_config.get("min_latency_improvement_ratio", 0.2)
+        query_deadline = None
+        if self.early_cancel_miner_query and ground_cost > 0:
+            query_deadline = utils.get_max_allowed_time(ground_cost, min_latency_improvement_ratio)
+
+        if self.query_worker_pool is not None:
+            # Responses stream in as miners answer, so scoring overlaps with slow miners
+            miner_stream = self.query_worker_pool.stream_miners(
+                uids=uids,
+                hotkeys=hotkeys,
+                axons=axons,
+                ips=ips,
+                seen_ips=seen_ips,
+                cid_hash=cid_hash,
+                challenge_id=challenge_id,
+                question=question,
+                block_height=block_height,
+                timeout=self.forward_miner_timeout,
+                deadline=query_deadline,
+                costs=query_costs,
+            )
+        else:
+            miner_stream = utils.aiter_indexed(await query_miners_multiprocess(
+                uids=uids,
+                hotkeys=hotkeys,
+                axons=axons,
+                ips=ips,
+                seen_ips=seen_ips,
+                cid_hash=cid_hash,
+                challenge_id=challenge_id,
+                question=question,
+                block_height=block_height,
+                timeout=self.forward_miner_timeout,
+                settings=self.settings,
+                deadline=query_deadline,
+                costs=query_costs,
+            ))
+
+        # query & score result
+        (
+            responses,
+            zip_scores,
+            ground_truth_scores,
+            elapse_weights,
+            miners_elapse_time,
+            ground_truth_scores_error,
+            ground_truth_scores_raw
+        ) = await self.scorer_manager.compute_challenge_score_stream(
+            ground_truth,
+            ground_cost,
+            miner_stream,
+            len(uids),
+            challenge_id=challenge_id,
+            cid_hash=cid_hash,
+            token_usage_metrics=self.token_usage_metrics,
+            min_latency_improvement_ratio=min_latency_improvement_ratio,
+            round_id=self.round_id,
+            node_type=p.node_type
+        )
+        logger.info(f"[ChallengeManager] - {challenge_id} query miners & scoring done")
+        # A miner the stream never delivered still owns its position
+        responses = fill_missing_responses(responses, uids, cid_hash, challenge_id, question, block_height)
+
+        if self.miner_latency is not None:
+            for uid, hotkey, r in zip(uids, hotkeys, responses):
+                # Worker failures say nothing about the miner
+                if r.status_code == ErrorCode.PROCESS_ERROR.value:
+                    continue
+                # Cut off at the scoring deadline: its real latency is unknown, and not below the deadline
+                timed_out = (
+                    r.status_code == ErrorCode.DEADLINE_EXCEEDED.value
+                    or ErrorCode.REQUEST_TIMEOUT.value in (r.status_code, r.dendrite_status_code)
+                )
+                self.miner_latency.observe(uid, hotkey, r.elapsed_time, timed_out)
+
+        if project_phase != ProjectPhase.WARMUP.value:
+            # Apply multi-coldkey penalty
+            for idx, (uid, coldkey) in enumerate(zip(uids, coldkeys)):
+                if coldkey and coldkey in seen_coldkeys:
+                    first_uid = seen_coldkeys[coldkey]
+                    if uid != first_uid:
+                        zip_scores[idx] *= multi_coldkey_penalty
+                        logger.warning(f"[ChallengeManager] Applied multi-coldkey penalty to UID {uid} (coldkey: {coldkey}, first_uid: {first_uid}, penalty: {multi_coldkey_penalty})")
+
+            score_row = zip_scores
+
+            # update miners counter
+            for uid, truth_score in zip(uids, ground_truth_scores):
+                success_count, total_count = miners_counter.get(uid, (0, 0))
+                if truth_score >= organic_success_score_threshold:
+                    success_count += 1
+                total_count += 1
+                miners_counter[uid] = (success_count, total_count)
+
+        table_formatter.create_synthetic_miners_response_table(
+            round_id=self.round_id,
+            challenge_id=challenge_id,
+            uids=uids,
+            hotkeys=hotkeys,
+            responses=responses,
+            ground_truth_scores=ground_truth_scores,
+            ground_truth_scores_error=ground_truth_scores_error,
+            elapse_weights=elapse_weights,
+            zip_scores=zip_scores,
+            cid=cid_hash,
+            max_table_rows=int(os.getenv("MAX_TABLE_ROWS", 50))
+        )
+
+        await self.benchmark.upload(
+            uid=self.V.uid,
+            address=self.settings.wallet.hotkey.ss58_address,
+            version=self.settings.version,
+            cid=cid_hash,
+            challenge_type=ChallengeType.SYNTHETIC.value,
+            challenge_id=challenge_id,
+            project_phase=project_phase,
+            question=question,
+            question_generator_model_name=self.llm_synthetic.model_name,
+            question_generator_metrics=utils.pick(
+                q_metrics_data,
+                ["input_tokens", "input_cache_read_tokens", "output_tokens", "tool_calls"]
+            ) if q_metrics_data else None,
+            ground_truth_model_name=model_name,
+            score_model_name=self.llm_score.model_name,
+            ground_truth=ground_truth if ground_truth else None,
+            ground_cost=ground_cost,
+            ground_truth_tools=lambda: [
+                parsed for t in metrics_data.get("tool_calls", []) if (parsed := utils.safe_json_loads(t)) is not None
+            ],
+            ground_input_tokens=metrics_data.get("input_tokens", 0),
+            ground_input_cache_read_tokens=metrics_data.get("input_cache_read_tokens", 0),
+            ground_output_tokens=metrics_data.get("output_tokens", 0),
+            block_height=str(block_height),
+
+            miners_answer=lambda: [
+                {
+                    "uid": uid,
+                    "address": hotkey,
+                    "minerModelName": resp.miner_model_name[:50] if resp.miner_model_name else "",
+                    "graphqlAgentModelName": resp.graphql_agent_model_name[:50] if resp.graphql_agent_model_name else "",
+                    "elapsed": elapse_time,
+                    "truthScore": truth_score,
+                    "truthScoreError": score_error[:255] if score_error else "",
+                    "truthScoreRaw": score_raw,
+                    "statusCode": resp.status_code,
+                    "error": resp.error,
+                    "answer": resp.response if resp.response else "",
+                    "inputTokens": resp.usage_info.get("input_tokens", 0) if resp.usage_info else 0,
+                    "inputCacheReadTokens": resp.usage_info.get("input_cache_read_tokens", 0) if resp.usage_info else 0,
+                    "outputTokens": resp.usage_info.get("output_tokens", 0) if resp.usage_info else 0,
+                    "forwardStartTime": resp.forward_start_time or 0,
+                    "recvStartTime": resp.recv_start_time or 0,
+                    # "toolCalls": [
+                    #     parsed for t in resp.usage_info.get("tool_calls", []) if (parsed := utils.safe_json_loads(t)) is not None
+                    # ] if resp.usage_info else [],
+                    "toolCalls": [],
+                    "toolCallsRaw": resp.usage_info.get("tool_calls", []) if resp.usage_info else [],
+
+                    # "graphqlAgentInnerToolCalls": [
+                    #     parsed for t in resp.graphql_agent_inner_tool_calls 
+                    #     if (parsed := utils.safe_json_loads(t)) is not None
+                    # ] if resp.graphql_agent_inner_tool_calls else [],
+
+                    "graphqlAgentInnerToolCalls": [],
+                    "graphqlAgentInnerToolCallsRaw": resp.graphql_agent_inner_tool_calls if resp.graphql_agent_inner_tool_calls else [],
+                }
+                for uid, hotkey, elapse_time, truth_score, score_error, score_raw, resp in zip(
+                    uids, hotkeys, miners_elapse_time, ground_truth_scores, ground_truth_scores_error, ground_truth_scores_raw, responses
+                )
+                if resp.status_code != ErrorCode.NOT_HEALTHY.value
+            ],
+        )
+
+        return challenge_id, score_row
 
     async def generate_ground_truth(
             self,
@@ -577,6 +918,7 @@ class ChallengeManager:
             block_height: int = 0,
         ) -> Tuple[bool, str | None, int, dict | None, str]:
         start_time = time.perf_counter()
+        llm_wait = LLMWait()
         success = False
         result = None
         metrics_data = None
@@ -587,12 +929,13 @@ class ChallengeManager:
                 raise ValueError(f"No server agent found for cid: {cid_hash}")
 
             model_name = agent.llm.model_name
-            response, _, _ = await agent.query_no_stream(
-                question,
-                prompt_cache_key=f"{cid_hash}_{start_time}",
-                is_synthetic=True,
-                block_height=block_height
-            )
+            with measure_llm_wait() as llm_wait:
+                response, _, _ = await agent.query_no_stream(
+                    question,
+                    prompt_cache_key=f"{cid_hash}_{start_time}",
+                    is_synthetic=True,
+                    block_height=block_height
+                )
 
             if os.getenv("LOG_GROUND_TRUTH", "").lower() == "true":
                 logger.info(f'------------------- Ground Truth Response for CID {cid_hash} ------------------ {response}')
@@ -624,7 +967,9 @@ class ChallengeManager:
             result = f"{e}"
 
         finally:
-            return [success, result, utils.fix_float(time.perf_counter() - start_time), metrics_data, model_name]
+            # ground_cost is what the agent's work took, not the time it queued behind this validator's other LLM calls
+            cost = max(0.0, time.perf_counter() - start_time - llm_wait.seconds)
+            return [success, result, utils.fix_float(cost), metrics_data, model_name]
 
     async def query_miner(
         self,
@@ -689,7 +1034,7 @@ class ChallengeManager:
             reason = "epoch-guard" if should_force_epoch_submission else "interval"
             try:
                 uids, scores = self._prepare_scores_for_submission()
-                if not uids:
+                if not len(uids):
                     uids, scores = self._build_fallback_uniform_weights()
                     if not uids:
                         logger.warning("[ChallengeManager] No miners available for fallback weight submission, burning.")
@@ -775,14 +1120,8 @@ class ChallengeManager:
 
         return False
 
-    def _prepare_scores_for_submission(self) -> tuple[list[int], list[float]]:
-        scores_dict = self.scorer_manager.get_last_overall_scores()
-        if not scores_dict:
-            return [], []
-        sorted_scores = sorted(scores_dict.items(), key=lambda item: item[0])
-        uids = [uid for uid, _ in sorted_scores]
-        scores = [score for _, (score, _) in sorted_scores]
-        return uids, scores
+    def _prepare_scores_for_submission(self) -> tuple[np.ndarray, np.ndarray]:
+        return self.scorer_manager.get_last_overall_score_arrays()
 
     def _build_fallback_uniform_weights(self) -> tuple[list[int], list[float]]:
         miner_uids = [uid for uid in list(self.ipc_miners_dict.keys()) if uid != self.uid]
@@ -793,13 +1132,14 @@ class ChallengeManager:
         # uniform_weight = 1.0 / count
         return miner_uids, [0] * count
 
-    async def _set_weights(self, uids: list[int], scores: list[float]):
+    async def _set_weights(self, uids: list[int] | np.ndarray, scores: list[float] | np.ndarray):
         logger.info(f"[ChallengeManager] set_weights for uids: {uids}, scores: {scores}")
+        uids = np.asarray(uids, dtype=np.int64)
         scores_np = np.array(scores, dtype=np.float32)
         burn_ratio = self.ipc_meta_config.get("burn_ratio", 0)
         burn_uid = self.settings.burn_uid
-        raw_uids_for_upload = [int(uid) for uid in uids]
-        raw_weights_for_upload = [float(score) for score in scores]
+        raw_uids_for_upload = uids.tolist()
+        raw_weights_for_upload = np.asarray(scores, dtype=np.float64).tolist()
 
         # Check if all scores are zero or burn_ratio is 1 (100% burn)
         if np.all(scores_np == 0) or burn_ratio >= 1.0:
@@ -823,8 +1163,9 @@ class ChallengeManager:
             # Apply burn ratio if configured
             if burn_ratio > 0 and burn_ratio < 1.0:
                 burn_idx = None
-                if burn_uid in uids:
-                    burn_idx = uids.index(burn_uid)
+                burn_matches = np.flatnonzero(uids == burn_uid)
+                if len(burn_matches):
+                    burn_idx = int(burn_matches[0])
                 
                 # Calculate scores_sum excluding burn_uid's current weight if it exists
                 if burn_idx is not None:
@@ -842,7 +1183,7 @@ class ChallengeManager:
                         scores_np[burn_idx] = burn_weight
                         logger.info(f"[ChallengeManager] Updated burn_uid={burn_uid} at index={burn_idx}, burn_ratio={burn_ratio*100:.1f}%, burn_weight={burn_weight:.4f}, miner_sum={scores_sum:.4f}")
                     else:
-                        uids = [burn_uid] + uids
+                        uids = np.concatenate([np.array([burn_uid], dtype=np.int64), uids])
                         scores_np = np.concatenate([np.array([burn_weight], dtype=np.float32), scores_np])
                         logger.info(f"[ChallengeManager] Inserted burn_uid={burn_uid} at index=0, burn_ratio={burn_ratio*100:.1f}%, burn_weight={burn_weight:.4f}, miner_sum={scores_sum:.4f}")
                 else:
@@ -852,7 +1193,7 @@ class ChallengeManager:
                 processed_weight_uids,
                 processed_weights,
             ) = bt.utils.weight_utils.process_weights_for_netuid(
-                    uids=np.array(uids, dtype=np.int64),
+                    uids=uids,
                     # weights = raw_weights.detach().cpu().numpy().astype(np.float32),
                     weights=scores_np,
                     netuid=self.settings.netuid,
@@ -0,0 +1,148 @@
+import asyncio
+from dataclasses import dataclass, field
+import time
+from typing import Awaitable, Callable
+from loguru import logger
+
+from common.block_height import BlockHeightService
+from common.llm_scheduler import LLMScheduler, Priority, current_llm_priority, llm_context, set_llm_context
+
+
+@dataclass
+class PreparedChallenge:
+    challenge_id: str
+    question: str
+    q_metrics_data: dict | None
+    block_height: int
+    ground_truth: str
+    ground_cost: float
+    metrics_data: dict
+    model_name: str
+    ground_truth_cached: bool = False
+    # Recorded as played by the question generator only once the challenge is used
+    question_type: str = ""
+    remote_challenge: object | None = None
+    head_block: int | None = None  # chain head read while preparing, None when the read failed
+    prepared_at: float = field(default_factory=time.time)
+
+
+class ChallengePrefetcher:
+    """
+    Prepares the next round's challenge (question + ground truth) for every
+    project while the validator sleeps between rounds, so a round can start
+    broadcasting to miners right away.
+    """
+
+    def __init__(
+        self,
+        prepare: Callable[[str, object], Awaitable[PreparedChallenge | None]],
+        block_heights: BlockHeightService,
+        concurrency: int = 4,
+        max_age: float = 3600,
+        max_drift: float = 3600,
+        llm_scheduler: LLMScheduler | None = None,
+    ):
+        self.prepare = prepare
+        self.block_heights = block_heights
+        self.max_age = max_age  # seconds
+        self.max_drift = max_drift  # seconds the challenge block may lag behind where it would be if prepared now
+        self.llm_scheduler = llm_scheduler
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._preparing: set[str] = set()  # past the semaphore, LLM calls under way
+
+    def start(self, projects: dict):
+        """Start preparing a challenge for each project that has none pending."""
+        for cid_hash in list(self._tasks):
+            if cid_hash not in projects:
+                self._tasks.pop(cid_hash).cancel()
+
+        for cid_hash, p in projects.items():
+            if cid_hash not in self._tasks:
+                self._tasks[cid_hash] = asyncio.create_task(self._run(cid_hash, p))
+
+    async def _run(self, cid_hash: str, p) -> PreparedChallenge | None:
+        # Prefetch LLM calls yield to the running round and organic work
+        with llm_context(Priority.PREFETCH, cid_hash):
+            async with self._semaphore:
+                self._preparing.add(cid_hash)
+                try:
+                    return await self.prepare(cid_hash, p)
+                finally:
+                    self._preparing.discard(cid_hash)
+
+    def _promote(self, cid_hash: str, task: asyncio.Task):
+        """Let a preparation the round now waits for finish at the round's priority."""
+        priority = current_llm_priority()
+        # The task's later LLM calls, and those already queued
+        task.get_context().run(set_llm_context, priority, cid_hash)
+        if self.llm_scheduler is not None:
+            self.llm_scheduler.promote(cid_hash, Priority.PREFETCH, priority)
+
+    async def take(self, cid_hash: str, p) -> PreparedChallenge | None:
+        """
+        Hand over the prepared challenge for `cid_hash`, waiting for it if still
+        being generated. Returns None when there is none or it went stale.
+
+        A preparation still queued behind other prefetches is dropped for the
+        caller to prepare itself; one under way is raised to the caller's priority.
+        """
+        task = self._tasks.pop(cid_hash, None)
+        if task is None:
+            return None
+
+        if not task.done():
+            if cid_hash not in self._preparing:
+                task.cancel()
+                return None
+            logger.info(f"[ChallengePrefetcher] - {cid_hash} waiting for its challenge, raised to {current_llm_priority().name}")
+            self._promote(cid_hash, task)
+
+        try:
+            prepared = await task
+        except asyncio.CancelledError:
+            return None
+        except Exception as e:
+            logger.warning(f"[ChallengePrefetcher] - {cid_hash} prefetch failed: {e}")
+            return None
+
+        if prepared is None:
+            return None
+
+        age = time.time() - prepared.prepared_at
+        if age > self.max_age:
+            logger.info(f"[ChallengePrefetcher] - {cid_hash} prepared challenge expired ({age:.0f}s old)")
+            return None
+
+        latest_block = await self.block_heights.get(p.endpoint, p.node_type)
+        drift = self.drift_seconds(prepared, latest_block)
+        if drift is not None and drift > self.max_drift:
+            logger.info(
+                f"[ChallengePrefetcher] - {cid_hash} prepared challenge too far behind "
+                f"(block {prepared.block_height}, latest {latest_block}, ~{drift:.0f}s)"
+            )
+            return None
+
+        logger.info(f"[ChallengePrefetcher] - {prepared.challenge_id} using prepared challenge for {cid_hash} ({age:.0f}s old)")
+        return prepared
+
+    @staticmethod
+    def drift_seconds(prepared: PreparedChallenge, latest_block: int | None) -> float | None:
+        """
+        How far the challenge block lags behind the block a fresh preparation
+        would pick, in seconds. Block times differ per chain, so blocks are
+        converted with the rate the head advanced since preparation. None when
+        it can't be told (no head reads, or the head didn't move).
+        """
+        if latest_block is None or prepared.head_block is None:
+            return None
+        elapsed = time.time() - prepared.prepared_at
+        advanced = latest_block - prepared.head_block
+        if elapsed <= 0 or advanced <= 0:
+            return None
+        return (latest_block - 1000 - prepared.block_height) * elapsed / advanced
+
+    def cancel(self):
+        for task in self._tasks.values():
+            task.cancel()
+        self._tasks.clear()
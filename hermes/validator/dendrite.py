@@ -1,30 +1,125 @@
+import asyncio
+from dataclasses import dataclass
+import time
+from types import SimpleNamespace
 import aiohttp
 import bittensor as bt
 
+
+@dataclass
+class ConnectionMetrics:
+    created: int = 0
+    reused: int = 0
+    connect_time_total: float = 0.0
+    connect_time_max: float = 0.0
+
+    def snapshot(self) -> dict:
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "connect_time_total": self.connect_time_total,
+            "connect_time_max": self.connect_time_max,
+        }
+
+    @staticmethod
+    def diff(after: dict, before: dict) -> dict:
+        created = after["created"] - before["created"]
+        reused = after["reused"] - before["reused"]
+        connect_time = after["connect_time_total"] - before["connect_time_total"]
+        total = created + reused
+        return {
+            "created": created,
+            "reused": reused,
+            "reuse_ratio": round(reused / total, 4) if total else 0.0,
+            "avg_connect_ms": round(connect_time / created * 1000, 2) if created else 0.0,
+        }
+
+
 class HighConcurrencyDendrite(bt.dendrite):
-    def __init__(self, wallet: bt.Wallet=None, max_connections=500, total_timeout=300):
+    def __init__(
+        self,
+        wallet: bt.Wallet=None,
+        max_connections=500,
+        total_timeout=300,
+        keep_alive: bool = False,
+        keepalive_timeout: float = 60,
+    ):
         super().__init__(wallet)
         self.max_connections = max_connections
-        self.total_timeout = total_timeout  
+        self.total_timeout = total_timeout
+        self.keep_alive = keep_alive  # reuse per-host sockets across requests instead of force_close
+        self.keepalive_timeout = keepalive_timeout  # idle pooled connections are evicted after this many seconds
+        self.connection_metrics = ConnectionMetrics()
         self._custom_session = None
-    
+
     @property
     async def session(self) -> aiohttp.ClientSession:
         """Override session property with custom limits"""
         if self._custom_session is None:
+            connector_args = {}
+            if self.keep_alive:
+                connector_args["keepalive_timeout"] = self.keepalive_timeout
+            else:
+                connector_args["force_close"] = True
+
             connector = aiohttp.TCPConnector(
                 limit=self.max_connections,
                 limit_per_host=100, #  100 concurrent requests per IP (to prevent overloading a single IP)
                 ttl_dns_cache=300,  # 5 minutes
-                force_close=True,
-                enable_cleanup_closed=True
+                enable_cleanup_closed=True,
+                **connector_args,
             )
             self._custom_session = aiohttp.ClientSession(
                 connector=connector,
-                timeout=aiohttp.ClientTimeout(total=self.total_timeout)
+                timeout=aiohttp.ClientTimeout(total=self.total_timeout),
+                trace_configs=[self._build_trace_config()],
             )
         return self._custom_session
-    
+
+    def _build_trace_config(self) -> aiohttp.TraceConfig:
+        """Record connection creation/reuse counts and connect time"""
+        metrics = self.connection_metrics
+
+        async def on_create_start(session, ctx: SimpleNamespace, params):
+            ctx.connect_start = time.perf_counter()
+
+        async def on_create_end(session, ctx: SimpleNamespace, params):
+            elapsed = time.perf_counter() - getattr(ctx, "connect_start", time.perf_counter())
+            metrics.created += 1
+            metrics.connect_time_total += elapsed
+            metrics.connect_time_max = max(metrics.connect_time_max, elapsed)
+
+        async def on_reuse(session, ctx: SimpleNamespace, params):
+            metrics.reused += 1
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_start.append(on_create_start)
+        trace_config.on_connection_create_end.append(on_create_end)
+        trace_config.on_connection_reuseconn.append(on_reuse)
+        return trace_config
+
+    async def prewarm(self, axons: list[bt.AxonInfo], timeout: float = 5) -> int:
+        """
+        Open pooled connections to the given axons ahead of a query.
+        Only meaningful in keep-alive mode; returns the number of reachable endpoints.
+        """
+        if not self.keep_alive:
+            return 0
+
+        session = await self.session
+        urls = {self._get_endpoint_url(axon, "") for axon in axons if axon is not None}
+
+        async def touch(url: str) -> bool:
+            try:
+                async with session.head(url, timeout=aiohttp.ClientTimeout(total=timeout)) as resp:
+                    await resp.read()
+                return True
+            except Exception:
+                return False
+
+        results = await asyncio.gather(*(touch(url) for url in urls))
+        return sum(results)
+
     async def aclose_session(self):
         """Override close method"""
         if self._custom_session:
@@ -1,76 +1,105 @@
+from typing import Sequence
 from loguru import logger
-import common.utils as utils
+import numpy as np
 
-class EMAUpdater:
-    def __init__(self, alpha=0.5):
-        self.alpha = alpha
-
-        # {uid: (score, hotkey) }
-        self._last_scores = {}
-
-    def update(self, cur_uids: list[int], cur_hotkeys: list[str], cur_scores: list[float], suspicious_uids: list[int], alpha: float | None = None):
-        cur_dict_score = dict(zip(cur_uids, cur_scores))
-        cur_dict_hotkeys = dict(zip(cur_uids, cur_hotkeys))
-        new_scores = {}
-        alpha = alpha if alpha is not None else self.alpha
 
-        # find out all possible uids (including last and cur)
-        all_uids = set(self._last_scores.keys()) | set(cur_dict_score.keys())
-        
-        for uid in all_uids:
-            last_val, last_hk = self._last_scores.get(uid, (None, None))
-            cur_val = cur_dict_score.get(uid, None)
-
-            if last_val is None and cur_val is not None:
-                # new uid -> last defaults to 0
-                last_val = cur_val
-
-            elif last_val is not None and cur_val is None:
-                # disappeared uid -> cur defaults to 0
-                cur_val = 0
-
-            cur_hk = cur_dict_hotkeys.get(uid, None)
-            if cur_hk and last_hk and cur_hk != last_hk:
-                logger.info(f"UID {uid} hotkey changed from {last_hk} to {cur_hk}. Resetting EMA.")
-                # hotkey changed, reset last_val to cur_val
-                last_val = cur_val
+class EMAUpdater:
+    """
+    EMA of miner scores in a table indexed directly by uid, with a hotkey column.
 
-            if suspicious_uids and uid in suspicious_uids:
-                last_val = 0
-                cur_val = 0
-            # calculate EMA
-            new_scores[uid] = (utils.fix_float((1 - alpha) * last_val + alpha * cur_val), cur_hk)
+    A uid seen for the first time starts at its current score, a uid missing
+    from a round decays towards 0, a new hotkey on a uid restarts its EMA and
+    suspicious uids are zeroed. Every round is a handful of vector operations
+    over the table, whatever the number of uids.
+    """
 
-        self._last_scores = new_scores
+    def __init__(self, alpha=0.5, capacity: int = 256):
+        self.alpha = alpha
 
-        # logger.info(f"EMA updated scores: {self._last_scores}")
-        return new_scores
+        self._scores = np.zeros(capacity, dtype=np.float64)
+        self._hotkeys = np.full(capacity, "", dtype=object)  # "" = unknown
+        self._present = np.zeros(capacity, dtype=bool)  # uid has a score
+        self._last_scores: dict[int, tuple[float, str | None]] | None = {}  # dict view, built on demand
 
-    def load(self, state: dict[str, tuple[float, str]]):
+    def _reserve(self, max_uid: int):
+        size = len(self._scores)
+        if max_uid < size:
+            return
+        new_size = max(max_uid + 1, size * 2)
+        self._scores = np.concatenate([self._scores, np.zeros(new_size - size, dtype=np.float64)])
+        self._hotkeys = np.concatenate([self._hotkeys, np.full(new_size - size, "", dtype=object)])
+        self._present = np.concatenate([self._present, np.zeros(new_size - size, dtype=bool)])
+
+    def update(
+        self,
+        cur_uids: Sequence[int] | np.ndarray,
+        cur_hotkeys: Sequence[str] | np.ndarray,
+        cur_scores: Sequence[float] | np.ndarray,
+        suspicious_uids: Sequence[int] | None,
+        alpha: float | None = None,
+    ):
+        alpha = alpha if alpha is not None else self.alpha
+        cur_uids = np.asarray(cur_uids, dtype=np.int64)
+        if len(cur_uids):
+            self._reserve(int(cur_uids.max()))
+
+        size = len(self._scores)
+        seen = np.zeros(size, dtype=bool)
+        seen[cur_uids] = True
+        cur = np.zeros(size, dtype=np.float64)  # disappeared uids -> cur defaults to 0
+        cur[cur_uids] = np.asarray(cur_scores, dtype=np.float64)
+        cur_hk = np.full(size, "", dtype=object)
+        cur_hk[cur_uids] = [hk or "" for hk in cur_hotkeys]
+
+        # new uid -> last defaults to cur
+        last = np.where(self._present, self._scores, cur)
+
+        # hotkey changed -> reset last to cur
+        changed = seen & self._present & (cur_hk != "") & (self._hotkeys != "") & (cur_hk != self._hotkeys)
+        for uid in np.flatnonzero(changed):
+            logger.info(f"UID {uid} hotkey changed from {self._hotkeys[uid]} to {cur_hk[uid]}. Resetting EMA.")
+        last[changed] = cur[changed]
+
+        if suspicious_uids:
+            suspicious = np.asarray(suspicious_uids, dtype=np.int64)
+            suspicious = suspicious[(suspicious >= 0) & (suspicious < size)]
+            last[suspicious] = 0
+            cur[suspicious] = 0
+
+        active = self._present | seen
+        ema = (1 - alpha) * last + alpha * cur
+        # Same truncation to 2 decimals as utils.fix_float
+        self._scores = np.where(active, np.trunc(ema * 100) / 100, 0.0)
+        self._hotkeys = cur_hk
+        self._present = active
+        self._last_scores = None
+
+    def load(self, state: dict[int, tuple[float, str]]):
         if not state:
             return
-        self._last_scores = state
-        return self._last_scores
+        uids = np.fromiter((int(uid) for uid in state), dtype=np.int64, count=len(state))
+        size = max(len(self._scores), int(uids.max()) + 1)
+        self._scores = np.zeros(size, dtype=np.float64)
+        self._hotkeys = np.full(size, "", dtype=object)
+        self._present = np.zeros(size, dtype=bool)
+        self._scores[uids] = [score for score, _ in state.values()]
+        self._hotkeys[uids] = [hotkey or "" for _, hotkey in state.values()]
+        self._present[uids] = True
+        self._last_scores = None
+        return self.last_scores
+
+    def arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        """`(uids, scores)` of every uid with a score, ordered by uid."""
+        uids = np.flatnonzero(self._present)
+        return uids, self._scores[uids]
 
     @property
-    def last_scores(self):
+    def last_scores(self) -> dict[int, tuple[float, str | None]]:
+        """{uid: (score, hotkey)}, hotkey None for uids missing from the last round."""
+        if self._last_scores is None:
+            uids, scores = self.arrays()
+            self._last_scores = {
+                uid: (score, hotkey or None)
+                for uid, score, hotkey in zip(uids.tolist(), scores.tolist(), self._hotkeys[uids].tolist())
+            }
         return self._last_scores
-
-# if __name__ == "__main__":
-#     ema = EMAUpdater(alpha=0.7)
-
-#     print("first:")
-#     # {1: 5.0, 2: 7.0, 3: 9.0}
-#     print(ema.update([1, 2, 3], [5, 7, 9]))
-
-#     print("second (add 4):")
-#     # {1: 5.699999999999999, 2: 7.7, 3: 9.7, 4: 12.0}
-#     print(ema.update([1, 2, 3, 4], [6, 8, 10, 12]))
-
-#     print("third (remove 3):")
-#     # {1: 8.71, 2: 16.310000000000002, 3: 2.91, 4: 3.6000000000000005}
-#     print(ema.update([1, 2], [10, 20]))
-
-#     print("fourth (3 disappeared, 4 returned):")
-#     # {1: 8.213000000000001, 2: 13.293, 3: 0.8730000000000002, 4: 4.58}
-#     print(ema.update([1, 2, 4], [8, 12, 5]))
\ No newline at end of file
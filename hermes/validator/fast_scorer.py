@@ -0,0 +1,122 @@
+"""
+Deterministic pre-scoring of short factual answers.
+
+Numbers, hex addresses/hashes and SS58 addresses are pulled out of the
+ground truth and the miner answer. When the answer states exactly the same
+facts in the same order it is a match; when it states facts and none of
+them is the ground truth's (or close to it, or the same value in another
+unit) it is a contradiction. Everything in between is left to the LLM.
+
+Numbers keep the precision they were written with ("1.2 million" is
+1.2E+6, good to 1E+5), so a rounded answer counts as close, not as a
+contradiction.
+"""
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+import re
+
+
+_HEX = re.compile(r"0x[0-9a-fA-F]{8,}")
+_SS58 = re.compile(r"\b[1-9A-HJ-NP-Za-km-z]{46,48}\b")
+# Not followed by a word character or more decimals, so "1.23M" can't backtrack to "1"
+_NUMBER = re.compile(
+    r"(?<![\w.,-])(?P<value>-?(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?(?:[eE][+-]?\d+)?)"
+    r"(?:(?P<suffix>[kKMB]|bn)|\s+(?P<word>(?i:thousand|million|billion|trillion)))?"
+    r"(?![\w]|\.\d)"
+)
+_MAGNITUDES = {"k": 3, "thousand": 3, "m": 6, "million": 6, "b": 9, "bn": 9, "billion": 9, "trillion": 12}
+_WORD = re.compile(r"[A-Za-z]{2,}")
+# Powers of ten between common units: percent, thousands/millions, token decimals (8, 9, 12, 18)
+_UNIT_EXPONENTS = {0, 2, 3, 6, 8, 9, 12, 18}
+
+MATCH = "match"
+CONTRADICTION = "contradiction"
+
+
+@dataclass
+class FastScore:
+    score: float
+    decision: str  # MATCH or CONTRADICTION
+
+
+def extract_facts(text: str) -> list[str | Decimal]:
+    """Identifiers (lower-cased) and numbers of `text`, in order of appearance."""
+    found: list[tuple[int, str | Decimal]] = []
+    for pattern in (_HEX, _SS58):
+        for m in pattern.finditer(text):
+            found.append((m.start(), m.group().lower() if pattern is _HEX else m.group()))
+        # Digits inside identifiers are not numbers
+        text = pattern.sub(lambda m: " " * len(m.group()), text)
+
+    for m in _NUMBER.finditer(text):
+        try:
+            value = Decimal(m.group("value").replace(",", ""))
+        except InvalidOperation:
+            continue
+        magnitude = m.group("suffix") or m.group("word")
+        # scaleb keeps the written precision in the exponent
+        found.append((m.start(), value.scaleb(_MAGNITUDES[magnitude.lower()]) if magnitude else value))
+
+    found.sort(key=lambda item: item[0])
+    return [fact for _, fact in found]
+
+
+def _half_unit(n: Decimal) -> Decimal:
+    """Rounding error of `n` at the precision it was written with."""
+    return Decimal(5).scaleb(n.as_tuple().exponent - 1)
+
+
+def _related(a: Decimal, b: Decimal, tolerance: Decimal) -> bool:
+    """
+    Close to each other, or equal once rounded to the coarser one's precision,
+    possibly after a power-of-ten unit change (wei/ether, % vs ratio).
+    """
+    if a == 0 or b == 0:
+        return a == b
+    ratio = abs(a / b)
+    exponent = round(ratio.log10())
+    if abs(exponent) not in _UNIT_EXPONENTS:
+        return False
+    b = b.scaleb(exponent)
+    return abs(a / b - 1) <= tolerance or abs(a - b) <= max(_half_unit(a), _half_unit(b))
+
+
+class FastScorer:
+    """Scores an answer without the LLM when its facts clearly agree or disagree with the ground truth."""
+
+    def __init__(
+        self,
+        match_score: float = 10.0,
+        contradiction_score: float = 0.0,
+        tolerance: float = 0.01,
+        min_words: int = 3,
+    ):
+        self.match_score = match_score
+        self.contradiction_score = contradiction_score
+        self.tolerance = Decimal(str(tolerance))  # relative, for "close" numbers
+        self.min_words = min_words  # fewer words than this is treated as raw data
+
+    def score(self, ground_truth: str, answer: str) -> FastScore | None:
+        """A score when the decision is clear, else None."""
+        stripped = answer.strip()
+        if stripped.startswith(("{", "[")) or len(_WORD.findall(stripped)) < self.min_words:
+            # Raw data is capped by the rubric, not matched on facts
+            return None
+
+        truth_facts = extract_facts(ground_truth)
+        answer_facts = extract_facts(answer)
+        if not truth_facts or not answer_facts:
+            return None
+
+        if answer_facts == truth_facts:
+            return FastScore(self.match_score, MATCH)
+
+        truth_ids = {f for f in truth_facts if isinstance(f, str)}
+        truth_numbers = [f for f in truth_facts if isinstance(f, Decimal)]
+        for fact in answer_facts:
+            if isinstance(fact, str):
+                if fact in truth_ids:
+                    return None
+            elif any(_related(fact, n, self.tolerance) for n in truth_numbers):
+                return None
+        return FastScore(self.contradiction_score, CONTRADICTION)
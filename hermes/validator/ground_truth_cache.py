@@ -0,0 +1,100 @@
+from collections import OrderedDict
+import hashlib
+import json
+from pathlib import Path
+import time
+from loguru import logger
+
+
+class GroundTruthCache:
+    """
+    LRU cache of ground truths for replayed remote FIXED challenges, keyed by
+    (cid_hash, question, block_height). Entries keep the cost measured when the
+    ground truth was first generated, so latency weighting is unchanged on a hit.
+    """
+
+    def __init__(self, save_path: str | None = None, max_size: int = 256, ttl: float = 7 * 24 * 3600):
+        self.save_path = save_path
+        self.max_size = max_size
+        self.ttl = ttl  # seconds
+        self.entries: OrderedDict[str, dict] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    @staticmethod
+    def make_key(cid_hash: str, question: str, block_height: int) -> str:
+        digest = hashlib.sha256(question.strip().encode("utf-8")).hexdigest()
+        return f"{cid_hash}:{block_height}:{digest}"
+
+    def get(self, cid_hash: str, question: str, block_height: int) -> dict | None:
+        key = self.make_key(cid_hash, question, block_height)
+        entry = self.entries.get(key)
+        if entry is not None and time.time() - entry["created_at"] > self.ttl:
+            del self.entries[key]
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.entries.move_to_end(key)
+        self.hits += 1
+        logger.info(f"[GroundTruthCache] - {cid_hash} hit at block {block_height} (hits: {self.hits}, misses: {self.misses})")
+        return entry
+
+    def put(
+        self,
+        cid_hash: str,
+        question: str,
+        block_height: int,
+        ground_truth: str,
+        ground_cost: float,
+        metrics_data: dict | None,
+        model_name: str,
+    ):
+        key = self.make_key(cid_hash, question, block_height)
+        self.entries[key] = {
+            "ground_truth": ground_truth,
+            "ground_cost": ground_cost,
+            "metrics_data": metrics_data,
+            "model_name": model_name,
+            "created_at": time.time(),
+        }
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+        self._save()
+
+    def _load(self):
+        if not self.save_path:
+            return
+
+        try:
+            path = Path(self.save_path)
+            if path.exists():
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                now = time.time()
+                for key, entry in data.items():
+                    if now - entry.get("created_at", 0) <= self.ttl:
+                        self.entries[key] = entry
+                while len(self.entries) > self.max_size:
+                    self.entries.popitem(last=False)
+                logger.info(f"[GroundTruthCache] Loaded {len(self.entries)} entries from {self.save_path}")
+        except Exception as e:
+            logger.error(f"[GroundTruthCache] Error loading {self.save_path}: {e}")
+
+    def _save(self):
+        if not self.save_path:
+            return
+
+        try:
+            path = Path(self.save_path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(path.suffix + ".tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f, ensure_ascii=False)
+            tmp_path.replace(path)
+        except Exception as e:
+            logger.error(f"[GroundTruthCache] Error saving {self.save_path}: {e}")
@@ -0,0 +1,51 @@
+import statistics
+from typing import Dict, List
+
+
+class MinerLatencyTracker:
+    """
+    Per-uid moving averages of response latency and timeout rate, observed
+    after every synthetic challenge. Used to estimate how long each miner
+    will keep a query process busy so batches can be balanced.
+    """
+
+    def __init__(self, alpha: float = 0.3):
+        self.alpha = alpha
+        self.latency: Dict[int, float | None] = {}  # seconds, answers that didn't time out
+        self.timeout_rate: Dict[int, float] = {}
+        self.hotkeys: Dict[int, str] = {}
+
+    def observe(self, uid: int, hotkey: str, elapsed: float | None, timed_out: bool = False):
+        """
+        Record one query. Failures count at their observed `elapsed` (a refused
+        connection or a local short-circuit costs next to nothing), only real
+        timeouts and queries cut off at the scoring deadline are costed at the
+        full timeout.
+        """
+        if elapsed is None:
+            return
+        # A new hotkey on the uid means a different miner, start over
+        if uid not in self.timeout_rate or self.hotkeys.get(uid) != hotkey:
+            self.hotkeys[uid] = hotkey
+            self.latency[uid] = None if timed_out else elapsed
+            self.timeout_rate[uid] = 1.0 if timed_out else 0.0
+            return
+        if not timed_out:
+            last = self.latency[uid]
+            self.latency[uid] = elapsed if last is None else self.alpha * elapsed + (1 - self.alpha) * last
+        self.timeout_rate[uid] = self.alpha * (1.0 if timed_out else 0.0) + (1 - self.alpha) * self.timeout_rate[uid]
+
+    def expected_costs(self, uids: List[int], hotkeys: List[str], timeout: float) -> List[float]:
+        """
+        Expected seconds each miner will hold its process: timing out miners are
+        assumed to run until `timeout`. Unseen uids get the median known cost.
+        """
+        known = {}
+        for uid, hotkey in zip(uids, hotkeys):
+            if uid not in self.timeout_rate or self.hotkeys.get(uid) != hotkey:
+                continue
+            latency = self.latency[uid]
+            latency = timeout if latency is None else min(latency, timeout)
+            known[uid] = (1 - self.timeout_rate[uid]) * latency + self.timeout_rate[uid] * timeout
+        default = statistics.median(known.values()) if known else timeout / 2
+        return [known.get(uid, default) for uid in uids]
@@ -3,12 +3,17 @@ Multi-process miner query module for ChallengeManager.
 Handles parallel querying of miners using multiprocessing to improve performance.
 """
 import asyncio
+from dataclasses import dataclass
 from datetime import datetime
+import heapq
 import multiprocessing as mp
+from multiprocessing.connection import Connection, wait
 import os
+import threading
 import time
 from pathlib import Path
-from typing import List, Tuple
+from typing import AsyncIterator, Callable, List, Tuple
+from uuid import uuid4
 
 import bittensor as bt
 from loguru import logger
@@ -17,7 +22,8 @@ from common.enums import ErrorCode
 from common.protocol import SyntheticNonStreamSynapse
 from common.settings import Settings
 import common.utils as utils
-from hermes.validator.dendrite import HighConcurrencyDendrite
+from hermes.validator.dendrite import ConnectionMetrics, HighConcurrencyDendrite
+from hermes.validator.query_result import CompactQueryResult
 
 
 
@@ -33,10 +39,13 @@ async def query_single_miner(
     block_height: int,
     timeout: int,
     process_id: int,
+    deadline: float | None = None,
 ) -> SyntheticNonStreamSynapse:
     """
     Query a single miner (async).
     Handles all error cases and always returns a SyntheticNonStreamSynapse object.
+    If `deadline` (seconds) is shorter than `timeout`, the request is cancelled once it
+    passes the deadline and recorded as DEADLINE_EXCEEDED.
     """
     synapse = SyntheticNonStreamSynapse(
         id=challenge_id,
@@ -74,12 +83,23 @@ async def query_single_miner(
             r.error = "Miner has duplicated IP"
         else:
             # Query the miner directly
-            r = await dendrite.forward(
+            forward = dendrite.forward(
                 axons=axon,
                 synapse=synapse,
                 deserialize=False,
                 timeout=timeout,
             )
+            if deadline is not None and deadline < timeout:
+                try:
+                    r = await asyncio.wait_for(forward, timeout=max(deadline, 0))
+                except asyncio.TimeoutError:
+                    r.dendrite = bt.TerminalInfo(status_code=200)
+                    r.status_code = ErrorCode.DEADLINE_EXCEEDED.value
+                    r.error = f"Miner did not answer within the scoring deadline ({deadline:.2f}s)"
+                    logger.debug(f"🔍 [Process-{process_id}] - {challenge_id} UID {uid} cancelled after deadline {deadline:.2f}s")
+                    return r
+            else:
+                r = await forward
             logger.debug(
                 f"🔍 [Process-{process_id}] - {challenge_id} MINER RESPONSE [UID: {uid}] - "
                 f"✅ is_success: {r.is_success} - {r.dendrite.status_code} - {r.dendrite.status_message}"
@@ -105,44 +125,111 @@ async def query_miner_batch(
     question: str,
     block_height: int,
     timeout: int,
+    dendrite: HighConcurrencyDendrite | None = None,
+    on_response: Callable[[int, SyntheticNonStreamSynapse], None] | None = None,
+    deadline: float | None = None,
 ) -> List[SyntheticNonStreamSynapse]:
     """
     Query a batch of miners in one process using asyncio.gather for concurrency.
-    This function runs in a separate process and recreates necessary objects.
+    If no dendrite is given, this function recreates the necessary objects and
+    closes them afterwards; a long-lived worker passes its own dendrite instead.
+    `on_response(index, response)` is called as soon as each miner answers.
     """
     logger.info(f"[Process-{process_id}] Starting batch query for {len(miner_data_list)} miners")
     start_time = time.perf_counter()
-    
-    # Recreate Settings in this process (will read from environment variables)
-    settings = Settings()
-    
-    # Create dendrite for this process
-    dendrite = HighConcurrencyDendrite(wallet=settings.wallet, max_connections=200)
-    
+
+    owns_dendrite = dendrite is None
+    if owns_dendrite:
+        # Recreate Settings in this process (will read from environment variables)
+        settings = Settings()
+
+        # Create dendrite for this process
+        dendrite = HighConcurrencyDendrite(wallet=settings.wallet, max_connections=200)
+
+    async def query_and_report(index: int, uid: int, hotkey: str, axon: str, is_ip_duplicated: bool):
+        r = await query_single_miner(
+            dendrite=dendrite,
+            uid=uid,
+            hotkey=hotkey,
+            axon=bt.AxonInfo.from_string(axon) if axon else None,
+            is_ip_duplicated=is_ip_duplicated,
+            cid_hash=cid_hash,
+            challenge_id=challenge_id,
+            question=question,
+            block_height=block_height,
+            timeout=timeout,
+            process_id=process_id,
+            deadline=deadline,
+        )
+        if on_response is not None:
+            on_response(index, r)
+        return r
+
+    metrics_before = dendrite.connection_metrics.snapshot()
     try:
         # Use asyncio.gather to query all miners concurrently within this process
         responses = await asyncio.gather(
-            *(query_single_miner(
-                dendrite=dendrite,
-                uid=uid,
-                hotkey=hotkey,
-                axon=bt.AxonInfo.from_string(axon) if axon else None,
-                is_ip_duplicated=is_ip_duplicated,
-                cid_hash=cid_hash,
-                challenge_id=challenge_id,
-                question=question,
-                block_height=block_height,
-                timeout=timeout,
-                process_id=process_id,
-            ) for uid, hotkey, axon, is_ip_duplicated in miner_data_list),
+            *(query_and_report(index, *miner_data) for index, miner_data in enumerate(miner_data_list)),
         )
         
         elapsed = time.perf_counter() - start_time
+        conn = ConnectionMetrics.diff(dendrite.connection_metrics.snapshot(), metrics_before)
 
-        logger.info(f"[Process-{process_id}] Batch query done in {elapsed:.2f}s, {len(responses)} responses")
+        logger.info(
+            f"[Process-{process_id}] Batch query done in {elapsed:.2f}s, {len(responses)} responses, "
+            f"connections created: {conn['created']}, reused: {conn['reused']} ({conn['reuse_ratio']:.0%}), "
+            f"avg connect: {conn['avg_connect_ms']}ms"
+        )
         return responses
     finally:
-        await dendrite.aclose_session()
+        if owns_dendrite:
+            await dendrite.aclose_session()
+
+
+def build_error_responses(
+    miner_data_list: List[Tuple[int, str, str, bool]],
+    cid_hash: str,
+    challenge_id: str,
+    question: str,
+    block_height: int,
+    error: str,
+) -> List[SyntheticNonStreamSynapse]:
+    """Build PROCESS_ERROR placeholder responses for every miner in a batch."""
+    error_responses = []
+    for uid, _, _, _ in miner_data_list:
+        r = SyntheticNonStreamSynapse(
+            id=challenge_id, uid=uid, cid_hash=cid_hash,
+            question=question, block_height=block_height
+        )
+        r.status_code = ErrorCode.PROCESS_ERROR.value
+        r.error = error
+        r.elapsed_time = 0.0
+        error_responses.append(r)
+    return error_responses
+
+
+def fill_missing_responses(
+    responses: List[CompactQueryResult | None],
+    uids: List[int],
+    cid_hash: str,
+    challenge_id: str,
+    question: str,
+    block_height: int,
+    error: str = "No response from query worker",
+) -> List[CompactQueryResult]:
+    """
+    Replace missing responses with PROCESS_ERROR placeholders in place, so
+    position i keeps belonging to uids[i].
+    """
+    missing = [i for i, r in enumerate(responses) if r is None]
+    if missing:
+        logger.warning(f"[MultiprocessQuery] - {challenge_id} No response for uids {[uids[i] for i in missing]}, recording {error!r}")
+        placeholders = build_error_responses(
+            [(uids[i], "", "", False) for i in missing], cid_hash, challenge_id, question, block_height, error
+        )
+        for i, r in zip(missing, placeholders):
+            responses[i] = CompactQueryResult.from_synapse(r)
+    return responses
 
 
 def run_query_process_batch(
@@ -153,10 +240,12 @@ def run_query_process_batch(
     question: str,
     block_height: int,
     timeout: int,
-) -> List[SyntheticNonStreamSynapse]:
+    deadline: float | None = None,
+) -> List[bytes]:
     """
     Entry point for each process.
     Creates a new event loop and runs the async query_miner_batch function.
+    Responses are returned as packed CompactQueryResult records to keep pickling cheap.
     """
     logger.info(f"[Process-{process_id}] Started with PID {os.getpid()}")
     
@@ -175,26 +264,20 @@ def run_query_process_batch(
                 question,
                 block_height,
                 timeout,
+                deadline=deadline,
             )
         )
         
         logger.info(f"[Process-{process_id}] Completed with {len(result)} responses")
-        return result
+        return [CompactQueryResult.from_synapse(r).pack() for r in result]
     except Exception as e:
         logger.error(f"[Process-{process_id}] Error: {e}")
 
         # Return error placeholder responses for all miners in this batch
-        error_responses = []
-        for uid, _, _, _ in miner_data_list:
-            r = SyntheticNonStreamSynapse(
-                id=challenge_id, uid=uid, cid_hash=cid_hash,
-                question=question, block_height=block_height
-            )
-            r.status_code = ErrorCode.PROCESS_ERROR.value
-            r.error = f"Process error: {e}"
-            r.elapsed_time = 0.0
-            error_responses.append(r)
-        return error_responses
+        responses = build_error_responses(
+            miner_data_list, cid_hash, challenge_id, question, block_height, f"Process error: {e}"
+        )
+        return [CompactQueryResult.from_synapse(r).pack() for r in responses]
 
     finally:
         # Ensure event loop is properly closed
@@ -213,6 +296,63 @@ def run_query_process_batch(
                 loop.close()
 
 
+def split_miner_batches(
+    uids: List[int],
+    hotkeys: List[str],
+    axons: List[str],
+    ips: List[str],
+    seen_ips: dict,
+    num_batches: int,
+    challenge_id: str = "",
+    costs: List[float] | None = None,
+) -> List[Tuple[List[int], List[Tuple[int, str, str, bool]]]]:
+    """
+    Build per-miner query data (with IP duplication check) and split it into
+    at most `num_batches` batches, one per query process.
+    Each batch is `(indices, miner_data_list)` where `indices` are positions in `uids`.
+
+    Without `costs` the split is contiguous and equal-sized. With per-miner
+    expected costs (seconds), miners are assigned greedily, most expensive
+    first, to the least loaded batch so every process finishes around the same time.
+    """
+    # Prepare miner data with IP duplication check
+    miner_data_list = [
+        (uid, hotkey, axon, bool(ip) and seen_ips.get(ip) != uid)
+        for uid, hotkey, axon, ip in zip(uids, hotkeys, axons, ips)
+    ]
+
+    if costs is None:
+        batch_size = (len(uids) + num_batches - 1) // num_batches
+        index_batches = [
+            list(range(i * batch_size, min((i + 1) * batch_size, len(uids))))
+            for i in range(num_batches)
+        ]
+        loads = [None] * num_batches
+    else:
+        index_batches = [[] for _ in range(num_batches)]
+        loads = [0.0] * num_batches
+        heap = [(0.0, i) for i in range(num_batches)]
+        for idx in sorted(range(len(uids)), key=lambda i: costs[i], reverse=True):
+            load, i = heapq.heappop(heap)
+            index_batches[i].append(idx)
+            loads[i] = load + costs[idx]
+            heapq.heappush(heap, (loads[i], i))
+        for indices in index_batches:
+            indices.sort()
+
+    batches = []
+    for i, indices in enumerate(index_batches):
+        if not indices:
+            continue
+        batches.append((indices, [miner_data_list[idx] for idx in indices]))
+        expected = f", expected load {loads[i]:.1f}s" if loads[i] is not None else ""
+        logger.info(
+            f"[MultiprocessQuery] - {challenge_id} Process-{i} will handle "
+            f"{len(indices)} miners{expected}"
+        )
+    return batches
+
+
 async def query_miners_multiprocess(
     uids: List[int],
     hotkeys: List[str],
@@ -225,7 +365,9 @@ async def query_miners_multiprocess(
     block_height: int,
     timeout: int,
     settings: Settings,
-) -> List[SyntheticNonStreamSynapse]:
+    deadline: float | None = None,
+    costs: List[float] | None = None,
+) -> List[CompactQueryResult]:
     """
     Main entry point for multi-process miner querying.
     
@@ -241,6 +383,8 @@ async def query_miners_multiprocess(
         block_height: Block height for query
         timeout: Query timeout in seconds
         settings: Settings instance (only for reference, will be recreated in subprocesses)
+        deadline: Optional scoring deadline in seconds; miners still running past it are cancelled
+        costs: Optional expected per-miner latency used to balance the batches
     
     Returns:
         List of SyntheticNonStreamSynapse responses in the same order as input UIDs
@@ -254,28 +398,8 @@ async def query_miners_multiprocess(
         f"{len(uids)} miners, {max_processes} processes "
     )
     
-    # Prepare miner data with IP duplication check
-    miner_data_list = [
-        (uid, hotkey, axon, bool(ip) and seen_ips.get(ip) != uid)
-        for uid, hotkey, axon, ip in zip(uids, hotkeys, axons, ips)
-    ]
-    
-    # Split miners into batches
-    batch_size = (len(uids) + max_processes - 1) // max_processes
-    batches = []
-    
-    for i in range(max_processes):
-        start_idx = i * batch_size
-        end_idx = min(start_idx + batch_size, len(uids))
-        batch_data = miner_data_list[start_idx:end_idx]
-        
-        if batch_data:
-            batches.append(batch_data)
-            logger.info(
-                f"[MultiprocessQuery] - {challenge_id} Process-{i} will handle "
-                f"{len(batch_data)} miners (indices {start_idx}-{end_idx-1})"
-            )
-    
+    batches = split_miner_batches(uids, hotkeys, axons, ips, seen_ips, max_processes, challenge_id, costs)
+
     # Start multiprocessing
     overall_start = time.perf_counter()
     
@@ -293,20 +417,24 @@ async def query_miners_multiprocess(
                 question,
                 block_height,
                 timeout,
+                deadline,
             )
-            for i, batch_data in enumerate(batches)
+            for i, (_, batch_data) in enumerate(batches)
         ]
         
-        # Run processes in parallel
-        results = pool.starmap(run_query_process_batch, args_list)
+        # Run processes in parallel, off the event loop so other projects keep going
+        results = await asyncio.get_running_loop().run_in_executor(
+            None, pool.starmap, run_query_process_batch, args_list
+        )
     
     overall_elapsed = time.perf_counter() - overall_start
     
-    # Flatten results (maintain order)
-    all_responses = []
-    for batch_result in results:
-        if batch_result:
-            all_responses.extend(batch_result)
+    # Put results back in input order
+    all_responses: List[CompactQueryResult | None] = [None] * len(uids)
+    for (indices, _), batch_result in zip(batches, results):
+        for index, packed in zip(indices, batch_result or []):
+            all_responses[index] = CompactQueryResult.unpack(packed)
+    fill_missing_responses(all_responses, uids, cid_hash, challenge_id, question, block_height)
     
     logger.info(
         f"[MultiprocessQuery] - {challenge_id} All processes done in {overall_elapsed:.2f}s, "
@@ -314,3 +442,502 @@ async def query_miners_multiprocess(
     )
     
     return all_responses
+
+
+@dataclass
+class QueryJob:
+    job_id: str
+    miner_data_list: List[Tuple[int, str, str, bool]]
+    cid_hash: str
+    challenge_id: str
+    question: str
+    block_height: int
+    timeout: int
+    deadline: float | None = None
+
+
+@dataclass
+class PrewarmJob:
+    axons: List[str]
+
+
+@dataclass
+class _PendingJob:
+    job: QueryJob
+    worker_id: int
+    indices: List[int]  # positions of the job's miners in the caller's uid list
+    events: asyncio.Queue
+    loop: asyncio.AbstractEventLoop
+    deadline: float
+    received: set[int]
+
+
+async def run_query_job(
+    worker_id: int,
+    dendrite: HighConcurrencyDendrite,
+    job: QueryJob,
+    result_conn: Connection,
+):
+    """
+    Run one batch job inside a long-lived worker.
+    Each response is posted back as soon as it arrives, followed by a done marker.
+    """
+    sent: set[int] = set()
+
+    def post(index: int, response: SyntheticNonStreamSynapse):
+        sent.add(index)
+        result_conn.send((job.job_id, index, CompactQueryResult.from_synapse(response).pack()))
+
+    try:
+        await query_miner_batch(
+            worker_id,
+            job.miner_data_list,
+            job.cid_hash,
+            job.challenge_id,
+            job.question,
+            job.block_height,
+            job.timeout,
+            dendrite=dendrite,
+            on_response=post,
+            deadline=job.deadline,
+        )
+    except Exception as e:
+        logger.error(f"[QueryWorker-{worker_id}] - {job.challenge_id} job failed: {e}")
+        missing = [i for i in range(len(job.miner_data_list)) if i not in sent]
+        responses = build_error_responses(
+            [job.miner_data_list[i] for i in missing],
+            job.cid_hash, job.challenge_id, job.question, job.block_height, f"Process error: {e}"
+        )
+        for index, response in zip(missing, responses):
+            post(index, response)
+    result_conn.send((job.job_id, None, None))
+
+
+async def run_prewarm_job(worker_id: int, dendrite: HighConcurrencyDendrite, job: PrewarmJob):
+    """Open keep-alive connections to the axons this worker is about to query."""
+    try:
+        start_time = time.perf_counter()
+        axons = [bt.AxonInfo.from_string(axon) for axon in job.axons if axon]
+        reachable = await dendrite.prewarm(axons)
+        logger.info(
+            f"[QueryWorker-{worker_id}] Prewarmed {reachable}/{len(axons)} axons "
+            f"in {time.perf_counter() - start_time:.2f}s"
+        )
+    except Exception as e:
+        logger.warning(f"[QueryWorker-{worker_id}] Prewarm failed: {e}")
+
+
+async def serve_query_jobs(
+    worker_id: int,
+    dendrite: HighConcurrencyDendrite,
+    job_queue: mp.Queue,
+    result_conn: Connection,
+):
+    """
+    Receive jobs until a `None` sentinel arrives.
+    Jobs run concurrently on the worker's event loop, so batches of different
+    projects dispatched to the same worker do not wait for each other.
+    """
+    loop = asyncio.get_running_loop()
+    running: set[asyncio.Task] = set()
+    while True:
+        job: QueryJob | PrewarmJob | None = await loop.run_in_executor(None, job_queue.get)
+        if job is None:
+            break
+        if isinstance(job, PrewarmJob):
+            task = asyncio.create_task(run_prewarm_job(worker_id, dendrite, job))
+        else:
+            task = asyncio.create_task(run_query_job(worker_id, dendrite, job, result_conn))
+        running.add(task)
+        task.add_done_callback(running.discard)
+
+    if running:
+        await asyncio.gather(*running, return_exceptions=True)
+
+
+def dendrite_keep_alive() -> bool:
+    """
+    Pooled miner connections are opt-in: axons close idle sockets within seconds, far
+    shorter than the gap between rounds, and a stale socket's error would be charged to the miner.
+    """
+    return os.getenv("DENDRITE_KEEP_ALIVE", "false").lower() == "true"
+
+
+def run_query_worker(worker_id: int, job_queue: mp.Queue, result_conn: Connection):
+    """
+    Entry point for each long-lived query worker.
+    Settings, wallet, dendrite and event loop are created once and reused for every job.
+    With DENDRITE_KEEP_ALIVE=true the dendrite keeps per-host connections alive between jobs.
+    """
+    logger.info(f"[QueryWorker-{worker_id}] Started with PID {os.getpid()}")
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    dendrite = None
+    try:
+        settings = Settings()
+        dendrite = HighConcurrencyDendrite(
+            wallet=settings.wallet,
+            max_connections=200,
+            keep_alive=dendrite_keep_alive(),
+            # Below uvicorn's 5s default, so idle sockets are dropped here before the axon closes them under us
+            keepalive_timeout=float(os.getenv("DENDRITE_KEEPALIVE_TIMEOUT", 4)),  # seconds
+        )
+        loop.run_until_complete(serve_query_jobs(worker_id, dendrite, job_queue, result_conn))
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        logger.error(f"[QueryWorker-{worker_id}] Error: {e}")
+    finally:
+        try:
+            if dendrite is not None:
+                loop.run_until_complete(dendrite.aclose_session())
+        except Exception:
+            pass
+        finally:
+            loop.close()
+        logger.info(f"[QueryWorker-{worker_id}] Stopped")
+
+
+class QueryWorkerPool:
+    """
+    Long-lived pool of miner query processes, owned by ChallengeManager.
+
+    Unlike `query_miners_multiprocess`, workers are spawned once and keep their
+    wallet, dendrite and event loop across rounds; batches are sent to them over
+    per-worker job queues and each response comes back on the worker's own
+    result pipe as soon as the miner answers (see `stream_miners`). A worker
+    that has to be killed can only break its own pipe, which is replaced with it.
+
+    Health policy, checked every `health_check_interval` seconds by the result
+    reader thread and before every dispatch:
+    - dead workers are respawned;
+    - a worker whose job overruns `timeout + job_grace_seconds` is terminated
+      (killed only if it doesn't exit) and respawned;
+    - in both cases, the worker's unanswered miners resolve to PROCESS_ERROR placeholders.
+    """
+    size: int
+    job_grace_seconds: int
+    health_check_interval: float
+    restart_count: int
+
+    def __init__(self, size: int, job_grace_seconds: int = 30, health_check_interval: float = 1.0):
+        self.size = max(1, size)
+        self.job_grace_seconds = job_grace_seconds
+        self.health_check_interval = health_check_interval
+        self.restart_count = 0
+
+        self._ctx = mp.get_context('spawn')
+        self._processes: list[mp.Process | None] = [None] * self.size
+        self._job_queues: list[mp.Queue | None] = [None] * self.size
+        self._result_conns: list[Connection | None] = [None] * self.size  # read ends of the workers' result pipes
+        self._retired_conns: list[Connection] = []  # of replaced workers, closed by the reader thread
+        self._pending: dict[str, _PendingJob] = {}
+        self._lock = threading.Lock()
+        # Held while workers are checked or respawned and while jobs are dispatched to them
+        self._workers_lock = threading.RLock()
+        self._reader: threading.Thread | None = None
+        self._closed = False
+
+    @property
+    def started(self) -> bool:
+        return self._reader is not None
+
+    def start(self):
+        if self.started:
+            return
+
+        self._closed = False
+        for worker_id in range(self.size):
+            self._spawn(worker_id)
+
+        self._reader = threading.Thread(target=self._read_results, name="QueryWorkerPoolReader", daemon=True)
+        self._reader.start()
+        logger.info(f"[QueryWorkerPool] Started {self.size} query workers")
+
+    def _spawn(self, worker_id: int):
+        job_queue = self._ctx.Queue()
+        result_conn, worker_conn = self._ctx.Pipe(duplex=False)
+        proc = self._ctx.Process(
+            target=run_query_worker,
+            args=(worker_id, job_queue, worker_conn),
+            name=f"QueryWorker-{worker_id}",
+            daemon=True,
+        )
+        proc.start()
+        # Only the worker holds the write end, so the pipe reads EOF once it exits
+        worker_conn.close()
+
+        old_queue, old_conn = self._job_queues[worker_id], self._result_conns[worker_id]
+        if old_queue is not None:
+            old_queue.cancel_join_thread()
+            old_queue.close()
+        if old_conn is not None:
+            # The reader thread may be waiting on it right now
+            self._retired_conns.append(old_conn)
+        self._processes[worker_id] = proc
+        self._job_queues[worker_id] = job_queue
+        self._result_conns[worker_id] = result_conn
+
+    def _read_results(self):
+        next_check = time.monotonic() + self.health_check_interval
+        while not self._closed:
+            with self._workers_lock:
+                for conn in self._retired_conns:
+                    conn.close()
+                self._retired_conns.clear()
+                conns = {conn: worker_id for worker_id, conn in enumerate(self._result_conns) if conn is not None}
+
+            timeout = max(0.0, next_check - time.monotonic())
+            if not conns:
+                time.sleep(timeout)
+            for conn in wait(list(conns), timeout=timeout) if conns else []:
+                try:
+                    job_id, index, packed = conn.recv()
+                except Exception:
+                    # EOF or a message cut short: the worker is gone, the health check fails its jobs
+                    with self._workers_lock:
+                        if self._result_conns[conns[conn]] is conn:
+                            self._result_conns[conns[conn]] = None
+                            conn.close()
+                    continue
+                self._dispatch_result(job_id, index, packed)
+
+            if time.monotonic() >= next_check:
+                try:
+                    self._check_health()
+                except Exception as e:
+                    logger.error(f"[QueryWorkerPool] Health check failed: {e}")
+                next_check = time.monotonic() + self.health_check_interval
+
+    def _dispatch_result(self, job_id: str, index: int | None, packed: bytes | None):
+        with self._lock:
+            if index is None:
+                pending = self._pending.pop(job_id, None)
+            else:
+                pending = self._pending.get(job_id)
+                if pending is not None:
+                    pending.received.add(index)
+
+        # Job was already failed by the health check
+        if pending is None:
+            return
+
+        # None marks the end of a job
+        event = None if index is None else (pending.indices[index], CompactQueryResult.unpack(packed))
+        pending.loop.call_soon_threadsafe(pending.events.put_nowait, event)
+
+    def _fail_worker_jobs(self, worker_id: int, error: str):
+        with self._lock:
+            failed = [job_id for job_id, p in self._pending.items() if p.worker_id == worker_id]
+            failed = [self._pending.pop(job_id) for job_id in failed]
+
+        for p in failed:
+            missing = [i for i in range(len(p.job.miner_data_list)) if i not in p.received]
+            responses = build_error_responses(
+                [p.job.miner_data_list[i] for i in missing],
+                p.job.cid_hash, p.job.challenge_id, p.job.question, p.job.block_height, error
+            )
+            for index, response in zip(missing, responses):
+                event = (p.indices[index], CompactQueryResult.from_synapse(response))
+                p.loop.call_soon_threadsafe(p.events.put_nowait, event)
+            p.loop.call_soon_threadsafe(p.events.put_nowait, None)
+
+    def _check_health(self):
+        with self._workers_lock:
+            if self._closed:
+                return
+            now = time.monotonic()
+            with self._lock:
+                overdue_workers = {p.worker_id for p in self._pending.values() if now > p.deadline}
+
+            for worker_id, proc in enumerate(self._processes):
+                if proc is None:
+                    continue
+
+                if worker_id in overdue_workers:
+                    logger.warning(f"[QueryWorkerPool] QueryWorker-{worker_id} (PID {proc.pid}) overran its job deadline, restarting")
+                    proc.terminate()
+                    proc.join(timeout=2)
+                    if proc.is_alive():
+                        proc.kill()
+                        proc.join(timeout=1)
+                    error = "Query worker timed out"
+                elif not proc.is_alive():
+                    logger.warning(f"[QueryWorkerPool] QueryWorker-{worker_id} (PID {proc.pid}) exited with code {proc.exitcode}, restarting")
+                    error = f"Query worker exited with code {proc.exitcode}"
+                else:
+                    continue
+
+                self.restart_count += 1
+                self._fail_worker_jobs(worker_id, error)
+                self._spawn(worker_id)
+
+    def prewarm(
+        self,
+        uids: List[int],
+        hotkeys: List[str],
+        axons: List[str],
+        ips: List[str],
+        seen_ips: dict,
+        costs: List[float] | None = None,
+    ):
+        """
+        Ask each worker to open connections to the axons it will be given by
+        `query_miners` for the same miner list. Fire-and-forget.
+        """
+        if not uids:
+            return
+
+        self.start()
+        batches = split_miner_batches(uids, hotkeys, axons, ips, seen_ips, min(self.size, len(uids)), "prewarm", costs)
+        with self._workers_lock:
+            self._check_health()
+            for worker_id, (_, batch_data) in enumerate(batches):
+                axons_to_warm = [axon for _, hotkey, axon, is_ip_duplicated in batch_data if hotkey and axon and not is_ip_duplicated]
+                self._job_queues[worker_id].put(PrewarmJob(axons=axons_to_warm))
+
+    async def stream_miners(
+        self,
+        uids: List[int],
+        hotkeys: List[str],
+        axons: List[str],
+        ips: List[str],
+        seen_ips: dict,
+        cid_hash: str,
+        challenge_id: str,
+        question: str,
+        block_height: int,
+        timeout: int,
+        deadline: float | None = None,
+        costs: List[float] | None = None,
+    ) -> AsyncIterator[Tuple[int, CompactQueryResult]]:
+        """
+        Query miners on the warm workers and yield `(index, response)` pairs as
+        they arrive, where `index` is the miner's position in `uids`.
+        Every index is yielded exactly once, in completion order.
+        Miners still running past `deadline` seconds are cancelled (DEADLINE_EXCEEDED).
+        `costs` (expected per-miner latency) balances the work across workers.
+        """
+        if not uids:
+            return
+
+        self.start()
+
+        num_batches = min(self.size, len(uids))
+        logger.info(
+            f"[QueryWorkerPool] - {challenge_id} Starting pooled query: "
+            f"{len(uids)} miners, {num_batches} workers (restarts so far: {self.restart_count})"
+        )
+        batches = split_miner_batches(uids, hotkeys, axons, ips, seen_ips, num_batches, challenge_id, costs)
+
+        overall_start = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        events: asyncio.Queue = asyncio.Queue()
+        job_budget = min(timeout, deadline) if deadline is not None else timeout
+        job_deadline = time.monotonic() + job_budget + self.job_grace_seconds
+        job_ids = []
+
+        # A worker can't be replaced between checking it and handing it its job
+        with self._workers_lock:
+            self._check_health()
+            for worker_id, (indices, batch_data) in enumerate(batches):
+                job = QueryJob(
+                    job_id=str(uuid4()),
+                    miner_data_list=batch_data,
+                    cid_hash=cid_hash,
+                    challenge_id=challenge_id,
+                    question=question,
+                    block_height=block_height,
+                    timeout=timeout,
+                    deadline=deadline,
+                )
+                with self._lock:
+                    self._pending[job.job_id] = _PendingJob(job, worker_id, indices, events, loop, job_deadline, set())
+                self._job_queues[worker_id].put(job)
+                job_ids.append(job.job_id)
+
+        remaining_jobs = len(job_ids)
+        received = 0
+        try:
+            while remaining_jobs:
+                # Overdue or dead workers are failed by the reader thread's health check
+                event = await events.get()
+                if event is None:
+                    remaining_jobs -= 1
+                    continue
+                received += 1
+                yield event
+        finally:
+            # Drop bookkeeping for jobs whose consumer stopped early
+            with self._lock:
+                for job_id in job_ids:
+                    self._pending.pop(job_id, None)
+
+        overall_elapsed = time.perf_counter() - overall_start
+        logger.info(
+            f"[QueryWorkerPool] - {challenge_id} All workers done in {overall_elapsed:.2f}s, "
+            f"collected {received} responses"
+        )
+
+    async def query_miners(
+        self,
+        uids: List[int],
+        hotkeys: List[str],
+        axons: List[str],
+        ips: List[str],
+        seen_ips: dict,
+        cid_hash: str,
+        challenge_id: str,
+        question: str,
+        block_height: int,
+        timeout: int,
+        deadline: float | None = None,
+        costs: List[float] | None = None,
+    ) -> List[CompactQueryResult]:
+        """
+        Same contract as `query_miners_multiprocess`, served by the warm workers.
+        Returns responses in the same order as input UIDs.
+        """
+        all_responses: List[CompactQueryResult | None] = [None] * len(uids)
+        async for index, response in self.stream_miners(
+            uids, hotkeys, axons, ips, seen_ips, cid_hash, challenge_id, question, block_height, timeout, deadline, costs
+        ):
+            all_responses[index] = response
+        return fill_missing_responses(all_responses, uids, cid_hash, challenge_id, question, block_height)
+
+    def close(self):
+        if not self.started:
+            return
+
+        with self._workers_lock:
+            self._closed = True
+        for job_queue in self._job_queues:
+            try:
+                job_queue.put(None)
+            except Exception:
+                pass
+
+        for proc in self._processes:
+            if proc is None:
+                continue
+            proc.join(timeout=5)
+            if proc.is_alive():
+                proc.terminate()
+                proc.join(timeout=1)
+
+        with self._lock:
+            self._pending.clear()
+
+        if self._reader is not None:
+            self._reader.join(timeout=2)
+
+        for conn in self._result_conns + self._retired_conns:
+            if conn is not None:
+                conn.close()
+        self._processes = [None] * self.size
+        self._job_queues = [None] * self.size
+        self._result_conns = [None] * self.size
+        self._retired_conns = []
+        self._reader = None
+        logger.info("[QueryWorkerPool] Closed")
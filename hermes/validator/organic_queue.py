@@ -0,0 +1,129 @@
+"""
+Backlog of sampled organic responses waiting for quality scoring.
+
+Tasks are kept per project and handed out round-robin, so one busy project
+can't take every scoring slot. Under load each miner keeps at most
+`max_per_uid` pending tasks (a newer response replaces its oldest), and when
+the backlog is full the oldest task of the longest project queue goes, so the
+samples that do get scored still cover every miner and project.
+"""
+from collections import Counter, deque
+from dataclasses import dataclass
+import time
+
+
+@dataclass
+class OrganicTask:
+    miner_uid: int
+    hotkey: str
+    resp_dict: dict  # OrganicNonStreamSynapse fields
+    queued_at: float  # time.time() when the API process queued the response
+
+    @property
+    def project(self) -> str:
+        return self.resp_dict.get("cid_hash") or ""
+
+
+class OrganicBacklog:
+    def __init__(self, max_size: int = 200, max_per_uid: int = 2):
+        self.max_size = max_size
+        self.max_per_uid = max_per_uid  # 0 = no per-miner cap
+        self._projects: dict[str, deque[OrganicTask]] = {}
+        self._turns: deque[str] = deque()  # projects with pending tasks, next to serve first
+        self._uid_pending: Counter = Counter()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(self, task: OrganicTask) -> tuple[int, int]:
+        """Queue `task`; returns (superseded, overflowed) tasks dropped to make room."""
+        superseded = overflowed = 0
+        if self.max_per_uid and self._uid_pending[task.miner_uid] >= self.max_per_uid:
+            self._remove_oldest(lambda t: t.miner_uid == task.miner_uid)
+            superseded += 1
+        elif self._size >= self.max_size:
+            longest = max(self._projects, key=lambda p: len(self._projects[p]))
+            self._remove(longest, 0)
+            overflowed += 1
+
+        project = task.project
+        if project not in self._projects:
+            self._projects[project] = deque()
+            self._turns.append(project)
+        self._projects[project].append(task)
+        self._uid_pending[task.miner_uid] += 1
+        self._size += 1
+        return superseded, overflowed
+
+    def pop(self) -> OrganicTask | None:
+        """Oldest task of the next project in turn."""
+        if not self._turns:
+            return None
+        project = self._turns.popleft()
+        task = self._remove(project, 0)
+        if project in self._projects:
+            self._turns.append(project)
+        return task
+
+    def _remove_oldest(self, match):
+        oldest = None
+        for project, tasks in self._projects.items():
+            for index, task in enumerate(tasks):
+                if match(task):
+                    if oldest is None or task.queued_at < oldest[2]:
+                        oldest = (project, index, task.queued_at)
+                    break  # tasks of a project are in queue order
+        if oldest is not None:
+            self._remove(oldest[0], oldest[1])
+
+    def _remove(self, project: str, index: int) -> OrganicTask:
+        tasks = self._projects[project]
+        task = tasks[index]
+        del tasks[index]
+        if not tasks:
+            del self._projects[project]
+            if project in self._turns:
+                self._turns.remove(project)
+        self._uid_pending[task.miner_uid] -= 1
+        if not self._uid_pending[task.miner_uid]:
+            del self._uid_pending[task.miner_uid]
+        self._size -= 1
+        return task
+
+
+@dataclass
+class OrganicStats:
+    received: int = 0  # responses read from the shared queue
+    sampled: int = 0  # of which queued for scoring
+    scored: int = 0
+    failed: int = 0  # no valid ground truth or scoring error
+    superseded: int = 0  # replaced by a newer response of the same miner
+    overflowed: int = 0  # backlog full
+    expired: int = 0  # waited longer than the max age
+    shared_dropped: int = 0  # dropped by the shared queue before reaching us
+    wait_total: float = 0.0  # seconds from API queueing to scoring start
+    wait_max: float = 0.0
+    started_at: float = 0.0
+
+    def __post_init__(self):
+        self.started_at = self.started_at or time.monotonic()
+
+    def record_wait(self, waited: float):
+        self.wait_total += waited
+        self.wait_max = max(self.wait_max, waited)
+
+    @property
+    def dropped(self) -> int:
+        return self.superseded + self.overflowed + self.expired + self.shared_dropped
+
+    def summary(self, backlog: int) -> str:
+        elapsed = max(time.monotonic() - self.started_at, 1e-9)
+        started = self.scored + self.failed
+        avg_wait = self.wait_total / started if started else 0.0
+        return (
+            f"received {self.received}, sampled {self.sampled}, scored {self.scored} "
+            f"({self.scored / elapsed * 60:.1f}/min), failed {self.failed}, backlog {backlog}, "
+            f"queue age avg {avg_wait:.1f}s max {self.wait_max:.1f}s, dropped {self.dropped} "
+            f"(superseded {self.superseded}, overflow {self.overflowed}, expired {self.expired}, shared queue {self.shared_dropped})"
+        )
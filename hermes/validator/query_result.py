@@ -0,0 +1,118 @@
+"""
+Compact miner query result passed from query workers back to the challenge process.
+Only the fields used by scoring, tables and benchmark upload are carried; the full
+SyntheticNonStreamSynapse is rebuilt lazily on first access to any other attribute.
+"""
+import bittensor as bt
+import msgpack
+
+from common.protocol import SyntheticNonStreamSynapse
+
+
+USAGE_INFO_KEYS = ("input_tokens", "input_cache_read_tokens", "output_tokens", "tool_calls")
+
+
+class CompactQueryResult:
+    FIELDS = (
+        "id",
+        "uid",
+        "cid_hash",
+        "question",
+        "block_height",
+        "status_code",
+        "error",
+        "elapsed_time",
+        "forward_start_time",
+        "recv_start_time",
+        "miner_model_name",
+        "graphql_agent_model_name",
+        "response",
+        "usage_info",
+        "graphql_agent_inner_tool_calls",
+        "dendrite_status_code",
+        "dendrite_status_message",
+    )
+    __slots__ = FIELDS + ("_synapse",)
+
+    def __init__(self, *values):
+        for name, value in zip(self.FIELDS, values):
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, "_synapse", None)
+
+    @classmethod
+    def from_synapse(cls, r: SyntheticNonStreamSynapse) -> "CompactQueryResult":
+        usage_info = None
+        if r.usage_info:
+            usage_info = {k: r.usage_info[k] for k in USAGE_INFO_KEYS if k in r.usage_info}
+        dendrite = r.dendrite
+        return cls(
+            r.id,
+            r.uid,
+            r.cid_hash,
+            r.question,
+            r.block_height,
+            r.status_code,
+            r.error,
+            r.elapsed_time,
+            r.forward_start_time,
+            r.recv_start_time,
+            r.miner_model_name,
+            r.graphql_agent_model_name,
+            r.response,
+            usage_info,
+            r.graphql_agent_inner_tool_calls,
+            dendrite.status_code if dendrite is not None else None,
+            dendrite.status_message if dendrite is not None else None,
+        )
+
+    def pack(self) -> bytes:
+        return msgpack.packb([getattr(self, name) for name in self.FIELDS], use_bin_type=True)
+
+    @classmethod
+    def unpack(cls, data: bytes) -> "CompactQueryResult":
+        return cls(*msgpack.unpackb(data, raw=False))
+
+    @property
+    def is_success(self) -> bool:
+        return self.dendrite_status_code == 200
+
+    @property
+    def dendrite(self) -> bt.TerminalInfo:
+        return self.to_synapse().dendrite
+
+    def to_synapse(self) -> SyntheticNonStreamSynapse:
+        """Rebuild (once) the full synapse from the carried fields."""
+        if self._synapse is None:
+            synapse = SyntheticNonStreamSynapse(
+                id=self.id,
+                uid=self.uid,
+                cid_hash=self.cid_hash,
+                question=self.question,
+                block_height=self.block_height,
+            )
+            for name in self.FIELDS[5:-2]:
+                setattr(synapse, name, getattr(self, name))
+            synapse.dendrite = bt.TerminalInfo(
+                status_code=self.dendrite_status_code,
+                status_message=self.dendrite_status_message,
+            )
+            object.__setattr__(self, "_synapse", synapse)
+        return self._synapse
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        # Keep an already rebuilt synapse in sync (e.g. scorer marking a miner suspicious)
+        if self._synapse is not None and name in self.FIELDS[5:-2]:
+            setattr(self._synapse, name, value)
+
+    def __getattr__(self, name):
+        # Only called for attributes not carried in the compact record
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.to_synapse(), name)
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactQueryResult(uid={self.uid}, status_code={self.status_code}, "
+            f"elapsed_time={self.elapsed_time}, error={self.error!r})"
+        )
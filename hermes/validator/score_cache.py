@@ -0,0 +1,74 @@
+import asyncio
+from dataclasses import dataclass
+import hashlib
+import re
+import unicodedata
+
+
+_WHITESPACE = re.compile(r"\s+")
+_MARKDOWN_EMPHASIS = re.compile(r"\*\*|__|`")
+
+
+def normalize_answer(answer: str) -> str:
+    """Canonical form of an answer: NFKC, no markdown emphasis, collapsed whitespace."""
+    answer = unicodedata.normalize("NFKC", answer)
+    answer = _MARKDOWN_EMPHASIS.sub("", answer)
+    return _WHITESPACE.sub(" ", answer).strip()
+
+
+@dataclass
+class ScoreCacheStats:
+    distinct: int = 0  # answers that needed their own scoring
+    reused: int = 0  # answers that took the score of an identical one
+
+    @property
+    def total(self) -> int:
+        return self.distinct + self.reused
+
+    @property
+    def hit_rate(self) -> float:
+        return self.reused / self.total if self.total else 0.0
+
+    def merge(self, other: "ScoreCacheStats"):
+        self.distinct += other.distinct
+        self.reused += other.reused
+
+
+class ScoreCache:
+    """
+    Scores of normalized miner answers for one (challenge, ground truth).
+
+    The first caller for an answer becomes its owner and must `resolve` it;
+    later callers with an equivalent answer get the owner's future, so
+    concurrent duplicates wait on the single scoring in flight.
+    """
+
+    def __init__(self, challenge_id: str, ground_truth: str):
+        self.scope = hashlib.sha256(f"{challenge_id}\0{ground_truth}".encode()).hexdigest()
+        self.stats = ScoreCacheStats()
+        self._entries: dict[str, asyncio.Future] = {}
+
+    def key(self, answer: str) -> str:
+        return hashlib.sha256(f"{self.scope}\0{normalize_answer(answer)}".encode()).hexdigest()
+
+    def claim(self, answer: str) -> tuple[asyncio.Future, bool]:
+        """Future holding the answer's `(score, error)` and whether the caller owns it."""
+        key = self.key(answer)
+        future = self._entries.get(key)
+        if future is not None:
+            self.stats.reused += 1
+            return future, False
+
+        future = asyncio.get_running_loop().create_future()
+        self._entries[key] = future
+        self.stats.distinct += 1
+        return future, True
+
+    def resolve(self, future: asyncio.Future, result: tuple):
+        if not future.done():
+            future.set_result(result)
+
+    def abandon(self, future: asyncio.Future):
+        """Owner gave up without a result: waiters are cancelled."""
+        if not future.done():
+            future.cancel()
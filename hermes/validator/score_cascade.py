@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class CascadeStats:
+    graded: int = 0  # answers graded by the fast model
+    escalated: int = 0  # of which re-graded by the strong model
+
+    @property
+    def escalation_rate(self) -> float:
+        return self.escalated / self.graded if self.graded else 0.0
+
+    def merge(self, other: "CascadeStats"):
+        self.graded += other.graded
+        self.escalated += other.escalated
+
+
+def needs_escalation(
+    graded: tuple[float, float | None] | None,
+    min_confidence: float,
+    threshold: float,
+    margin: float,
+) -> bool:
+    """
+    Whether a fast-model `(score, confidence)` should be re-graded by the strong
+    model: unreadable, not confident enough, or within `margin` of `threshold`
+    where a small error flips the success decision.
+    """
+    if graded is None:
+        return True
+    score, confidence = graded
+    if confidence is None or confidence < min_confidence:
+        return True
+    return abs(score - threshold) <= margin
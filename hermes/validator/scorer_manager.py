@@ -1,36 +1,71 @@
 import asyncio
 import json
 import os
-from pathlib import Path
 import time
-from typing import List, Tuple
+from typing import AsyncIterator, List, Tuple
 from langchain_openai import ChatOpenAI
 from loguru import logger
 from langchain_core.messages import HumanMessage
 import numpy as np
-import torch
 from agent.stats import Phase, TokenUsageMetrics
 from agent.subquery_graphql_agent.node_types import GraphqlProvider
 from common import utils
 from common.enums import ErrorCode
-from common.prompt_template import CODEX_SCORE_PROMPT, SCORE_PROMPT, create_scoring_json
+from common.prompt_template import (
+    BATCH_SCORE_PROMPT,
+    BATCH_SCORE_WITH_CONFIDENCE_PROMPT,
+    CODEX_SCORE_PROMPT,
+    SCORE_PROMPT,
+    create_batch_scoring_json,
+    create_scoring_json,
+)
 from common.prompt_injection_defense import sanitize_for_evaluation
 from common.protocol import SyntheticNonStreamSynapse
 from hermes.validator.ema import EMAUpdater
+from hermes.validator.fast_scorer import MATCH, FastScorer
+from hermes.validator.score_cascade import CascadeStats, needs_escalation
+from hermes.validator.score_cache import ScoreCache, ScoreCacheStats
+from hermes.validator.state_store import StateStore
 
 
 class ScorerManager:
     llm_score: ChatOpenAI
+    llm_score_fast: ChatOpenAI | None
     overall_ema: EMAUpdater
     synthetic_ema: EMAUpdater
-    score_state_path: str | Path
+    state_store: StateStore | None
 
-    def __init__(self, llm_score: ChatOpenAI, score_state_path: str | Path = None, ipc_meta_config: dict = None):
+    def __init__(
+        self,
+        llm_score: ChatOpenAI,
+        state_store: StateStore | None = None,
+        ipc_meta_config: dict = None,
+        llm_score_fast: ChatOpenAI | None = None,
+    ):
         self.overall_ema = EMAUpdater(alpha=0.5)
         self.synthetic_ema = EMAUpdater(alpha=0.5)
         self.llm_score = llm_score
-        self.score_state_path = score_state_path
+        # Cheap first tier of cascaded scoring, None scores everything with llm_score
+        self.llm_score_fast = llm_score_fast
+        self.cascade_min_confidence = float(os.getenv("SCORE_CASCADE_MIN_CONFIDENCE", 0.8))
+        self.cascade_margin = float(os.getenv("SCORE_CASCADE_MARGIN", 1.0))  # score points around organic_success_score_threshold
+        self.cascade_stats: dict[int, CascadeStats] = {}  # round_id -> stats
+        self.state_store = state_store
         self.ipc_meta_config = ipc_meta_config
+        # Miner answers graded per LLM call against the same ground truth. Opt-in: a batched prompt lets
+        # one answer's injected text sway its neighbours' scores, check with scripts.eval_batch_scoring first
+        self.score_batch_size = max(1, int(os.getenv("SCORE_BATCH_SIZE", 1)))
+        self.score_cache_stats: dict[int, ScoreCacheStats] = {}  # round_id -> stats
+        # Node types whose clear numeric/identifier matches skip the LLM (e.g. "subql,thegraph").
+        # Off until scripts.eval_fast_scorer shows the matches agree with recorded LLM scores
+        self.fast_scorer = FastScorer()
+        self.fast_score_node_types = {
+            t.strip() for t in os.getenv("FAST_SCORE_NODE_TYPES", "").split(",") if t.strip()
+        }
+        # Of those, node types whose clear contradictions also score 0 without the LLM, off for the same reason
+        self.fast_contradiction_node_types = {
+            t.strip() for t in os.getenv("FAST_SCORE_CONTRADICTION_NODE_TYPES", "").split(",") if t.strip()
+        }
         self.load_state()
 
     async def compute_challenge_score(
@@ -45,45 +80,175 @@ class ScorerManager:
         round_id: int = 0,
         node_type: str = ""
     ) -> Tuple[List[float], List[float], List[float], List[float], List[str], List[dict]]:
-        elapse_time = [r.elapsed_time for r in miner_synapses]
-        elapse_weights = [
-            utils.fix_float(
-                utils.get_elapse_weight_quadratic(
-                    r.elapsed_time,
-                    ground_cost,
-                    min_latency_improvement_ratio
-                )
-            ) for r in miner_synapses
-        ]
-        
-        # Only calculate ground truth scores for miners with non-zero elapse weights
-        valid_miners = [(r, i) for i, (r, w) in enumerate(zip(miner_synapses, elapse_weights)) if w > 0]
-        
-        if valid_miners:
-            import random
-            semaphore = asyncio.Semaphore(20)
-            
-            async def score_with_semaphore(ground_truth, miner_synapse, cid_hash, token_usage_metrics, round_id):
+        _, *scores = await self.compute_challenge_score_stream(
+            ground_truth,
+            ground_cost,
+            utils.aiter_indexed(miner_synapses),
+            len(miner_synapses),
+            challenge_id=challenge_id,
+            cid_hash=cid_hash,
+            token_usage_metrics=token_usage_metrics,
+            min_latency_improvement_ratio=min_latency_improvement_ratio,
+            round_id=round_id,
+            node_type=node_type,
+        )
+        return tuple(scores)
+
+    async def compute_challenge_score_stream(
+        self,
+        ground_truth: str,
+        ground_cost: float,
+        miner_stream: AsyncIterator[Tuple[int, SyntheticNonStreamSynapse]],
+        total: int,
+        challenge_id: str = "",
+        cid_hash: str = "",
+        token_usage_metrics: TokenUsageMetrics | None = None,
+        min_latency_improvement_ratio: float = 0.2,
+        round_id: int = 0,
+        node_type: str = ""
+    ) -> Tuple[List[SyntheticNonStreamSynapse], List[float], List[float], List[float], List[float], List[str], List[dict]]:
+        """
+        Score miner responses as they arrive from `miner_stream` as `(index, response)` pairs.
+        LLM scoring of fast responders starts while slow miners are still in flight.
+        Returns the responses in index order followed by the same lists as `compute_challenge_score`.
+        """
+        import random
+        semaphore = asyncio.Semaphore(20)
+
+        async def pace():
+            # Without a rate limiter on the client, add a small random delay (200-800ms) to avoid rate limits
+            if self.llm_score.rate_limiter is None:
+                await asyncio.sleep(random.uniform(0.2, 0.8))
+
+        async def score_with_semaphore(ground_truth, miner_synapse, cid_hash, token_usage_metrics, round_id):
+            async with semaphore:
+                await pace()
+                if node_type == GraphqlProvider.CODEX:
+                    return await self.cal_ground_truth_score_codex(ground_truth, miner_synapse, cid_hash, token_usage_metrics, round_id=round_id)
+
+                if self.llm_score_fast is not None and self.is_scoreable(miner_synapse):
+                    results = await self.cal_cascaded_scores(ground_truth, [miner_synapse], cid_hash, token_usage_metrics, round_id=round_id)
+                    return results[0]
+
+                return await self.cal_ground_truth_score(ground_truth, miner_synapse, cid_hash, token_usage_metrics, round_id=round_id)
+
+        async def score_one(i, miner_synapse, future: asyncio.Future | None = None):
+            try:
+                scores[i] = await score_with_semaphore(ground_truth, miner_synapse, cid_hash, token_usage_metrics, round_id)
+            finally:
+                if future is not None:
+                    resolve(future, scores.get(i))
+
+        async def score_batch(batch: List[Tuple[int, SyntheticNonStreamSynapse, asyncio.Future]]):
+            try:
                 async with semaphore:
-                    # Add a small random delay (200-800ms) to avoid rate limits
-                    await asyncio.sleep(random.uniform(0.2, 0.8))
-                    if node_type == GraphqlProvider.CODEX:
-                        return await self.cal_ground_truth_score_codex(ground_truth, miner_synapse, cid_hash, token_usage_metrics, round_id=round_id)
-                    
-                    return await self.cal_ground_truth_score(ground_truth, miner_synapse, cid_hash, token_usage_metrics, round_id=round_id)
-            
-            valid_scores = await asyncio.gather(
-                *(score_with_semaphore(ground_truth, r, cid_hash, token_usage_metrics, round_id) for r, _ in valid_miners)
-            )
-        else:
-            valid_scores = []
-        
+                    await pace()
+                    scorer = self.cal_cascaded_scores if self.llm_score_fast is not None else self.cal_ground_truth_scores_batch
+                    results = await scorer(
+                        ground_truth, [r for _, r, _ in batch], cid_hash, token_usage_metrics, round_id=round_id
+                    )
+                for (i, _, _), result in zip(batch, results):
+                    scores[i] = result
+            finally:
+                for i, _, future in batch:
+                    resolve(future, scores.get(i))
+
+        async def score_duplicate(i, miner_synapse, future: asyncio.Future):
+            try:
+                score, error = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled() or asyncio.current_task().cancelling():
+                    raise
+                # The owner gave up without a score
+                score, error = None, "abandoned"
+            if error:
+                # Don't hand one failed LLM call to every miner with the same answer
+                score, error = await score_with_semaphore(ground_truth, miner_synapse, cid_hash, token_usage_metrics, round_id)
+            scores[i] = (dict(score) if isinstance(score, dict) else score, error)
+
+        def resolve(future: asyncio.Future, result: tuple | None):
+            if result is None:
+                score_cache.abandon(future)
+            else:
+                score_cache.resolve(future, result)
+
+        # Codex scoring is a multi-step query/answer rubric and stays one answer per call, on llm_score
+        batch_size = self.score_batch_size if node_type != GraphqlProvider.CODEX else 1
+        # Equivalent answers to this challenge are scored once
+        score_cache = ScoreCache(challenge_id, ground_truth)
+        # Codex answers embed their GraphQL queries, so facts can't be compared directly
+        fast_path = node_type in self.fast_score_node_types and node_type != GraphqlProvider.CODEX
+        fast_contradictions = node_type in self.fast_contradiction_node_types
+        fast_scored = 0
+
+        miner_synapses: List[SyntheticNonStreamSynapse | None] = [None] * total
+        elapse_weights = [0.0] * total
+
+        # Only calculate ground truth scores for miners with non-zero elapse weights
+        scores: dict[int, tuple] = {}
+        scoring_tasks: List[asyncio.Task] = []
+        pending_batch: List[Tuple[int, SyntheticNonStreamSynapse, asyncio.Future]] = []
+        try:
+            async for i, r in miner_stream:
+                if r is None:
+                    # Left unscored, the caller fills the position with a placeholder
+                    continue
+                miner_synapses[i] = r
+                elapse_weights[i] = utils.fix_float(
+                    utils.get_elapse_weight_quadratic(
+                        r.elapsed_time,
+                        ground_cost,
+                        min_latency_improvement_ratio
+                    )
+                )
+                if elapse_weights[i] <= 0:
+                    continue
+                if not self.is_scoreable(r):
+                    scoring_tasks.append(asyncio.create_task(score_one(i, r)))
+                    continue
+
+                fast_score = self.fast_scorer.score(ground_truth, r.response) if fast_path else None
+                if fast_score is not None and (fast_score.decision == MATCH or fast_contradictions):
+                    scores[i] = (str(fast_score.score), "")
+                    fast_scored += 1
+                    continue
+
+                future, owner = score_cache.claim(r.response)
+                if not owner:
+                    scoring_tasks.append(asyncio.create_task(score_duplicate(i, r, future)))
+                elif batch_size == 1:
+                    scoring_tasks.append(asyncio.create_task(score_one(i, r, future)))
+                else:
+                    pending_batch.append((i, r, future))
+                    if len(pending_batch) >= batch_size:
+                        scoring_tasks.append(asyncio.create_task(score_batch(pending_batch)))
+                        pending_batch = []
+            if pending_batch:
+                scoring_tasks.append(asyncio.create_task(score_batch(pending_batch)))
+                pending_batch = []
+            await asyncio.gather(*scoring_tasks)
+        except BaseException:
+            for task in scoring_tasks:
+                task.cancel()
+            for _, _, future in pending_batch:
+                score_cache.abandon(future)
+            raise
+        finally:
+            self.record_score_cache_stats(round_id, score_cache.stats)
+
+        logger.debug(
+            f"[ScorerManager] - {challenge_id} score cache: {score_cache.stats.distinct} distinct answers, "
+            f"{score_cache.stats.reused} reused ({score_cache.stats.hit_rate:.1%}), {fast_scored} scored without LLM"
+        )
+
+        elapse_time = [r.elapsed_time if r is not None else 0.0 for r in miner_synapses]
+
         # Reconstruct ground_truth_scores_raw in original order
-        ground_truth_scores_value = ["0.0"] * len(miner_synapses)
-        ground_truth_scores_raw = [{"answer": 0, "query": 0, "total": 0}] * len(miner_synapses)
-        ground_truth_scores_error = [""] * len(miner_synapses)
+        ground_truth_scores_value = ["0.0"] * total
+        ground_truth_scores_raw = [{"answer": 0, "query": 0, "total": 0}] * total
+        ground_truth_scores_error = [""] * total
 
-        for (_, i), (score, error) in zip(valid_miners, valid_scores):
+        for i, (score, error) in scores.items():
             ground_truth_scores_value[i] = score.get('total') if isinstance(score, dict) else score
             ground_truth_scores_raw[i] = score
             ground_truth_scores_error[i] = error
@@ -92,7 +257,161 @@ class ScorerManager:
         zip_scores = [utils.fix_float(s * w) for s, w in zip(ground_truth_scores, elapse_weights)]
 
         logger.debug(f"[ScorerManager] - {challenge_id} ground_truth_scores: {ground_truth_scores_value}, elapse_time: {elapse_time}, elapse_weights: {elapse_weights}, zip_scores: {zip_scores}")
-        return zip_scores, ground_truth_scores, elapse_weights, elapse_time, ground_truth_scores_error, ground_truth_scores_raw
+        return miner_synapses, zip_scores, ground_truth_scores, elapse_weights, elapse_time, ground_truth_scores_error, ground_truth_scores_raw
+
+    def record_score_cache_stats(self, round_id: int | str, stats: ScoreCacheStats):
+        self.score_cache_stats.setdefault(round_id, ScoreCacheStats()).merge(stats)
+
+    def pop_score_cache_stats(self, round_id: int | str) -> ScoreCacheStats | None:
+        """Score cache counters accumulated for `round_id`, removing them."""
+        return self.score_cache_stats.pop(round_id, None)
+
+    def record_cascade_stats(self, round_id: int | str, stats: CascadeStats):
+        self.cascade_stats.setdefault(round_id, CascadeStats()).merge(stats)
+
+    def pop_cascade_stats(self, round_id: int | str) -> CascadeStats | None:
+        """Cascade escalation counters accumulated for `round_id`, removing them."""
+        return self.cascade_stats.pop(round_id, None)
+
+    def is_scoreable(self, miner_synapse: SyntheticNonStreamSynapse) -> bool:
+        """Whether the response needs an LLM call, i.e. `cal_ground_truth_score` won't short-circuit it to 0."""
+        if not miner_synapse.response or miner_synapse.status_code != 200:
+            return False
+        suspicious_uids = self.ipc_meta_config.get("suspicious_uids", []) if self.ipc_meta_config else []
+        return miner_synapse.uid not in suspicious_uids
+
+    async def cal_ground_truth_scores_batch(
+            self,
+            ground_truth: str,
+            miner_synapses: List[SyntheticNonStreamSynapse],
+            cid_hash: str = "",
+            token_usage_metrics: TokenUsageMetrics | None = None,
+            round_id: int = 0
+        ) -> List[tuple[str, str]]:
+        """
+        Grade several answers against the same ground truth in one LLM call.
+        Answers whose score can't be read from the reply are scored one by one.
+        """
+        if len(miner_synapses) == 1 or not all(self.is_scoreable(r) for r in miner_synapses):
+            return list(await asyncio.gather(*[
+                self.cal_ground_truth_score(ground_truth, r, cid_hash, token_usage_metrics, round_id=round_id)
+                for r in miner_synapses
+            ]))
+
+        json_data = create_batch_scoring_json(ground_truth, [r.response for r in miner_synapses])
+        question_prompt = BATCH_SCORE_PROMPT.template.replace("{json_data}", json_data)
+        try:
+            summary_response = await self.llm_score.ainvoke([HumanMessage(content=question_prompt)])
+            if token_usage_metrics is not None:
+                d = token_usage_metrics.parse(
+                    cid_hash, phase=Phase.GENERATE_MINER_GROUND_TRUTH_SCORE, response=summary_response, extra={"round_id": round_id}
+                )
+                token_usage_metrics.append(d)
+
+        except Exception as e:
+            logger.error(f"[ScorerManager] - LLM batch scoring error: {e}")
+            return [("0.0", f"LLM scoring error: {e}")] * len(miner_synapses)
+
+        raw_json = summary_response.content.strip() if summary_response.content else "[]"
+        parsed = self.parse_batch_scores(raw_json, len(miner_synapses))
+
+        results: List[tuple[str, str] | None] = [(str(p[0]), "") if p is not None else None for p in parsed]
+        fallback = [i for i, result in enumerate(results) if result is None]
+        if fallback:
+            logger.warning(
+                f"[ScorerManager] - batch scoring: {len(fallback)}/{len(miner_synapses)} scores unreadable, "
+                f"rescoring them one by one. Response: {raw_json[:500]}"
+            )
+            fallback_results = await asyncio.gather(*[
+                self.cal_ground_truth_score(ground_truth, miner_synapses[i], cid_hash, token_usage_metrics, round_id=round_id)
+                for i in fallback
+            ])
+            for i, result in zip(fallback, fallback_results):
+                results[i] = result
+        return results
+
+    async def cal_cascaded_scores(
+            self,
+            ground_truth: str,
+            miner_synapses: List[SyntheticNonStreamSynapse],
+            cid_hash: str = "",
+            token_usage_metrics: TokenUsageMetrics | None = None,
+            round_id: int = 0
+        ) -> List[tuple[str, str]]:
+        """
+        Grade with the fast model first and re-grade with the strong model (batched)
+        only the answers it is unsure about or that sit near the success threshold.
+        """
+        graded: List[tuple[float, float | None] | None] = [None] * len(miner_synapses)
+        json_data = create_batch_scoring_json(ground_truth, [r.response for r in miner_synapses])
+        question_prompt = BATCH_SCORE_WITH_CONFIDENCE_PROMPT.template.replace("{json_data}", json_data)
+        try:
+            summary_response = await self.llm_score_fast.ainvoke([HumanMessage(content=question_prompt)])
+            if token_usage_metrics is not None:
+                d = token_usage_metrics.parse(
+                    cid_hash, phase=Phase.GENERATE_MINER_GROUND_TRUTH_SCORE, response=summary_response, extra={"round_id": round_id}
+                )
+                token_usage_metrics.append(d)
+            raw_json = summary_response.content.strip() if summary_response.content else "[]"
+            graded = self.parse_batch_scores(raw_json, len(miner_synapses), with_confidence=True)
+        except Exception as e:
+            logger.warning(f"[ScorerManager] - fast model scoring error, escalating {len(miner_synapses)} answers: {e}")
+
+        threshold = self.ipc_meta_config.get("organic_success_score_threshold", 5) if self.ipc_meta_config else 5
+        escalate = [
+            i for i, g in enumerate(graded)
+            if needs_escalation(g, self.cascade_min_confidence, threshold, self.cascade_margin)
+        ]
+        self.record_cascade_stats(round_id, CascadeStats(graded=len(miner_synapses), escalated=len(escalate)))
+
+        results: List[tuple[str, str]] = [(str(g[0]), "") if g is not None else ("0.0", "") for g in graded]
+        if escalate:
+            escalated_results = await self.cal_ground_truth_scores_batch(
+                ground_truth, [miner_synapses[i] for i in escalate], cid_hash, token_usage_metrics, round_id=round_id
+            )
+            for i, result in zip(escalate, escalated_results):
+                results[i] = result
+        return results
+
+    @staticmethod
+    def parse_batch_scores(raw_json: str, count: int, with_confidence: bool = False) -> List[tuple[float, float | None] | None]:
+        """
+        Read `[{"id": .., "score": .., "confidence": ..}, ...]` into a list of `count`
+        `(score, confidence)` pairs; confidence is None unless `with_confidence`.
+        Entries that are missing, duplicated or out of range are None.
+        """
+        scores: List[tuple[float, float | None] | None] = [None] * count
+        try:
+            data = json.loads(utils.sanitize_json_string(raw_json))
+        except json.JSONDecodeError:
+            return scores
+
+        if isinstance(data, dict):
+            data = data.get("scores", [])
+        if not isinstance(data, list):
+            return scores
+
+        seen = set()
+        for item in data:
+            if not isinstance(item, dict):
+                continue
+            try:
+                idx = int(item.get("id"))
+                score = float(item.get("score"))
+                confidence = float(item.get("confidence")) if with_confidence else None
+            except (TypeError, ValueError):
+                continue
+            if not 0 <= idx < count or not 0.0 <= score <= 10.0:
+                continue
+            if confidence is not None and not 0.0 <= confidence <= 1.0:
+                continue
+            if idx in seen:
+                # Conflicting entries for one answer: trust neither
+                scores[idx] = None
+                continue
+            seen.add(idx)
+            scores[idx] = (score, confidence)
+        return scores
 
     async def cal_ground_truth_score(
             self,
@@ -214,20 +533,17 @@ class ScorerManager:
             return
 
         suspicious_uids = self.ipc_meta_config.get("suspicious_uids", []) if self.ipc_meta_config else []
-        synthetic_scores = np.array(project_score_matrix).sum(axis=0).tolist()
+        synthetic_scores = np.asarray(project_score_matrix, dtype=np.float64).sum(axis=0)
         self.synthetic_ema.update(uids, hotkeys, synthetic_scores, suspicious_uids, ema_score_alpha)
 
+        score_matrix = synthetic_scores
         if workload_score is not None:
-            merged = project_score_matrix + [workload_score]
-        else:
-            merged = project_score_matrix
+            score_matrix = synthetic_scores + np.asarray(workload_score, dtype=np.float64)
 
-        score_matrix = np.array(merged)
-        score_matrix = score_matrix.sum(axis=0)
-        
-        new_scores = self.overall_ema.update(uids, hotkeys, score_matrix.tolist(), suspicious_uids, ema_score_alpha)
+        self.overall_ema.update(uids, hotkeys, score_matrix, suspicious_uids, ema_score_alpha)
+        new_scores = self.overall_ema.last_scores
         self.save_state(new_scores)
-        logger.debug(f"[ScorerManager] - {challenge_id} uids: {uids}, project_score_matrix: {project_score_matrix}, workload_score: {workload_score}, merged: {merged}, score_matrix: {score_matrix.tolist()}, updated_ema_scores: {new_scores}")
+        logger.debug(f"[ScorerManager] - {challenge_id} uids: {uids}, project_score_matrix: {project_score_matrix}, workload_score: {workload_score}, score_matrix: {score_matrix.tolist()}, updated_ema_scores: {new_scores}")
         return new_scores
 
 
@@ -237,40 +553,25 @@ class ScorerManager:
     def get_last_synthetic_scores(self):
         return self.synthetic_ema.last_scores
 
+    def get_last_overall_score_arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        """`(uids, scores)` of the overall EMA, ordered by uid, for weight setting."""
+        return self.overall_ema.arrays()
+
     def load_state(self):
+        if self.state_store is None:
+            return
         try:
-            if not self.score_state_path or not os.path.exists(self.score_state_path):
-                return
-
-            state: dict = torch.load(str(self.score_state_path))
-            timestamp = state.get("timestamp", 0)
-
-            # only load state within 3 days
-            if abs(int(time.time()) - timestamp) > 3 * 24 * 3600:
-                return
-            
-            if "scores" in state:
-                self.overall_ema.load(state["scores"])
-                logger.info(f"[ScorerManager] Load state from {self.score_state_path}, scores: {state['scores']}")
-
+            scores = self.state_store.load_scores("overall")
+            if scores:
+                self.overall_ema.load(scores)
+                logger.info(f"[ScorerManager] Load state from {self.state_store.db_path}, scores: {scores}")
         except Exception as e:
             logger.error(f"[ScorerManager] Load state error: {e}")
 
-    def save_state(self, new_scores: dict[str, tuple[float, str]]):
+    def save_state(self, new_scores: dict[int, tuple[float, str]]):
+        if self.state_store is None:
+            return
         try:
-            if not self.score_state_path:
-                return
-
-            dir_path = os.path.dirname(self.score_state_path)
-            if dir_path and not os.path.exists(dir_path):
-                os.makedirs(dir_path, exist_ok=True)
-
-            torch.save(
-                {
-                    "timestamp": int(time.time()),
-                    "scores": new_scores,
-                },
-                str(self.score_state_path)
-            )
+            self.state_store.save_scores("overall", new_scores)
         except Exception as e:
-            logger.error(f"[ChallengeManager] Save state error: {e}")
+            logger.error(f"[ScorerManager] Save state error: {e}")
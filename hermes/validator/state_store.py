@@ -0,0 +1,288 @@
+"""
+Validator scoring state (EMA scores, organic workload counters and quality
+samples) in one SQLite database.
+
+Every save replaces one section in a single transaction on a WAL database with
+synchronous=FULL, so a crash or kill -9 leaves either the previous or the new
+section, never a torn file. Saves are handed to a writer thread and coalesced
+per section, the event loop only takes a snapshot of the data.
+"""
+import json
+import os
+from pathlib import Path
+import _compat_pickle
+import pickle
+import sqlite3
+import threading
+import time
+import zipfile
+from loguru import logger
+
+
+# Schema version N is reached by running _MIGRATIONS[:N] in order, never edit a released step
+_MIGRATIONS = [
+    """
+    CREATE TABLE sections (
+        name TEXT PRIMARY KEY,
+        updated_at INTEGER NOT NULL
+    );
+    CREATE TABLE ema_scores (
+        name TEXT NOT NULL,
+        uid INTEGER NOT NULL,
+        score REAL NOT NULL,
+        hotkey TEXT,
+        PRIMARY KEY (name, uid)
+    );
+    CREATE TABLE workload_counters (
+        uid INTEGER PRIMARY KEY,
+        hotkey TEXT,
+        buckets TEXT NOT NULL
+    );
+    CREATE TABLE quality_scores (
+        uid INTEGER PRIMARY KEY,
+        scores TEXT NOT NULL
+    );
+    """,
+]
+SCHEMA_VERSION = len(_MIGRATIONS)
+
+WORKLOADS = "workloads"
+QUALITY_SCORES = "quality_scores"
+
+
+def _scores_section(name: str) -> str:
+    return f"scores:{name}"
+
+
+class StateStore:
+    def __init__(self, db_path: str | Path, max_age: int = 3 * 24 * 3600):
+        self.db_path = str(db_path)
+        self.max_age = max_age  # seconds, older sections are not loaded
+
+        dir_path = os.path.dirname(self.db_path)
+        if dir_path and not os.path.exists(dir_path):
+            os.makedirs(dir_path, exist_ok=True)
+
+        # The event loop thread reads on _conn, the writer thread alone writes on _write_conn;
+        # WAL lets the reads go on next to a write and see only committed sections
+        self._conn = self._connect()
+        self._migrate()
+        self._write_conn = self._connect()
+
+        self._pending: dict[str, tuple] = {}  # section -> latest (writer, args, updated_at) not yet written
+        self._writing = False
+        self._closed = False
+        self._cond = threading.Condition()
+        self._writer = threading.Thread(target=self._write_loop, name="StateStoreWriter", daemon=True)
+        self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=FULL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        return conn
+
+    def _migrate(self):
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version > SCHEMA_VERSION:
+            raise RuntimeError(f"state store {self.db_path} has schema v{version}, newer than supported v{SCHEMA_VERSION}")
+        for target in range(version + 1, SCHEMA_VERSION + 1):
+            # user_version is part of the database header, so it commits with the step
+            self._conn.executescript(
+                f"BEGIN;\n{_MIGRATIONS[target - 1]}\nPRAGMA user_version = {target};\nCOMMIT;"
+            )
+            logger.info(f"[StateStore] Migrated {self.db_path} to schema v{target}")
+
+    # Reads, synchronous, meant for startup
+
+    def _fresh(self, section: str) -> bool:
+        row = self._conn.execute("SELECT updated_at FROM sections WHERE name = ?", (section,)).fetchone()
+        return row is not None and abs(int(time.time()) - row[0]) <= self.max_age
+
+    def has_section(self, section: str) -> bool:
+        return self._conn.execute("SELECT 1 FROM sections WHERE name = ?", (section,)).fetchone() is not None
+
+    def load_scores(self, name: str) -> dict[int, tuple[float, str | None]] | None:
+        """{uid: (score, hotkey)} of the EMA `name`, None when missing or stale."""
+        if not self._fresh(_scores_section(name)):
+            return None
+        rows = self._conn.execute("SELECT uid, score, hotkey FROM ema_scores WHERE name = ? ORDER BY uid", (name,))
+        return {uid: (score, hotkey) for uid, score, hotkey in rows}
+
+    def load_workloads(self) -> dict[int, dict] | None:
+        """{uid: WorkloadCounter.to_state() entry}, None when missing or stale."""
+        if not self._fresh(WORKLOADS):
+            return None
+        rows = self._conn.execute("SELECT uid, hotkey, buckets FROM workload_counters ORDER BY uid")
+        return {
+            uid: {"uid": uid, "hotkey": hotkey, "buckets": {int(k): v for k, v in json.loads(buckets).items()}}
+            for uid, hotkey, buckets in rows
+        }
+
+    def load_quality_scores(self) -> dict[int, list[float]] | None:
+        if not self._fresh(QUALITY_SCORES):
+            return None
+        rows = self._conn.execute("SELECT uid, scores FROM quality_scores ORDER BY uid")
+        return {uid: json.loads(scores) for uid, scores in rows}
+
+    # Writes, queued for the writer thread
+
+    def save_scores(self, name: str, scores: dict[int, tuple[float, str | None]]):
+        rows = [(name, int(uid), float(score), hotkey) for uid, (score, hotkey) in scores.items()]
+        self._submit(_scores_section(name), self._write_scores, name, rows)
+
+    def save_workloads(self, works: dict[int, dict]):
+        rows = [(int(uid), data["hotkey"], json.dumps(data["buckets"])) for uid, data in works.items()]
+        self._submit(WORKLOADS, self._write_workloads, rows)
+
+    def save_quality_scores(self, quality_scores: dict[int, list[float]]):
+        rows = [(int(uid), json.dumps(list(scores))) for uid, scores in quality_scores.items()]
+        self._submit(QUALITY_SCORES, self._write_quality_scores, rows)
+
+    def _submit(self, section: str, writer, *args, updated_at: int | None = None):
+        with self._cond:
+            if self._closed:
+                logger.warning(f"[StateStore] Dropping save of {section}, store is closed")
+                return
+            # A newer snapshot of a section supersedes one still waiting
+            self._pending[section] = (writer, args, updated_at)
+            self._cond.notify_all()
+
+    def _write_scores(self, name: str, rows: list[tuple]):
+        self._write_conn.execute("DELETE FROM ema_scores WHERE name = ?", (name,))
+        self._write_conn.executemany("INSERT INTO ema_scores (name, uid, score, hotkey) VALUES (?, ?, ?, ?)", rows)
+
+    def _write_workloads(self, rows: list[tuple]):
+        self._write_conn.execute("DELETE FROM workload_counters")
+        self._write_conn.executemany("INSERT INTO workload_counters (uid, hotkey, buckets) VALUES (?, ?, ?)", rows)
+
+    def _write_quality_scores(self, rows: list[tuple]):
+        self._write_conn.execute("DELETE FROM quality_scores")
+        self._write_conn.executemany("INSERT INTO quality_scores (uid, scores) VALUES (?, ?)", rows)
+
+    def _write(self, section: str, writer, args: tuple, updated_at: int | None = None):
+        """Writer thread only."""
+        conn = self._write_conn
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            writer(*args)
+            conn.execute(
+                "INSERT OR REPLACE INTO sections (name, updated_at) VALUES (?, ?)",
+                (section, updated_at if updated_at is not None else int(time.time())),
+            )
+            conn.execute("COMMIT")
+        except Exception as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            logger.error(f"[StateStore] Save {section} error: {e}")
+
+    def _write_loop(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                batch = self._pending
+                self._pending = {}
+                self._writing = True
+            try:
+                for section, (writer, args, updated_at) in batch.items():
+                    self._write(section, writer, args, updated_at)
+            finally:
+                with self._cond:
+                    self._writing = False
+                    self._cond.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every queued save is written; False on timeout."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending and not self._writing, timeout)
+
+    def close(self, timeout: float | None = 30):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._writer.join(timeout)
+        if self._writer.is_alive():
+            logger.warning(f"[StateStore] Writer still busy after {timeout}s, closing without waiting")
+            return
+        self._write_conn.close()
+        self._conn.close()
+
+    def import_legacy(self, score_state_path: str | Path | None = None, work_state_path: str | Path | None = None):
+        """One-time import of the torch.save snapshots used before this store; sections already here win."""
+        imported = []
+        for path, key in ((score_state_path, "scores"), (work_state_path, "works")):
+            if not path or not os.path.exists(path):
+                continue
+            section = _scores_section("overall") if key == "scores" else WORKLOADS
+            if self.has_section(section):
+                continue
+            try:
+                state = read_torch_snapshot(path)
+            except Exception as e:
+                logger.error(f"[StateStore] Failed to read legacy state {path}: {e}")
+                continue
+
+            if key in state:
+                # Keep the snapshot's age so the freshness rule still applies
+                timestamp = int(state.get("timestamp", 0))
+                if key == "scores":
+                    rows = [("overall", int(uid), float(score), hotkey) for uid, (score, hotkey) in state[key].items()]
+                    self._submit(section, self._write_scores, "overall", rows, updated_at=timestamp)
+                else:
+                    rows = [(int(uid), data["hotkey"], json.dumps(data["buckets"])) for uid, data in state[key].items()]
+                    self._submit(section, self._write_workloads, rows, updated_at=timestamp)
+            imported.append(path)
+
+        # The writer thread does the writes; set the snapshots aside only once they are in
+        if imported and not self.flush(timeout=60):
+            logger.warning("[StateStore] Legacy import still being written, keeping the snapshots for the next start")
+            return
+        for path in imported:
+            os.replace(path, f"{path}.imported")
+            logger.info(f"[StateStore] Imported legacy state {path}")
+
+
+# Everything the legacy score and workload snapshots were built from; numpy scalars for EMA values
+_SNAPSHOT_GLOBALS = {
+    ("builtins", name) for name in (
+        "dict", "list", "tuple", "set", "frozenset", "int", "float", "complex", "str", "bytes", "bytearray", "bool",
+    )
+} | {
+    ("collections", "OrderedDict"),
+    ("collections", "defaultdict"),
+    ("collections", "deque"),
+    ("numpy", "dtype"),
+    ("numpy.core.multiarray", "scalar"),
+    ("numpy._core.multiarray", "scalar"),
+}
+
+
+class _NoTensorUnpickler(pickle.Unpickler):
+    def find_class(self, module, name):
+        # torch.save writes protocol 2, which names builtins the Python 2 way (__builtin__.long)
+        module, name = _compat_pickle.NAME_MAPPING.get(
+            (module, name), (_compat_pickle.IMPORT_MAPPING.get(module, module), name)
+        )
+        if (module, name) not in _SNAPSHOT_GLOBALS:
+            raise pickle.UnpicklingError(f"snapshot references {module}.{name}, which a state file never holds")
+        return super().find_class(module, name)
+
+    def persistent_load(self, pid):
+        raise pickle.UnpicklingError(f"snapshot holds tensor data ({pid[0]}), torch is needed to read it")
+
+
+def read_torch_snapshot(path: str | Path):
+    """
+    A `torch.save` file of plain Python objects, read without importing torch.
+    The zip format keeps the pickled object in `<name>/data.pkl`; tensors would be
+    persistent references into other entries, which the state files never had.
+    Only the plain containers and scalars in `_SNAPSHOT_GLOBALS` are loaded.
+    """
+    with zipfile.ZipFile(path) as archive:
+        name = next(n for n in archive.namelist() if n.endswith("/data.pkl") or n == "data.pkl")
+        with archive.open(name) as f:
+            return _NoTensorUnpickler(f).load()
@@ -0,0 +1,178 @@
+from typing import Sequence
+import time
+import numpy as np
+
+
+class WorkloadCounter:
+    """
+    Organic request counts per uid over a sliding window of hourly buckets.
+
+    Counts live in a (uids x window_hours) table whose columns are a ring:
+    bucket `b` is column `b % window_hours`, and a column is zeroed for every
+    uid when the ring comes back to it for a newer bucket. A tick is a single
+    increment, window totals are one masked sum over the table, and buckets
+    that left the window never need cleaning up. A new hotkey on a uid
+    restarts its counts.
+    """
+
+    def __init__(self, window_hours: int = 3, bucket_seconds: int = 3600, capacity: int = 256):
+        self.window = window_hours
+        self.bucket_seconds = bucket_seconds
+
+        self._counts = np.zeros((capacity, window_hours), dtype=np.int32)
+        self._bucket_ids = np.full(window_hours, -1, dtype=np.int64)  # bucket held by each column
+        self._hotkeys = np.full(capacity, "", dtype=object)
+        self._present = np.zeros(capacity, dtype=bool)  # uid has a counter
+        self._tick_bucket = self._tick_column = -1  # column of the bucket last ticked
+
+    def _reserve(self, max_uid: int):
+        size = len(self._present)
+        if max_uid < size:
+            return
+        new_size = max(max_uid + 1, size * 2)
+        self._counts = np.concatenate([self._counts, np.zeros((new_size - size, self.window), dtype=np.int32)])
+        self._hotkeys = np.concatenate([self._hotkeys, np.full(new_size - size, "", dtype=object)])
+        self._present = np.concatenate([self._present, np.zeros(new_size - size, dtype=bool)])
+
+    def _bucket(self, now: float | None) -> int:
+        return int(now if now is not None else time.time()) // self.bucket_seconds
+
+    def _column(self, bucket: int) -> int:
+        column = bucket % self.window
+        if self._bucket_ids[column] < bucket:
+            self._counts[:, column] = 0
+            self._bucket_ids[column] = bucket
+        return column
+
+    def _in_window(self, bucket: int) -> np.ndarray:
+        return (self._bucket_ids > bucket - self.window) & (self._bucket_ids <= bucket)
+
+    def __contains__(self, uid: int) -> bool:
+        return 0 <= uid < len(self._present) and bool(self._present[uid])
+
+    def __len__(self) -> int:
+        return int(self._present.sum())
+
+    def uids(self) -> np.ndarray:
+        return np.flatnonzero(self._present)
+
+    def hotkey(self, uid: int) -> str | None:
+        return (self._hotkeys[uid] or None) if uid in self else None
+
+    def tick(self, uid: int, hotkey: str, now: float | None = None) -> int:
+        """Count one request of `uid`; returns its count in the current bucket."""
+        self._reserve(uid)
+        bucket = self._bucket(now)
+        if bucket != self._tick_bucket:
+            self._tick_bucket, self._tick_column = bucket, self._column(bucket)
+        if not self._present[uid] or self._hotkeys[uid] != hotkey:
+            if self._present[uid]:
+                self._counts[uid] = 0
+            self._hotkeys[uid] = hotkey
+            self._present[uid] = True
+        count = self._counts[uid, self._tick_column] + 1
+        self._counts[uid, self._tick_column] = count
+        return int(count)
+
+    def counts(
+        self,
+        uids: Sequence[int] | np.ndarray,
+        hotkeys: Sequence[str] | None = None,
+        now: float | None = None,
+    ) -> np.ndarray:
+        """Window totals of `uids`, starting a counter for unknown ones; a different hotkey resets the uid."""
+        uids = np.asarray(uids, dtype=np.int64)
+        if not len(uids):
+            return np.zeros(0, dtype=np.int64)
+        self._reserve(int(uids.max()))
+
+        if hotkeys is not None:
+            hotkeys = np.asarray([hk or "" for hk in hotkeys], dtype=object)
+            given = hotkeys != ""
+            changed = given & self._present[uids] & (self._hotkeys[uids] != hotkeys)
+            self._counts[uids[changed]] = 0
+            self._hotkeys[uids[given]] = hotkeys[given]
+        self._present[uids] = True
+
+        mask = self._in_window(self._bucket(now)).astype(np.int64)
+        return self._counts[uids] @ mask
+
+    def buckets(self, uid: int, now: float | None = None) -> dict[int, int]:
+        """{bucket_id: count} of `uid` in the window, empty buckets left out."""
+        if uid not in self:
+            return {}
+        columns = np.flatnonzero(self._in_window(self._bucket(now)) & (self._counts[uid] > 0))
+        return {int(self._bucket_ids[c]): int(self._counts[uid, c]) for c in columns}
+
+    def purge(self, now: float | None = None) -> list[int]:
+        """Forget uids with nothing in the window; returns them."""
+        mask = self._in_window(self._bucket(now)).astype(np.int64)
+        idle = np.flatnonzero(self._present & ((self._counts @ mask) == 0))
+        self._counts[idle] = 0
+        self._hotkeys[idle] = ""
+        self._present[idle] = False
+        return idle.tolist()
+
+    def to_state(self, now: float | None = None) -> dict[int, dict]:
+        """{uid: {"uid", "hotkey", "buckets"}} for StateStore.save_workloads, only non-empty buckets in the window."""
+        uids = self.uids()
+        columns = np.flatnonzero(self._in_window(self._bucket(now)))
+        state = {
+            uid: {"uid": uid, "hotkey": hotkey, "buckets": {}}
+            for uid, hotkey in zip(uids.tolist(), self._hotkeys[uids].tolist())
+        }
+        rows, cols = np.nonzero(self._counts[np.ix_(uids, columns)])
+        for uid, bucket, count in zip(
+            uids[rows].tolist(),
+            self._bucket_ids[columns[cols]].tolist(),
+            self._counts[uids[rows], columns[cols]].tolist(),
+        ):
+            state[uid]["buckets"][bucket] = count
+        return state
+
+    def load(self, state: dict[int, dict], now: float | None = None):
+        """Restore `to_state` output; buckets outside the window are dropped."""
+        current = self._bucket(now)
+        for uid, data in state.items():
+            uid = int(uid)
+            self._reserve(uid)
+            self._counts[uid] = 0
+            self._hotkeys[uid] = data.get("hotkey") or ""
+            self._present[uid] = True
+            for bucket, count in data.get("buckets", {}).items():
+                bucket = int(bucket)
+                if current - self.window < bucket <= current:
+                    self._counts[uid, self._column(bucket)] += int(count)
+
+
+def compute_workload_scores(
+    workload_counts: np.ndarray,
+    quality_scores: Sequence[Sequence[float]],
+    alpha: float = 0.7,
+) -> np.ndarray:
+    """
+    0.5 * EMA of each uid's quality samples + 0.5 * its min-max normalized
+    workload, capped at 5 and truncated to 2 decimals like utils.fix_float.
+    """
+    workload_counts = np.asarray(workload_counts, dtype=np.int64)
+    n = len(workload_counts)
+    if not n:
+        return np.zeros(0, dtype=np.float64)
+
+    # Samples left-aligned in a (uids x longest) matrix, the EMA runs over the columns
+    lengths = np.fromiter((len(s) for s in quality_scores), dtype=np.int64, count=n)
+    samples = np.zeros((n, int(lengths.max(initial=0))), dtype=np.float64)
+    for row, scores in enumerate(quality_scores):
+        samples[row, :len(scores)] = list(scores)
+    quality_ema = samples[:, 0].copy() if samples.shape[1] else np.zeros(n, dtype=np.float64)
+    for column in range(1, samples.shape[1]):
+        quality_ema = np.where(column < lengths, alpha * samples[:, column] + (1 - alpha) * quality_ema, quality_ema)
+
+    min_workload, max_workload = workload_counts.min(), workload_counts.max()
+    if max_workload == min_workload:
+        normalized_workload = np.full(n, 0.0 if min_workload == 0 else 0.5)
+    else:
+        normalized_workload = (workload_counts - min_workload) / (max_workload - min_workload)
+
+    scores = np.minimum(0.5 * quality_ema + 0.5 * normalized_workload, 5)
+    return np.trunc(scores * 100) / 100
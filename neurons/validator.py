@@ -20,20 +20,20 @@ import os
 from pathlib import Path
 import random
 import traceback
-import torch.multiprocessing as mp
+import multiprocessing as mp
 import time
 from typing import TYPE_CHECKING
 from fastapi.responses import StreamingResponse
 from loguru import logger
-import uvicorn
 from multiprocessing.synchronize import Event
 from common.table_formatter import table_formatter
+from common.block_height import BlockHeightService
 from common.enums import ErrorCode, RoleFlag
 from common.logger import HermesLogger
 from common.protocol import CapacitySynapse, ChatCompletionRequest, OrganicNonStreamSynapse, OrganicStreamSynapse
 import common.utils as utils
 from common.settings import settings
-from hermes.validator.challenge_manager import ChallengeManager
+from common.shared_ring import DROP_NEWEST, SharedRingBuffer
 from hermes.base import BaseNeuron
 
 if TYPE_CHECKING:
@@ -77,14 +77,17 @@ class Validator(BaseNeuron):
 
     async def run_challenge(
             self,
-            organic_score_queue: list,
+            organic_score_queue: SharedRingBuffer,
             ipc_synthetic_score: list,
             ipc_miners_dict: dict,
             ipc_synthetic_token_usage: list,
             ipc_meta_config: dict,
             ipc_common_config: dict,
             event_stop: Event,
+            ipc_block_heights: dict | None = None,
     ):
+        # Agents, langchain and the scoring stack are only needed in this process
+        from hermes.validator.challenge_manager import ChallengeManager
         from hermes.validator.dendrite import HighConcurrencyDendrite
         dendrite = HighConcurrencyDendrite(wallet=self.settings.wallet)
         try:
@@ -99,7 +102,9 @@ class Validator(BaseNeuron):
                 ipc_synthetic_token_usage=ipc_synthetic_token_usage,
                 ipc_meta_config=ipc_meta_config,
                 ipc_common_config=ipc_common_config,
+                ipc_block_heights=ipc_block_heights,
                 event_stop=event_stop,
+                state_db_path=Path(self.settings.base_dir) / ".data" / f"{self.role}_state.db",
                 score_state_path=Path(self.settings.base_dir) / ".data" / f"{self.role}_score_state.pt",
                 work_state_path=Path(self.settings.base_dir) / ".data" / f"{self.role}_workload_state.pt",
                 v=self,
@@ -115,13 +120,14 @@ class Validator(BaseNeuron):
 
     async def run_api(
             self,
-            organic_score_queue: list,
+            organic_score_queue: SharedRingBuffer,
             ipc_miners_dict: dict[int, dict],
             ipc_synthetic_score: list,
             ipc_synthetic_token_usage: list,
             ipc_common_config: dict,
             ipc_meta_config: dict,
-            event_stop: Event
+            event_stop: Event,
+            ipc_block_heights: dict | None = None,
         ):
         super().start(flag=RoleFlag.VALIDATOR)
         self.organic_score_queue = organic_score_queue
@@ -132,9 +138,17 @@ class Validator(BaseNeuron):
         self.ipc_common_config = ipc_common_config
         self.ipc_meta_config = ipc_meta_config
 
-        # { cid_hash: [block_height, last_acquired_timestamp, node_type, endpoint] }
-        self.block_cache: dict[str, list[int, int, str, str]] = {}
+        # Organic bursts share one cached/coalesced lookup per indexer, kept warm in the background
+        block_height_ttl = float(os.getenv("BLOCK_HEIGHT_TTL", 3))  # seconds
+        self.block_height_service = BlockHeightService(
+            ttl=block_height_ttl,
+            shared=ipc_block_heights,
+            refresh_interval=block_height_ttl,
+        )
+        # { cid_hash: (node_type, endpoint) }
+        self.project_endpoints: dict[str, tuple[str, str]] = {}
         try:
+            import uvicorn
             from hermes.validator.api import app
             
             external_ip = self.settings.external_ip
@@ -252,23 +266,21 @@ class Validator(BaseNeuron):
         await self.cleanup()
 
     async def forward_miner(self, body: ChatCompletionRequest):
-        now = int(time.time())
         cid_hash = body.cid_hash
-        block_height, last_acquired_timestamp, node_type, endpoint = self.block_cache.get(cid_hash, [0, 0, "", ""])
-        if not block_height or abs(now - last_acquired_timestamp) > 3:
-            if not endpoint:
-                project_config = self.ipc_common_config.get(cid_hash, None)
-                if project_config:
-                    node_type = project_config["node_type"]
-                    endpoint = project_config["endpoint"]
-
-            if endpoint:
-                latest_block = await utils.get_latest_block(endpoint, node_type)
-                if latest_block is not None:
-                    block_height = latest_block
-                self.block_cache[cid_hash] = [block_height, now, node_type, endpoint]
-
-        logger.info(f"[Organic] - {body.id} cid_hash: {cid_hash}, block_height: {block_height}, last_acquired_timestamp: {last_acquired_timestamp}, node_type: {node_type}, endpoint: {endpoint}")
+        node_type, endpoint = self.project_endpoints.get(cid_hash, ("", ""))
+        if not endpoint:
+            project_config = self.ipc_common_config.get(cid_hash, None)
+            if project_config:
+                node_type = project_config["node_type"]
+                endpoint = project_config["endpoint"]
+                self.project_endpoints[cid_hash] = (node_type, endpoint)
+
+        block_height = await self.block_height_service.get(endpoint, node_type)
+        if block_height is None:
+            # Indexer unreachable: fall back to the last known height, however old
+            block_height = self.block_height_service.last_known(endpoint)
+
+        logger.info(f"[Organic] - {body.id} cid_hash: {cid_hash}, block_height: {block_height}, node_type: {node_type}, endpoint: {endpoint}")
         synapse = OrganicNonStreamSynapse(id=body.id, cid_hash=cid_hash, block_height=block_height or 0, completion=body)
         try:
             available_miners: list[int] = []
@@ -326,8 +338,8 @@ class Validator(BaseNeuron):
                     
                     if final_synapse:
                         final_synapse.elapsed_time = final_synapse.elapsed_time or utils.fix_float(time.perf_counter() - before)
-                        if final_synapse.status_code == 200 and len(self.organic_score_queue) < 1000:
-                            self.organic_score_queue.append((
+                        if final_synapse.status_code == 200:
+                            self.organic_score_queue.put((
                                 miner_uid,
                                 final_synapse.hotkey or self.settings.metagraph.axons[miner_uid].hotkey,
                                 {
@@ -347,7 +359,8 @@ class Validator(BaseNeuron):
                                         "status_code": final_synapse.dendrite.status_code,
                                         "status_message": final_synapse.dendrite.status_message,
                                     }
-                                }
+                                },
+                                time.time(),
                             ))
                         else:
                             logger.warning(f"[Organic-Stream] - {body.id} Not adding to queue. status_code={final_synapse.status_code}, response={final_synapse.response}")
@@ -381,10 +394,9 @@ class Validator(BaseNeuron):
                 response.status_code = response.dendrite.status_code if response.dendrite is not None else ErrorCode.ORGANIC_ERROR_RESPONSE.value
                 response.error = response.dendrite.status_message if response.dendrite is not None else "Unknown error from dendrite"
 
-            if len(self.organic_score_queue) < 1000:
-                logger.info(f"[Organic] - {body.id} organic_score_queue size: {len(self.organic_score_queue)}, is_success: {response.is_success}")
-                if response.is_success and response.status_code == ErrorCode.SUCCESS.value:
-                    self.organic_score_queue.append((miner_uid, axons.hotkey, response.dict()))
+            logger.info(f"[Organic] - {body.id} organic_score_queue size: {len(self.organic_score_queue)}, is_success: {response.is_success}")
+            if response.is_success and response.status_code == ErrorCode.SUCCESS.value:
+                self.organic_score_queue.put((miner_uid, axons.hotkey, response.dict(), time.time()))
             table_formatter.create_organic_challenge_table(
                 id=body.id,
                 cid=cid_hash,
@@ -400,13 +412,14 @@ class Validator(BaseNeuron):
             return synapse
 
 def run_challenge(
-        organic_score_queue: list,
+        organic_score_queue: SharedRingBuffer,
         ipc_synthetic_score: list,
         ipc_miners_dict: dict,
         ipc_synthetic_token_usage: list,
         ipc_meta_config: dict,
         ipc_common_config: dict,
-        event_stop: Event
+        event_stop: Event,
+        ipc_block_heights: dict | None = None,
 ):
     proc = mp.current_process()
     HermesLogger.configure_loguru(
@@ -423,7 +436,8 @@ def run_challenge(
             ipc_synthetic_token_usage,
             ipc_meta_config,
             ipc_common_config,
-            event_stop
+            event_stop,
+            ipc_block_heights,
         ))
     except KeyboardInterrupt:
         logger.info("Challenge process received shutdown signal, exiting gracefully...")
@@ -432,13 +446,14 @@ def run_challenge(
         raise
 
 def run_api(
-        organic_score_queue: list,
+        organic_score_queue: SharedRingBuffer,
         ipc_miners_dict: dict,
         ipc_synthetic_score: list,
         ipc_synthetic_token_usage: list,
         ipc_meta_config: dict,
         ipc_common_config: dict,
-        event_stop: Event
+        event_stop: Event,
+        ipc_block_heights: dict | None = None,
     ):
     proc = mp.current_process()
     HermesLogger.configure_loguru(
@@ -455,7 +470,8 @@ def run_api(
             ipc_synthetic_token_usage,
             ipc_common_config=ipc_common_config,
             ipc_meta_config=ipc_meta_config,
-            event_stop=event_stop
+            event_stop=event_stop,
+            ipc_block_heights=ipc_block_heights,
         ))
     except KeyboardInterrupt:
         logger.info("API process received shutdown signal, exiting gracefully...")
@@ -480,14 +496,20 @@ def run_miner_checking(ipc_miners_dict: dict, event_stop: Event):
         raise
 
 async def main():
+    # Organic responses from the API process waiting for organic scoring in the challenge process
+    organic_score_queue = SharedRingBuffer.create(
+        capacity=int(os.getenv("ORGANIC_QUEUE_BYTES", 32 * 1024 * 1024)),
+        max_records=int(os.getenv("ORGANIC_QUEUE_SIZE", 1000)),
+        policy=os.getenv("ORGANIC_QUEUE_POLICY", DROP_NEWEST),  # or drop_oldest
+    )
     with mp.Manager() as manager:
         try:
-            organic_score_queue = manager.list([])
             ipc_miners_dict = manager.dict({})
             ipc_synthetic_score = manager.list([{}, {}])
             ipc_synthetic_token_usage = manager.list([])
             ipc_meta_config = manager.dict({})
             ipc_common_config = manager.dict({})
+            ipc_block_heights = manager.dict({})  # endpoint -> (block_height, fetched_at)
 
             processes: list[mp.Process] = []
             event_stop = mp.Event()
@@ -501,7 +523,8 @@ async def main():
                     ipc_synthetic_token_usage,
                     ipc_meta_config,
                     ipc_common_config,
-                    event_stop
+                    event_stop,
+                    ipc_block_heights,
                 ),
                 name="ChallengeProcess",
                 daemon=False,
@@ -518,7 +541,8 @@ async def main():
                     ipc_synthetic_token_usage,
                     ipc_meta_config,
                     ipc_common_config,
-                    event_stop
+                    event_stop,
+                    ipc_block_heights,
                 ),
                 name="APIProcess",
                 daemon=True,
@@ -667,7 +691,8 @@ async def main():
                 if p.is_alive():
                     p.terminate()
                 p.join(timeout=1)
-                
+
+            organic_score_queue.close()
             utils.kill_process_group()
 
 if __name__ == "__main__":
@@ -0,0 +1,109 @@
+import argparse
+import random
+import statistics
+import time
+import numpy as np
+from loguru import logger
+
+import common.utils as utils
+from hermes.validator.ema import EMAUpdater
+
+
+class DictEMAUpdater:
+    """The previous dict-based EMA update, kept as the baseline."""
+
+    def __init__(self, alpha=0.5):
+        self.alpha = alpha
+        self.last_scores = {}
+
+    def update(self, cur_uids, cur_hotkeys, cur_scores, suspicious_uids, alpha=None):
+        cur_dict_score = dict(zip(cur_uids, cur_scores))
+        cur_dict_hotkeys = dict(zip(cur_uids, cur_hotkeys))
+        new_scores = {}
+        alpha = alpha if alpha is not None else self.alpha
+        for uid in set(self.last_scores.keys()) | set(cur_dict_score.keys()):
+            last_val, last_hk = self.last_scores.get(uid, (None, None))
+            cur_val = cur_dict_score.get(uid, None)
+            if last_val is None and cur_val is not None:
+                last_val = cur_val
+            elif last_val is not None and cur_val is None:
+                cur_val = 0
+            cur_hk = cur_dict_hotkeys.get(uid, None)
+            if cur_hk and last_hk and cur_hk != last_hk:
+                last_val = cur_val
+            if suspicious_uids and uid in suspicious_uids:
+                last_val = 0
+                cur_val = 0
+            new_scores[uid] = (utils.fix_float((1 - alpha) * last_val + alpha * cur_val), cur_hk)
+        self.last_scores = new_scores
+        return new_scores
+
+
+def build_rounds(uids: int, rounds: int, seed: int) -> list[tuple[list[int], list[str], list[float], list[int]]]:
+    """Rounds with some uids missing, some hotkeys replaced and a few suspicious uids."""
+    rng = random.Random(seed)
+    hotkeys = [f"5Hotkey{uid:05d}" for uid in range(uids)]
+    result = []
+    for r in range(rounds):
+        for uid in rng.sample(range(uids), max(1, uids // 100)):
+            hotkeys[uid] = f"5Hotkey{uid:05d}r{r}"
+        cur_uids = [uid for uid in range(uids) if rng.random() > 0.05]
+        result.append((
+            cur_uids,
+            [hotkeys[uid] for uid in cur_uids],
+            [round(rng.uniform(0, 30), 2) for _ in cur_uids],
+            rng.sample(range(uids), max(1, uids // 200)),
+        ))
+    return result
+
+
+def run(updater, rounds, submit) -> list[float]:
+    """Seconds per round: EMA update plus what weight submission reads back."""
+    timings = []
+    for cur_uids, cur_hotkeys, cur_scores, suspicious_uids in rounds:
+        start = time.perf_counter()
+        updater.update(cur_uids, cur_hotkeys, cur_scores, suspicious_uids)
+        submit(updater)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def submit_dict(updater: DictEMAUpdater):
+    # Former ChallengeManager._prepare_scores_for_submission + _set_weights conversion
+    sorted_scores = sorted(updater.last_scores.items(), key=lambda item: item[0])
+    uids = [uid for uid, _ in sorted_scores]
+    scores = [score for _, (score, _) in sorted_scores]
+    return np.array(uids, dtype=np.int64), np.array(scores, dtype=np.float32)
+
+
+def submit_table(updater: EMAUpdater):
+    uids, scores = updater.arrays()
+    return uids, np.array(scores, dtype=np.float32)
+
+
+# python -m scripts.benchmark_ema --uids 256 4096
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the dict-based and uid-indexed EMA updates")
+    parser.add_argument("--uids", type=int, nargs="+", default=[256, 4096])
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    # Hotkey-change lines would dominate the timings
+    logger.disable("hermes.validator.ema")
+
+    for uids in args.uids:
+        rounds = build_rounds(uids, args.rounds, args.seed)
+
+        baseline = DictEMAUpdater()
+        table = EMAUpdater()
+        dict_timings = run(baseline, rounds, submit_dict)
+        table_timings = run(table, rounds, submit_table)
+        if baseline.last_scores != table.last_scores:
+            logger.error(f"uids={uids}: table and dict EMA disagree")
+
+        dict_ms = statistics.median(dict_timings) * 1000
+        table_ms = statistics.median(table_timings) * 1000
+        logger.info(
+            f"uids={uids:>5}  dict: {dict_ms:8.3f} ms/round  table: {table_ms:8.3f} ms/round  "
+            f"speedup: {dict_ms / table_ms:5.1f}x"
+        )
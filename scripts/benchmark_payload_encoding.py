@@ -0,0 +1,116 @@
+import argparse
+import base64
+import json
+import random
+import statistics
+import time
+import msgpack
+from loguru import logger
+
+from hermes.validator import benchmark_encoding
+
+
+def build_challenge(miners: int, answer_size: int, tool_calls: int) -> dict:
+    """One synthetic challenge entry shaped like BenchMark.upload's benchmark_data."""
+    tool_call = json.dumps({"name": "graphql_query", "args": {"query": "{ transfers(first: 10) { nodes { id amount } } }"}})
+    words = ["block", "transfer", "account", "amount", "total", "height", "event", "pool"]
+    return {
+        "uid": 1,
+        "address": "5Validator",
+        "version": "1.0.0",
+        "cid": "QmBench",
+        "challengeType": 1,
+        "challengeId": "bench",
+        "projectPhase": 2,
+        "question": "How many transfers happened in the last 100 blocks?",
+        "questionGeneratorModelName": "bench-model",
+        "questionGeneratorMetrics": None,
+        "groundTruthModelName": "bench-model",
+        "scoreModelName": "bench-model",
+        "groundTruth": "There were 42 transfers.",
+        "groundTruthCost": 12.0,
+        "groundTruthTools": [],
+        "groundInputTokens": 1000,
+        "groundInputCacheReadTokens": 0,
+        "groundOutputTokens": 200,
+        "blockHeight": "123456",
+        "minersAnswer": [
+            {
+                "uid": uid,
+                "address": f"5Miner{uid:04d}",
+                "minerModelName": "miner-model",
+                "graphqlAgentModelName": "agent-model",
+                "elapsed": round(random.uniform(1, 30), 3),
+                "truthScore": float(random.randint(0, 10)),
+                "truthScoreError": "",
+                "truthScoreRaw": "",
+                "statusCode": 200,
+                "error": None,
+                "answer": " ".join(random.choices(words, k=answer_size // 7)),
+                "inputTokens": 1200,
+                "inputCacheReadTokens": 300,
+                "outputTokens": 450,
+                "forwardStartTime": time.time(),
+                "recvStartTime": time.time(),
+                "toolCalls": [],
+                "toolCallsRaw": [tool_call] * tool_calls,
+                "graphqlAgentInnerToolCalls": [],
+                "graphqlAgentInnerToolCallsRaw": [tool_call] * tool_calls,
+            }
+            for uid in range(miners)
+        ],
+    }
+
+
+def encode(batch: list[dict], encoding: str, compression: str) -> tuple[int, str]:
+    """Mirror BenchMark.upload normalization, _flush_cid and _post_batch up to the base64 string; returns size and method used."""
+    data = [benchmark_encoding.normalize_in_place(entry) for entry in batch]
+    if encoding == benchmark_encoding.ENCODING_COLUMNAR:
+        data = [
+            {
+                **entry,
+                "minersAnswer": benchmark_encoding.to_columnar(entry["minersAnswer"]),
+                "minersAnswerEncoding": benchmark_encoding.ENCODING_COLUMNAR,
+            }
+            for entry in data
+        ]
+
+    b = msgpack.packb({"data": data, "timestamp": int(time.time())}, use_bin_type=True, strict_types=True)
+    b, used = benchmark_encoding.compress(b, compression)
+    return len(base64.b64encode(b)), used
+
+
+def bench(miners: int, rounds: int, answer_size: int, tool_calls: int):
+    batch = [build_challenge(miners, answer_size, tool_calls)]
+    variants = [
+        (benchmark_encoding.ENCODING_ROWS, benchmark_encoding.COMPRESSION_NONE),
+        (benchmark_encoding.ENCODING_COLUMNAR, benchmark_encoding.COMPRESSION_NONE),
+        (benchmark_encoding.ENCODING_COLUMNAR, benchmark_encoding.COMPRESSION_GZIP),
+        (benchmark_encoding.ENCODING_COLUMNAR, benchmark_encoding.COMPRESSION_ZSTD),
+    ]
+    baseline = None
+    for encoding, compression in variants:
+        timings = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            size, used = encode(batch, encoding, compression)
+            timings.append(time.perf_counter() - start)
+        baseline = baseline or size
+        logger.info(
+            f"miners={miners:>5} {encoding:>8}+{used:<4}: {size / 1024:8.1f} KiB "
+            f"({size / baseline:5.1%}), encode={statistics.median(timings) * 1000:6.1f}ms"
+        )
+
+
+# python -m scripts.benchmark_payload_encoding --miners 256 1024
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark payload size and encode time: rows vs columnar (+compression)")
+    parser.add_argument("--miners", type=int, nargs="+", default=[256, 1024])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--answer-size", type=int, default=2000, help="characters per miner answer")
+    parser.add_argument("--tool-calls", type=int, default=5)
+    args = parser.parse_args()
+
+    random.seed(0)
+    for miners in args.miners:
+        bench(miners, args.rounds, args.answer_size, args.tool_calls)
@@ -0,0 +1,91 @@
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+from uuid import uuid4
+import bittensor as bt
+import dotenv
+from aiohttp import web
+from loguru import logger
+
+from common.settings import Settings
+from hermes.validator.multiprocess_query import QueryWorkerPool, query_miners_multiprocess
+
+dotenv.load_dotenv('.env.validator')
+
+
+def start_fake_axon(port: int, delay: float) -> threading.Thread:
+    """Serve a minimal SyntheticNonStreamSynapse endpoint on a background thread."""
+    async def handle(request: web.Request):
+        await asyncio.sleep(delay)
+        return web.json_response({"response": "ok", "status_code": 200})
+
+    def serve():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        app = web.Application()
+        app.router.add_post("/SyntheticNonStreamSynapse", handle)
+        runner = web.AppRunner(app, access_log=None)
+        loop.run_until_complete(runner.setup())
+        loop.run_until_complete(web.TCPSite(runner, "127.0.0.1", port).start())
+        loop.run_forever()
+
+    t = threading.Thread(target=serve, daemon=True)
+    t.start()
+    return t
+
+
+def build_miners(count: int, port: int, hotkey: str):
+    axon = bt.AxonInfo(
+        version=1, ip="127.0.0.1", port=port, ip_type=4, hotkey=hotkey, coldkey=hotkey
+    ).to_string()
+    uids = list(range(1, count + 1))
+    return uids, [hotkey] * count, [axon] * count, [""] * count
+
+
+async def bench(rounds: int, miners: int, port: int, delay: float):
+    settings = Settings()
+    processes = min(settings.cpu_count, 8)
+    uids, hotkeys, axons, ips = build_miners(miners, port, settings.wallet.hotkey.ss58_address)
+    query_args = dict(
+        uids=uids, hotkeys=hotkeys, axons=axons, ips=ips, seen_ips={},
+        cid_hash="bench", question="bench", block_height=0, timeout=30,
+    )
+
+    spawn_latencies = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        await query_miners_multiprocess(challenge_id=str(uuid4()), settings=settings, **query_args)
+        spawn_latencies.append(time.perf_counter() - start)
+
+    pool = QueryWorkerPool(size=processes)
+    pool_latencies = []
+    try:
+        for _ in range(rounds):
+            start = time.perf_counter()
+            await pool.query_miners(challenge_id=str(uuid4()), **query_args)
+            pool_latencies.append(time.perf_counter() - start)
+    finally:
+        pool.close()
+
+    logger.info(f"miners={miners}, processes={processes}, rounds={rounds}, axon delay={delay}s")
+    for name, latencies in (("spawn-per-challenge", spawn_latencies), ("warm pool", pool_latencies)):
+        logger.info(
+            f"{name:>20}: first={latencies[0]:.3f}s, "
+            f"mean={statistics.mean(latencies):.3f}s, "
+            f"median={statistics.median(latencies):.3f}s"
+        )
+
+
+# python -m scripts.benchmark_query_pool --rounds 5 --miners 256
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Broadcast latency: warm query pool vs spawn-per-challenge")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--miners", type=int, default=256)
+    parser.add_argument("--port", type=int, default=18091)
+    parser.add_argument("--delay", type=float, default=0.05, help="simulated miner answer time in seconds")
+    args = parser.parse_args()
+
+    start_fake_axon(args.port, args.delay)
+    asyncio.run(bench(args.rounds, args.miners, args.port, args.delay))
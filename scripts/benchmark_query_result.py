@@ -0,0 +1,78 @@
+import argparse
+import json
+import pickle
+import statistics
+import time
+import bittensor as bt
+from loguru import logger
+
+from common.protocol import SyntheticNonStreamSynapse
+from hermes.validator.query_result import CompactQueryResult
+
+
+def build_response(uid: int, answer_size: int, tool_calls: int) -> SyntheticNonStreamSynapse:
+    """A realistic miner answer: long text, usage info and raw tool call traces."""
+    r = SyntheticNonStreamSynapse(
+        id="bench", uid=uid, cid_hash="QmBench", question="How many transfers happened?", block_height=1
+    )
+    tool_call = json.dumps({"name": "graphql_query", "args": {"query": "{ transfers { nodes { id } } }" * 8}})
+    r.response = "x" * answer_size
+    r.status_code = 200
+    r.elapsed_time = 1.23
+    r.forward_start_time = time.time()
+    r.recv_start_time = time.time()
+    r.miner_model_name = "bench-model"
+    r.graphql_agent_model_name = "bench-agent"
+    r.usage_info = {
+        "input_tokens": 1200,
+        "input_cache_read_tokens": 300,
+        "output_tokens": 450,
+        "tool_calls": [tool_call] * tool_calls,
+    }
+    r.graphql_agent_inner_tool_calls = [tool_call] * tool_calls
+    r.dendrite = bt.TerminalInfo(status_code=200, status_message="Success")
+    return r
+
+
+def measure(fn, rounds: int) -> float:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def bench(miners: int, rounds: int, answer_size: int, tool_calls: int):
+    responses = [build_response(uid, answer_size, tool_calls) for uid in range(miners)]
+
+    def full_roundtrip():
+        pickle.loads(pickle.dumps(responses))
+
+    def compact_roundtrip():
+        packed = [CompactQueryResult.from_synapse(r).pack() for r in responses]
+        [CompactQueryResult.unpack(p) for p in pickle.loads(pickle.dumps(packed))]
+
+    full_bytes = len(pickle.dumps(responses))
+    compact_bytes = len(pickle.dumps([CompactQueryResult.from_synapse(r).pack() for r in responses]))
+    full_time = measure(full_roundtrip, rounds)
+    compact_time = measure(compact_roundtrip, rounds)
+
+    logger.info(
+        f"miners={miners:>5}: synapse pickle={full_time * 1000:.1f}ms/{full_bytes / 1024:.0f}KiB, "
+        f"compact={compact_time * 1000:.1f}ms/{compact_bytes / 1024:.0f}KiB, "
+        f"speedup={full_time / compact_time:.2f}x"
+    )
+
+
+# python -m scripts.benchmark_query_result --miners 256 1024
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="IPC cost: pickled synapses vs compact msgpack records")
+    parser.add_argument("--miners", type=int, nargs="+", default=[256, 1024])
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--answer-size", type=int, default=8000, help="characters per miner answer")
+    parser.add_argument("--tool-calls", type=int, default=10)
+    args = parser.parse_args()
+
+    for miners in args.miners:
+        bench(miners, args.rounds, args.answer_size, args.tool_calls)
@@ -0,0 +1,163 @@
+import argparse
+from collections import defaultdict
+import random
+import statistics
+import threading
+import time
+import numpy as np
+from loguru import logger
+
+import common.utils as utils
+from hermes.validator.workload_counter import WorkloadCounter, compute_workload_scores
+
+
+class BucketCounter:
+    """The previous per-uid dict of hourly buckets, kept as the baseline (with `now` for replay)."""
+
+    def __init__(self, uid: int, hotkey: str, window_hours=3):
+        self.uid = uid
+        self.hotkey = hotkey
+        self.bucket_seconds = 3600
+        self.window_buckets = window_hours
+        self.buckets = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def tick(self, hotkey: str, now: int) -> int:
+        bucket_id = now // self.bucket_seconds
+        with self._lock:
+            if hotkey != self.hotkey:
+                self.buckets = defaultdict(int)
+                self.hotkey = hotkey
+            self.buckets[bucket_id] += 1
+            return self.buckets[bucket_id]
+
+    def count(self, hotkey: str | None, now: int):
+        current_bucket = now // self.bucket_seconds
+        total = 0
+        with self._lock:
+            if hotkey and hotkey != self.hotkey:
+                self.buckets = defaultdict(int)
+                self.hotkey = hotkey
+            for i in range(self.window_buckets):
+                total += self.buckets.get(current_bucket - i, 0)
+        return total
+
+    def cleanup(self, now: int):
+        min_bucket = (now // self.bucket_seconds) - self.window_buckets
+        with self._lock:
+            self.buckets = defaultdict(int, {k: v for k, v in self.buckets.items() if k >= min_bucket})
+
+
+def dict_workload_scores(counters: dict[int, BucketCounter], uids, hotkeys, quality_scores, window, now):
+    """Former WorkloadManager.purge + compute_workload_score loop."""
+    for uid in uids:
+        if uid in counters:
+            counters[uid].cleanup(now)
+    workload_counts = []
+    for uid, hotkey in zip(uids, hotkeys):
+        if uid not in counters:
+            counters[uid] = BucketCounter(uid, hotkey, window)
+        workload_counts.append(counters[uid].count(hotkey, now))
+
+    min_workload = min(workload_counts) if workload_counts else 0
+    max_workload = max(workload_counts) if workload_counts else 1
+    scores = [0.0] * len(uids)
+    for idx, uid in enumerate(uids):
+        uid_quality_scores = quality_scores.get(uid, [])
+        if not uid_quality_scores:
+            quality_ema = 0.0
+        else:
+            quality_ema = None
+            for score in uid_quality_scores:
+                quality_ema = score if quality_ema is None else 0.7 * score + 0.3 * quality_ema
+        if max_workload == min_workload:
+            normalized_workload = 0 if min_workload == 0 else 0.5
+        else:
+            normalized_workload = (workload_counts[idx] - min_workload) / (max_workload - min_workload)
+        scores[idx] = utils.fix_float(min(0.5 * quality_ema + 0.5 * normalized_workload, 5))
+    return scores, workload_counts
+
+
+def table_workload_scores(counter: WorkloadCounter, uids, hotkeys, quality_scores, now):
+    workload_counts = counter.counts(uids, hotkeys, now)
+    scores = compute_workload_scores(workload_counts, [quality_scores.get(uid, []) for uid in uids])
+    return scores.tolist(), workload_counts.tolist()
+
+
+def build_traffic(uids: int, hours: int, ticks_per_hour: int, seed: int):
+    """Per hour: organic ticks (skewed towards a few busy miners) and the hotkeys at scoring time."""
+    rng = random.Random(seed)
+    hotkeys = [f"5Hotkey{uid:05d}" for uid in range(uids)]
+    weights = [1 / (uid + 1) for uid in range(uids)]
+    result = []
+    for hour in range(hours):
+        for uid in rng.sample(range(uids), max(1, uids // 500)):
+            hotkeys[uid] = f"5Hotkey{uid:05d}h{hour}"
+        ticks = [(uid, hotkeys[uid]) for uid in rng.choices(range(uids), weights, k=ticks_per_hour)]
+        result.append((ticks, list(hotkeys)))
+    return result
+
+
+# python -m scripts.benchmark_workload --uids 4096 --windows 24 168
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the dict-based and array-backed workload counters")
+    parser.add_argument("--uids", type=int, default=4096)
+    parser.add_argument("--windows", type=int, nargs="+", default=[24, 168], help="window sizes in hours")
+    parser.add_argument("--ticks-per-hour", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    uid_list = list(range(args.uids))
+    quality_scores = {
+        uid: [round(rng.uniform(0, 5), 2) for _ in range(rng.randint(0, 20))]
+        for uid in uid_list
+    }
+    start_time = 1_750_000_000
+
+    for window in args.windows:
+        # Run past one full window so the ring wraps and old buckets expire
+        traffic = build_traffic(args.uids, window + 24, args.ticks_per_hour, args.seed)
+        counters: dict[int, BucketCounter] = {}
+        table = WorkloadCounter(window_hours=window)
+        dict_tick, table_tick, dict_score, table_score = [], [], [], []
+        mismatches = 0
+
+        for hour, (ticks, hotkeys) in enumerate(traffic):
+            now = start_time + hour * 3600
+
+            begin = time.perf_counter()
+            for uid, hotkey in ticks:
+                if uid not in counters:
+                    counters[uid] = BucketCounter(uid, hotkey, window)
+                counters[uid].tick(hotkey, now)
+            dict_tick.append((time.perf_counter() - begin) / len(ticks))
+
+            begin = time.perf_counter()
+            for uid, hotkey in ticks:
+                table.tick(uid, hotkey, now)
+            table_tick.append((time.perf_counter() - begin) / len(ticks))
+
+            begin = time.perf_counter()
+            expected = dict_workload_scores(counters, uid_list, hotkeys, quality_scores, window, now)
+            dict_score.append(time.perf_counter() - begin)
+
+            begin = time.perf_counter()
+            actual = table_workload_scores(table, uid_list, hotkeys, quality_scores, now)
+            table_score.append(time.perf_counter() - begin)
+            mismatches += expected != actual
+
+        if mismatches:
+            logger.error(f"window={window}h: table and dict workload scores disagree in {mismatches} hours")
+        state_buckets = sum(len(data["buckets"]) for data in table.to_state(now).values())
+
+        dict_tick_us = statistics.median(dict_tick) * 1e6
+        table_tick_us = statistics.median(table_tick) * 1e6
+        dict_ms = statistics.median(dict_score) * 1000
+        table_ms = statistics.median(table_score) * 1000
+        logger.info(
+            f"uids={args.uids} window={window:>3}h  "
+            f"tick dict: {dict_tick_us:6.2f} us  table: {table_tick_us:6.2f} us  |  "
+            f"score dict: {dict_ms:8.2f} ms  table: {table_ms:7.2f} ms  speedup: {dict_ms / table_ms:5.1f}x  |  "
+            f"persisted buckets: {state_buckets}"
+        )
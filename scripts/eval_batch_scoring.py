@@ -0,0 +1,92 @@
+import argparse
+import asyncio
+import os
+from pathlib import Path
+import statistics
+import dotenv
+from langchain_openai import ChatOpenAI
+from loguru import logger
+
+from common import utils
+from common.protocol import SyntheticNonStreamSynapse
+from hermes.validator.scorer_manager import ScorerManager
+from scripts.eval_fast_scorer import load_challenges
+
+dotenv.load_dotenv('.env.validator')
+
+
+def score_value(result: tuple[str, str]) -> float:
+    return min(utils.fix_float(utils.safe_float_convert(result[0])), 10.0)
+
+
+async def evaluate(challenges: list[dict], scorer: ScorerManager, batch_size: int, agree_within: float, show: int):
+    """Score every recorded answer one by one and in batches of `batch_size`, then compare."""
+    errors = []
+    disagreements = []
+
+    for challenge in challenges:
+        ground_truth = challenge.get("groundTruth") or ""
+        synapses = [
+            SyntheticNonStreamSynapse(uid=answer.get("uid"), response=answer.get("answer") or "", status_code=200)
+            for answer in challenge.get("minersAnswer") or []
+            # Codex answers carry their queries and are always scored one by one
+            if answer.get("statusCode") == 200 and answer.get("answer") and "## Queries" not in answer["answer"]
+        ]
+        if len(synapses) < 2 or not ground_truth:
+            continue
+
+        single = await asyncio.gather(*[scorer.cal_ground_truth_score(ground_truth, s) for s in synapses])
+        batched = []
+        for start in range(0, len(synapses), batch_size):
+            batched.extend(await scorer.cal_ground_truth_scores_batch(ground_truth, synapses[start:start + batch_size]))
+
+        for synapse, one, many in zip(synapses, single, batched):
+            error = abs(score_value(one) - score_value(many))
+            errors.append(error)
+            if error > agree_within:
+                disagreements.append((challenge.get("challengeId"), synapse, score_value(one), score_value(many), ground_truth))
+
+    if not errors:
+        logger.warning("No challenges with at least two scoreable answers found")
+        return
+
+    agreed = sum(e <= agree_within for e in errors)
+    logger.info(
+        f"answers: {len(errors)}, batch size {batch_size}: agrees with per-answer scoring (±{agree_within}): "
+        f"{agreed} ({agreed / len(errors):.1%}), mean abs difference {statistics.mean(errors):.2f}, max {max(errors):.2f}"
+    )
+    for challenge_id, synapse, one, many, ground_truth in disagreements[:show]:
+        logger.info(
+            f"[{challenge_id}] uid {synapse.uid}: per-answer {one} vs batched {many}\n"
+            f"  ground truth: {ground_truth.strip()[:300]}\n  answer: {synapse.response.strip()[:300]}"
+        )
+
+
+# python -m scripts.eval_batch_scoring .data/benchmark_spool --batch-size 8
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare batched and per-answer LLM scores before enabling SCORE_BATCH_SIZE")
+    parser.add_argument("path", type=Path, help="spool directory, or a .msgpack/.json/.jsonl file of recorded challenges")
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--agree-within", type=float, default=1.0, help="max score difference counted as agreement")
+    parser.add_argument("--limit", type=int, default=50, help="challenges to score, 0 for all")
+    parser.add_argument("--show", type=int, default=20, help="disagreements to print")
+    args = parser.parse_args()
+
+    score_model_args = {}
+    if os.getenv("SCORE_LLM_MODEL_BASE_URL"):
+        score_model_args["base_url"] = os.getenv("SCORE_LLM_MODEL_BASE_URL")
+    if os.getenv("SCORE_LLM_MODEL_API_KEY"):
+        score_model_args["api_key"] = os.getenv("SCORE_LLM_MODEL_API_KEY")
+    llm_score = ChatOpenAI(
+        model=os.getenv("SCORE_LLM_MODEL", "google/gemini-3-flash-preview"),
+        temperature=0,
+        timeout=int(os.getenv("SCORE_TIMEOUT", 60)),
+        max_retries=3,
+        **score_model_args,
+    )
+
+    challenges = load_challenges(args.path)
+    if args.limit:
+        challenges = challenges[:args.limit]
+    logger.info(f"Loaded {len(challenges)} recorded challenges from {args.path}, scoring with {llm_score.model_name}")
+    asyncio.run(evaluate(challenges, ScorerManager(llm_score=llm_score), max(1, args.batch_size), args.agree_within, args.show))
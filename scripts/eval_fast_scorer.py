@@ -0,0 +1,101 @@
+import argparse
+from collections import Counter
+import json
+from pathlib import Path
+import msgpack
+from loguru import logger
+
+from hermes.validator import benchmark_encoding
+from hermes.validator.fast_scorer import CONTRADICTION, MATCH, FastScorer
+
+
+def load_challenges(path: Path) -> list[dict]:
+    """
+    Recorded challenges shaped like BenchMark.upload's benchmark_data, from
+    benchmark spool segments (*.msgpack), JSON arrays or JSON lines.
+    """
+    files = sorted(path.glob("*.msgpack")) + sorted(path.glob("*.json*")) if path.is_dir() else [path]
+    challenges = []
+    for file in files:
+        if file.suffix == ".msgpack":
+            with open(file, "rb") as f:
+                for typ, data_batch in msgpack.unpackb(f.read(), raw=False):
+                    if typ == "challenge":
+                        challenges.extend(data_batch)
+        elif file.suffix == ".jsonl":
+            with open(file) as f:
+                challenges.extend(json.loads(line) for line in f if line.strip())
+        else:
+            with open(file) as f:
+                data = json.load(f)
+            challenges.extend(data if isinstance(data, list) else [data])
+
+    for challenge in challenges:
+        if challenge.get("minersAnswerEncoding") == benchmark_encoding.ENCODING_COLUMNAR:
+            challenge["minersAnswer"] = benchmark_encoding.from_columnar(challenge["minersAnswer"])
+    return challenges
+
+
+def evaluate(challenges: list[dict], scorer: FastScorer, agree_within: float, show: int):
+    decisions = Counter()
+    agreed = Counter()
+    abs_errors = []
+    disagreements = []
+
+    for challenge in challenges:
+        ground_truth = challenge.get("groundTruth") or ""
+        for answer in challenge.get("minersAnswer") or []:
+            text = answer.get("answer") or ""
+            # Only answers the LLM actually graded; codex answers carry their queries and are never fast-scored
+            if answer.get("statusCode") != 200 or answer.get("truthScoreError") or not text or "## Queries" in text:
+                continue
+
+            llm_score = float(answer.get("truthScore") or 0)
+            fast_score = scorer.score(ground_truth, text)
+            if fast_score is None:
+                decisions["llm"] += 1
+                continue
+
+            decisions[fast_score.decision] += 1
+            error = abs(fast_score.score - llm_score)
+            abs_errors.append(error)
+            if error <= agree_within:
+                agreed[fast_score.decision] += 1
+            else:
+                disagreements.append((challenge.get("challengeId"), fast_score, llm_score, ground_truth, text))
+
+    total = sum(decisions.values())
+    if not total:
+        logger.warning("No scored answers found")
+        return
+
+    decided = decisions[MATCH] + decisions[CONTRADICTION]
+    logger.info(f"answers: {total}, decided without LLM: {decided} ({decided / total:.1%}), left to LLM: {decisions['llm']}")
+    for decision in (MATCH, CONTRADICTION):
+        if decisions[decision]:
+            logger.info(
+                f"{decision:>13}: {decisions[decision]:>6}, agrees with LLM (±{agree_within}): "
+                f"{agreed[decision]} ({agreed[decision] / decisions[decision]:.1%})"
+            )
+    if abs_errors:
+        logger.info(f"mean abs error on decided answers: {sum(abs_errors) / len(abs_errors):.2f}")
+
+    for challenge_id, fast_score, llm_score, ground_truth, text in disagreements[:show]:
+        logger.info(
+            f"[{challenge_id}] {fast_score.decision} {fast_score.score} vs LLM {llm_score}\n"
+            f"  ground truth: {ground_truth.strip()[:300]}\n  answer: {text.strip()[:300]}"
+        )
+
+
+# python -m scripts.eval_fast_scorer .data/benchmark_spool
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare fast-path scoring decisions with recorded LLM scores")
+    parser.add_argument("path", type=Path, help="spool directory, or a .msgpack/.json/.jsonl file of recorded challenges")
+    parser.add_argument("--agree-within", type=float, default=2.0, help="max score difference counted as agreement")
+    parser.add_argument("--tolerance", type=float, default=0.01, help="relative tolerance for close numbers")
+    parser.add_argument("--show", type=int, default=20, help="disagreements to print")
+    args = parser.parse_args()
+
+    challenges = load_challenges(args.path)
+    logger.info(f"Loaded {len(challenges)} recorded challenges from {args.path}")
+    evaluate(challenges, FastScorer(tolerance=args.tolerance), args.agree_within, args.show)
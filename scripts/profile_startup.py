@@ -0,0 +1,146 @@
+"""
+Import-time breakdown of each validator/miner process, from `python -X importtime`.
+
+Every process is profiled in a fresh interpreter importing what that process
+loads at startup. Spawned query workers re-import `neurons.validator` as their
+main module, so it must stay light. `check` lists the modules a process must
+never load at startup, so tests can catch an eager import coming back:
+
+    profile = profile_process("QueryWorker")
+    assert not check(profile)
+"""
+import argparse
+from collections import Counter
+from dataclasses import dataclass, field
+import os
+from pathlib import Path
+import re
+import subprocess
+import sys
+import tempfile
+from loguru import logger
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Modules each process has loaded once it is ready to start working
+PROCESSES: dict[str, list[str]] = {
+    "validator": ["neurons.validator"],
+    "ChallengeProcess": ["neurons.validator", "hermes.validator.challenge_manager"],
+    "APIProcess": ["neurons.validator", "uvicorn", "hermes.validator.api"],
+    "MinerCheckingProcess": ["neurons.validator"],
+    "QueryWorker": ["neurons.validator", "hermes.validator.multiprocess_query"],
+    "miner": ["neurons.miner"],
+}
+
+_AGENT_STACK = ["langchain", "langchain_core", "langchain_openai", "langgraph", "agent"]
+# Packages a process must not import at startup
+FORBIDDEN: dict[str, list[str]] = {
+    "validator": ["torch", *_AGENT_STACK],
+    "ChallengeProcess": ["torch"],
+    "APIProcess": ["torch", *_AGENT_STACK],
+    "MinerCheckingProcess": ["torch", *_AGENT_STACK],
+    "QueryWorker": ["torch", *_AGENT_STACK],
+    "miner": ["torch"],
+}
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+@dataclass
+class ImportProfile:
+    process: str
+    modules: dict[str, tuple[int, int]] = field(default_factory=dict)  # name -> (self us, cumulative us)
+    total_us: int = 0  # cumulative time of the top-level imports
+    error: str | None = None
+
+    def by_package(self) -> Counter:
+        """Self time in us per top-level package."""
+        packages = Counter()
+        for name, (self_us, _) in self.modules.items():
+            packages[name.split(".")[0]] += self_us
+        return packages
+
+    def loaded(self, packages: list[str]) -> list[str]:
+        """Modules of `packages` that were imported."""
+        return sorted(
+            name for name in self.modules
+            if any(name == p or name.startswith(p + ".") for p in packages)
+        )
+
+
+def _run_importtime(code: str, timeout: float) -> tuple[int, str]:
+    env = dict(os.environ)
+    # Neuron modules configure file logging at import, keep it out of the repo
+    env.setdefault("LOGGER_DIR", tempfile.mkdtemp(prefix="hermes-startup-"))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+    )
+    return proc.returncode, proc.stderr
+
+
+def _parse(stderr: str, profile: ImportProfile, skip: set[str]):
+    for line in stderr.splitlines():
+        m = _LINE.match(line)
+        if not m or m.group(4) in skip:
+            continue
+        self_us, cumulative_us, indent, name = int(m.group(1)), int(m.group(2)), m.group(3), m.group(4)
+        profile.modules[name] = (self_us, cumulative_us)
+        if len(indent) == 1:  # one space after the bar marks a top-level import
+            profile.total_us += cumulative_us
+
+
+def profile_process(process: str, modules: list[str] | None = None, timeout: float = 300) -> ImportProfile:
+    """Import profile of `process` (a PROCESSES key), or of `modules` under that name."""
+    modules = modules if modules is not None else PROCESSES[process]
+    profile = ImportProfile(process)
+
+    # Modules the bare interpreter loads anyway
+    _, baseline = _run_importtime("pass", timeout)
+    skip = {m.group(4) for m in map(_LINE.match, baseline.splitlines()) if m}
+
+    returncode, stderr = _run_importtime("; ".join(f"import {module}" for module in modules), timeout)
+    _parse(stderr, profile, skip)
+    if returncode != 0:
+        profile.error = "\n".join(line for line in stderr.splitlines() if not line.startswith("import time:"))[-2000:]
+    return profile
+
+
+def check(profile: ImportProfile, budget_ms: float | None = None, forbidden: list[str] | None = None) -> list[str]:
+    """Problems found in `profile`: import errors, forbidden packages, time over budget."""
+    problems = []
+    if profile.error:
+        problems.append(f"{profile.process}: import failed\n{profile.error}")
+    forbidden = forbidden if forbidden is not None else FORBIDDEN.get(profile.process, [])
+    loaded = profile.loaded(forbidden)
+    if loaded:
+        problems.append(f"{profile.process}: imports {', '.join(loaded[:10])}{' ...' if len(loaded) > 10 else ''}")
+    if budget_ms is not None and profile.total_us / 1000 > budget_ms:
+        problems.append(f"{profile.process}: imports take {profile.total_us / 1000:.0f} ms, budget {budget_ms:.0f} ms")
+    return problems
+
+
+# python -m scripts.profile_startup --process QueryWorker APIProcess --budget-ms 3000
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import-time breakdown per validator/miner process")
+    parser.add_argument("--process", nargs="+", choices=list(PROCESSES), default=list(PROCESSES))
+    parser.add_argument("--top", type=int, default=10, help="packages to list per process")
+    parser.add_argument("--budget-ms", type=float, default=None, help="fail when a process' imports take longer")
+    args = parser.parse_args()
+
+    problems = []
+    for process in args.process:
+        profile = profile_process(process)
+        logger.info(f"{process}: {profile.total_us / 1000:.0f} ms, {len(profile.modules)} modules")
+        for package, self_us in profile.by_package().most_common(args.top):
+            logger.info(f"  {package:<28} {self_us / 1000:8.1f} ms")
+        problems.extend(check(profile, args.budget_ms))
+
+    for problem in problems:
+        logger.error(problem)
+    sys.exit(1 if problems else 0)
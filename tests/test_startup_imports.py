@@ -0,0 +1,12 @@
+import pytest
+
+from scripts.profile_startup import PROCESSES, check, profile_process
+
+
+# Each process is imported in a fresh interpreter, so an eager import of torch or
+# the agent stack slipping back into a light process fails here
+@pytest.mark.parametrize("process", list(PROCESSES))
+def test_startup_imports(process: str):
+    profile = profile_process(process)
+    problems = check(profile)
+    assert not problems, "\n".join(problems)